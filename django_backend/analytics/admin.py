@@ -2,7 +2,7 @@ from django.contrib import admin
 from django.template.response import TemplateResponse
 from django.urls import path
 
-from .models import AnalyticsEvent
+from .models import AnalyticsEvent, SearchQueryStat, TrendingScore
 from .views import (
     build_anonymous_popularity_summary,
     build_logged_in_document_activity_summary,
@@ -53,3 +53,18 @@ class AnalyticsEventAdmin(admin.ModelAdmin):
             "logged_in_documents_summary": logged_in_documents_summary,
         }
         return TemplateResponse(request, "admin/analytics/analyticsevent/insights.html", context)
+
+
+@admin.register(TrendingScore)
+class TrendingScoreAdmin(admin.ModelAdmin):
+    list_display = ("id", "kind", "object_id", "log_score", "updated_at")
+    list_filter = ("kind",)
+    ordering = ("kind", "-log_score")
+
+
+@admin.register(SearchQueryStat)
+class SearchQueryStatAdmin(admin.ModelAdmin):
+    list_display = ("id", "query", "day", "count", "zero_result_count", "updated_at")
+    list_filter = ("day",)
+    search_fields = ("query",)
+    ordering = ("-day", "-count")
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from analytics.recommendations import rebuild_related_products
+
+
+class Command(BaseCommand):
+    help = "Rebuild the co-viewed related products table from recent product_detail_view events."
+
+    def handle(self, *args, **options):
+        result = rebuild_related_products()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stored {result['links']} links for {result['products']} products ({result['changed']} changed)."
+            )
+        )
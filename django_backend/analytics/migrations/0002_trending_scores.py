@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-10-19 06:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TrendingScore",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("kind", models.CharField(choices=[("product", "Product"), ("document", "Document")], max_length=16)),
+                ("object_id", models.PositiveBigIntegerField()),
+                ("log_score", models.FloatField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "analytics_trending_scores",
+                "indexes": [models.Index(fields=["kind", "-log_score"], name="trending_kind_score_idx")],
+                "constraints": [models.UniqueConstraint(fields=("kind", "object_id"), name="uniq_trending_kind_object")],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-19 06:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0002_trending_scores"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchQueryStat",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("query", models.CharField(max_length=200)),
+                ("day", models.DateField()),
+                ("count", models.PositiveIntegerField(default=0)),
+                ("zero_result_count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "analytics_search_query_stats",
+                "indexes": [models.Index(fields=["day"], name="search_query_day_idx")],
+                "constraints": [models.UniqueConstraint(fields=("query", "day"), name="uniq_search_query_day")],
+            },
+        ),
+    ]
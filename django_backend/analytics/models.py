@@ -66,3 +66,57 @@ class AnalyticsEvent(models.Model):
 
     def __str__(self):
         return f"{self.event_name} @ {self.event_time.isoformat()}"
+
+
+class TrendingScore(models.Model):
+    """Exponentially decayed popularity per product/document, kept as a forward-decay log score.
+
+    `log_score` is ln(sum(weight * 2 ** ((t - epoch) / half_life))) over all events, so ordering
+    by it equals ordering by the decayed score at any moment and each event is a single upsert.
+    """
+
+    KIND_PRODUCT = "product"
+    KIND_DOCUMENT = "document"
+    KIND_CHOICES = [
+        (KIND_PRODUCT, "Product"),
+        (KIND_DOCUMENT, "Document"),
+    ]
+
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    log_score = models.FloatField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "analytics_trending_scores"
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="uniq_trending_kind_object"),
+        ]
+        indexes = [
+            models.Index(fields=["kind", "-log_score"], name="trending_kind_score_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.object_id}"
+
+
+class SearchQueryStat(models.Model):
+    """Daily /api/search totals per normalized query, flushed in aggregate from per-worker counters."""
+
+    query = models.CharField(max_length=200)
+    day = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+    zero_result_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "analytics_search_query_stats"
+        constraints = [
+            models.UniqueConstraint(fields=["query", "day"], name="uniq_search_query_day"),
+        ]
+        indexes = [
+            models.Index(fields=["day"], name="search_query_day_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.query} @ {self.day.isoformat()}"
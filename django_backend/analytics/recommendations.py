@@ -0,0 +1,123 @@
+import heapq
+import math
+from collections import defaultdict
+from datetime import timedelta
+from itertools import combinations
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from common.revalidation import queue_revalidation
+from products.cache import invalidate_product_details
+from products.models import Product, RelatedProduct
+
+from .models import AnalyticsEvent
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+    sparse = None
+
+
+def collect_view_baskets(window_days):
+    """Sets of product ids viewed together, one per session (or visitor when the session is blank)."""
+    since = timezone.now() - timedelta(days=window_days)
+    rows = (
+        AnalyticsEvent.objects.filter(event_name=AnalyticsEvent.EVENT_PRODUCT_DETAIL_VIEW, event_time__gte=since)
+        .values_list("session_id", "anon_id", "properties__product_id")
+        .iterator(chunk_size=5000)
+    )
+    baskets = defaultdict(set)
+    for session_id, anon_id, raw_product_id in rows:
+        try:
+            product_id = int(raw_product_id)
+        except (TypeError, ValueError):
+            continue
+        baskets[session_id or anon_id].add(product_id)
+    # A single view carries no co-occurrence signal.
+    return [basket for basket in baskets.values() if len(basket) > 1]
+
+
+def _neighbors_sparse(baskets, top_k):
+    product_ids = sorted({product_id for basket in baskets for product_id in basket})
+    column = {product_id: index for index, product_id in enumerate(product_ids)}
+    rows, cols = [], []
+    for row, basket in enumerate(baskets):
+        for product_id in basket:
+            rows.append(row)
+            cols.append(column[product_id])
+    views = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+        shape=(len(baskets), len(product_ids)),
+    )
+    co_views = (views.T @ views).tocsr()
+    counts = co_views.diagonal()
+    co_views.setdiag(0)
+    co_views.eliminate_zeros()
+
+    neighbors = {}
+    for index, product_id in enumerate(product_ids):
+        start, end = co_views.indptr[index], co_views.indptr[index + 1]
+        if start == end:
+            continue
+        others = co_views.indices[start:end]
+        # Cosine similarity keeps universally popular products from dominating every list.
+        scores = co_views.data[start:end] / np.sqrt(counts[index] * counts[others])
+        best = np.argsort(-scores, kind="stable")[:top_k]
+        neighbors[product_id] = [(product_ids[others[i]], float(scores[i])) for i in best]
+    return neighbors
+
+
+def _neighbors_python(baskets, top_k):
+    counts = defaultdict(int)
+    pairs = defaultdict(int)
+    for basket in baskets:
+        for product_id in basket:
+            counts[product_id] += 1
+        for left, right in combinations(sorted(basket), 2):
+            pairs[(left, right)] += 1
+
+    scored = defaultdict(list)
+    for (left, right), together in pairs.items():
+        score = together / math.sqrt(counts[left] * counts[right])
+        scored[left].append((score, right))
+        scored[right].append((score, left))
+    return {
+        product_id: [(other, score) for score, other in heapq.nlargest(top_k, candidates, key=lambda item: (item[0], -item[1]))]
+        for product_id, candidates in scored.items()
+    }
+
+
+def build_co_view_neighbors(baskets, top_k):
+    """{product_id: [(related_id, score), ...]} ranked by cosine-normalised co-view counts."""
+    if not baskets:
+        return {}
+    if sparse is not None:
+        return _neighbors_sparse(baskets, top_k)
+    return _neighbors_python(baskets, top_k)
+
+
+def rebuild_related_products():
+    top_k = settings.RELATED_PRODUCTS_TOP_K
+    neighbors = build_co_view_neighbors(collect_view_baskets(settings.RELATED_PRODUCTS_WINDOW_DAYS), top_k)
+    existing_ids = set(Product.objects.values_list("id", flat=True))
+    links = [
+        RelatedProduct(product_id=product_id, related_id=related_id, score=round(score, 6), rank=rank)
+        for product_id, ranked in neighbors.items()
+        if product_id in existing_ids
+        for rank, (related_id, score) in enumerate((item for item in ranked if item[0] in existing_ids), start=1)
+    ]
+
+    with transaction.atomic():
+        previous = set(RelatedProduct.objects.values_list("product_id", "related_id", "score", "rank"))
+        current = {(link.product_id, link.related_id, link.score, link.rank) for link in links}
+        changed_ids = {row[0] for row in previous ^ current}
+        if changed_ids:
+            RelatedProduct.objects.all().delete()
+            RelatedProduct.objects.bulk_create(links, batch_size=1000)
+            transaction.on_commit(lambda: invalidate_product_details(changed_ids))
+            queue_revalidation(*(f"product:{product_id}" for product_id in changed_ids))
+    return {"products": len(neighbors), "links": len(links), "changed": len(changed_ids)}
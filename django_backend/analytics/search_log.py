@@ -0,0 +1,131 @@
+import atexit
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q, Sum
+from django.utils import timezone
+
+from .models import SearchQueryStat
+
+logger = logging.getLogger(__name__)
+
+MAX_LOGGED_QUERY_LENGTH = 200
+
+
+class SearchQueryCounter:
+    """Per-worker {(query, day): [count, zero_result_count]} drained by `flush_search_queries`."""
+
+    def __init__(self):
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def record(self, query, zero_results):
+        """Count one search; returns True once the pending batch is due for a flush."""
+        key = (query, timezone.localdate())
+        with self._lock:
+            counts = self._pending.setdefault(key, [0, 0])
+            counts[0] += 1
+            if zero_results:
+                counts[1] += 1
+            return (
+                len(self._pending) >= settings.SEARCH_QUERY_LOG_MAX_PENDING
+                or time.monotonic() - self._last_flush >= settings.SEARCH_QUERY_LOG_FLUSH_SECONDS
+            )
+
+    def drain(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        return pending
+
+    def restore(self, pending):
+        """Merge a drained batch back in, e.g. after its flush failed."""
+        with self._lock:
+            for key, (count, zero) in pending.items():
+                counts = self._pending.setdefault(key, [0, 0])
+                counts[0] += count
+                counts[1] += zero
+
+
+search_query_counter = SearchQueryCounter()
+_flush_lock = threading.Lock()
+
+
+def flush_search_queries():
+    """Upsert this worker's pending counts (one row per query and day); returns the number of rows written."""
+    pending = search_query_counter.drain()
+    if not pending:
+        return 0
+
+    table = SearchQueryStat._meta.db_table
+    now = timezone.now()
+    try:
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"""
+                INSERT INTO {table} (query, day, count, zero_result_count, updated_at)
+                VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (query, day) DO UPDATE SET
+                    count = {table}.count + EXCLUDED.count,
+                    zero_result_count = {table}.zero_result_count + EXCLUDED.zero_result_count,
+                    updated_at = EXCLUDED.updated_at
+                """,
+                # Sorted so concurrent flushes from several workers lock rows in the same order.
+                [(query, day, count, zero, now) for (query, day), (count, zero) in sorted(pending.items())],
+            )
+    except Exception:
+        # Keep the counts for the next flush instead of dropping the batch.
+        search_query_counter.restore(pending)
+        raise
+    return len(pending)
+
+
+def popular_search_queries(days=None, limit=None, zero_results=False):
+    """[(query, searches), ...] over the last `days`, most searched first; zero-result searches only if asked."""
+    days = days or settings.SEARCH_POPULAR_QUERY_DAYS
+    limit = limit or settings.SEARCH_WARM_QUERY_COUNT
+    total = Sum("zero_result_count") if zero_results else Sum("count")
+    rows = (
+        SearchQueryStat.objects.filter(day__gte=timezone.localdate() - timedelta(days=days - 1))
+        .filter(Q(zero_result_count__gt=0) if zero_results else Q())
+        .values("query")
+        .annotate(total=total)
+        .order_by("-total", "query")[:limit]
+    )
+    return [(row["query"], row["total"]) for row in rows]
+
+
+def _flush_and_warm():
+    try:
+        flush_search_queries()
+        # Imported here: common.views records queries through this module.
+        from common.views import warm_search_caches
+
+        warm_search_caches([query for query, _ in popular_search_queries()])
+    except Exception:
+        logger.warning("Could not flush search query counts", exc_info=True)
+    finally:
+        connection.close()
+        _flush_lock.release()
+
+
+def record_search_query(query, zero_results):
+    """Count a search in memory; the first request past the flush interval writes the batch off-thread."""
+    if not settings.SEARCH_QUERY_LOG_ENABLED:
+        return
+    due = search_query_counter.record(query[:MAX_LOGGED_QUERY_LENGTH], zero_results)
+    if due and _flush_lock.acquire(blocking=False):
+        threading.Thread(target=_flush_and_warm, name="search-query-flush", daemon=True).start()
+
+
+@atexit.register
+def _flush_on_exit():
+    try:
+        flush_search_queries()
+    except Exception:
+        logger.warning("Could not flush search query counts on exit", exc_info=True)
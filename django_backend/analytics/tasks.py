@@ -0,0 +1,30 @@
+from django.conf import settings
+
+from .recommendations import rebuild_related_products
+from .search_log import popular_search_queries
+
+
+try:
+    from celery import shared_task
+
+    @shared_task
+    def rebuild_related_products_task():
+        return {"status": "rebuilt", **rebuild_related_products()}
+
+    @shared_task
+    def warm_search_suggestions_task():
+        from common.views import warm_search_suggestions
+
+        queries = [query for query, _ in popular_search_queries()]
+        # Kept until the next run so popular prefixes never fall out of the shared cache between runs.
+        timeout = max(settings.SEARCH_WARM_SECONDS, settings.SEARCH_SUGGEST_CACHE_TIMEOUT)
+        warmed = warm_search_suggestions(queries, timeout=timeout)
+        return {"status": "warmed", "queries": len(queries), "prefixes": warmed}
+
+except Exception:
+    # Celery may not be installed in local setup yet. Keep module importable.
+    def rebuild_related_products_task(*args, **kwargs):  # type: ignore[no-redef]
+        raise RuntimeError("Celery is not installed/configured. Install celery and run a worker.")
+
+    def warm_search_suggestions_task(*args, **kwargs):  # type: ignore[no-redef]
+        raise RuntimeError("Celery is not installed/configured. Install celery and run a worker.")
@@ -0,0 +1,146 @@
+import logging
+import math
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+from products.models import Product, ProductCatalogue
+
+from .models import AnalyticsEvent, TrendingScore
+
+logger = logging.getLogger(__name__)
+
+# Fixed origin for forward decay. Changing it (or the half-life) requires clearing the table.
+TRENDING_EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+# object_id is a bigint column; larger client-supplied ids would fail the whole upsert.
+MAX_TRENDING_OBJECT_ID = 2**63 - 1
+
+TRENDING_PRODUCT_EVENT_WEIGHTS = {
+    AnalyticsEvent.EVENT_PRODUCT_CLICK: 0.5,
+    AnalyticsEvent.EVENT_PRODUCT_DETAIL_VIEW: 1.0,
+    AnalyticsEvent.EVENT_REQUEST_QUOTE_CLICK: 4.0,
+}
+# Direct downloads are counted by the download view itself (see record_document_downloads).
+TRENDING_DOCUMENT_EVENT_WEIGHTS = {
+    AnalyticsEvent.EVENT_DOCUMENT_EMAIL_REQUEST_SUBMIT: 2.0,
+}
+
+
+def _decay_rate():
+    return math.log(2) / (settings.TRENDING_HALF_LIFE_HOURS * 3600)
+
+
+def _log_weight(weight, at):
+    # Events are stamped with server time so clients cannot boost scores with future timestamps.
+    return math.log(weight) + (at - TRENDING_EPOCH).total_seconds() * _decay_rate()
+
+
+def _log_add(left, right):
+    high, low = max(left, right), min(left, right)
+    return high + math.log1p(math.exp(low - high))
+
+
+def decayed_score(log_score, now=None):
+    """The score as of `now`: each unit of weight halves every TRENDING_HALF_LIFE_HOURS."""
+    now = now or timezone.now()
+    return math.exp(log_score - (now - TRENDING_EPOCH).total_seconds() * _decay_rate())
+
+
+def record_trending(items, at=None):
+    """Add [(kind, object_id, weight), ...] to the trending store with one upsert per distinct object."""
+    at = at or timezone.now()
+    merged = {}
+    for kind, object_id, weight in items:
+        if weight <= 0 or not 0 < object_id <= MAX_TRENDING_OBJECT_ID:
+            continue
+        log_weight = _log_weight(weight, at)
+        key = (kind, object_id)
+        merged[key] = _log_add(merged[key], log_weight) if key in merged else log_weight
+    if not merged:
+        return 0
+
+    table = TrendingScore._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"""
+            INSERT INTO {table} (kind, object_id, log_score, updated_at)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (kind, object_id) DO UPDATE SET
+                log_score = GREATEST({table}.log_score, EXCLUDED.log_score)
+                    + LN(1 + EXP(LEAST({table}.log_score, EXCLUDED.log_score) - GREATEST({table}.log_score, EXCLUDED.log_score))),
+                updated_at = EXCLUDED.updated_at
+            """,
+            # Sorted so concurrent batches lock rows in the same order.
+            [(kind, object_id, log_score, at) for (kind, object_id), log_score in sorted(merged.items())],
+        )
+    return len(merged)
+
+
+def _first_in_window(event, kind, object_id, client_ip):
+    """True the first time a session, and separately a client IP, sends this event for this object in the window."""
+    prefix = f"analytics:trending-seen:{kind}:{object_id}:{event.event_name}"
+    timeout = settings.TRENDING_DEDUP_SECONDS
+    # Both keys are claimed so a later event cannot slip through on the other one.
+    first_for_session = cache.add(f"{prefix}:session:{event.session_id}", True, timeout=timeout)
+    first_for_ip = cache.add(f"{prefix}:ip:{client_ip}", True, timeout=timeout) if client_ip else True
+    return first_for_session and first_for_ip
+
+
+def visible_trending_queryset(kind):
+    """The rows a trending entry of `kind` may point at; anything else is neither scored nor listed."""
+    if kind == TrendingScore.KIND_PRODUCT:
+        return Product.objects.filter(is_visible=True)
+    return ProductCatalogue.objects.filter(is_visible=True, product__is_visible=True)
+
+
+def trending_items_for_events(events, client_ip=None):
+    candidates = []
+    ids_by_kind = {}
+    for event in events:
+        properties = event.properties or {}
+        product_weight = TRENDING_PRODUCT_EVENT_WEIGHTS.get(event.event_name)
+        document_weight = TRENDING_DOCUMENT_EVENT_WEIGHTS.get(event.event_name)
+        object_id = None
+        if product_weight:
+            kind, weight, object_id = TrendingScore.KIND_PRODUCT, product_weight, properties.get("product_id")
+        elif document_weight:
+            kind, weight, object_id = TrendingScore.KIND_DOCUMENT, document_weight, properties.get("catalogue_id")
+        try:
+            object_id = int(object_id)
+        except (TypeError, ValueError):
+            continue
+        if 0 < object_id <= MAX_TRENDING_OBJECT_ID:
+            candidates.append((event, kind, object_id, weight))
+            ids_by_kind.setdefault(kind, set()).add(object_id)
+
+    # Ids come from the client, so only those of existing, visible rows may create score rows.
+    visible_ids = {
+        kind: set(visible_trending_queryset(kind).filter(id__in=ids).values_list("id", flat=True))
+        for kind, ids in ids_by_kind.items()
+    }
+    return [
+        (kind, object_id, weight)
+        for event, kind, object_id, weight in candidates
+        if object_id in visible_ids[kind] and _first_in_window(event, kind, object_id, client_ip)
+    ]
+
+
+def record_trending_events(events, client_ip=None):
+    """Best-effort trending update for freshly ingested events; never fails the ingest request.
+
+    Repeats of an event for the same object from one session or client IP within
+    TRENDING_DEDUP_SECONDS are stored as analytics events but do not add to the score.
+    """
+    try:
+        return record_trending(trending_items_for_events(events, client_ip))
+    except Exception:
+        logger.warning("Could not update trending scores", exc_info=True)
+        return 0
+
+
+def record_document_downloads(counts):
+    """counts: {document_id: downloads} flushed from the download counters."""
+    return record_trending((TrendingScore.KIND_DOCUMENT, document_id, downloads) for document_id, downloads in counts.items())
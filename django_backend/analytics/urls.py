@@ -10,4 +10,6 @@ urlpatterns = [
         views.anonymous_popularity_summary,
         name="analytics_anonymous_popularity_summary",
     ),
+    path("api/products/trending", views.trending, name="analytics_trending"),
+    path("api/analytics/search-queries", views.search_query_summary, name="analytics_search_query_summary"),
 ]
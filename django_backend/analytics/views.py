@@ -1,16 +1,19 @@
 from datetime import timedelta
 from decimal import Decimal
 
+from django.conf import settings
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 from rest_framework import status
 from rest_framework.decorators import api_view, authentication_classes, permission_classes
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 
 from accounts.models import User
 
-from .models import AnalyticsEvent
+from .models import AnalyticsEvent, TrendingScore
+from .search_log import popular_search_queries
+from .trending import decayed_score, record_trending_events, visible_trending_queryset
 
 MAX_EVENTS_PER_BATCH = 50
 MAX_PAGE_PATH_LENGTH = 500
@@ -22,6 +25,7 @@ DEFAULT_SUMMARY_DAYS = 30
 MAX_SUMMARY_DAYS = 180
 DEFAULT_LIMIT = 10
 MAX_LIMIT = 100
+MAX_TRENDING_LIMIT = 50
 
 USER_INTEREST_WEIGHTS = {
     "nav_click_products": 1,
@@ -40,6 +44,16 @@ USER_INTEREST_WEIGHTS = {
 }
 
 
+def _get_client_ip(request):
+    # The left of X-Forwarded-For is client-controlled; only hops added by our own proxies count.
+    proxy_count = settings.TRUSTED_PROXY_COUNT
+    if proxy_count > 0:
+        hops = [hop.strip() for hop in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",") if hop.strip()]
+        if len(hops) >= proxy_count:
+            return hops[-proxy_count]
+    return request.META.get("REMOTE_ADDR")
+
+
 def _get_session_user(request):
     # Prefer Django auth user if present.
     django_user = getattr(request, "user", None)
@@ -711,6 +725,7 @@ def ingest_events(request):
         )
 
     AnalyticsEvent.objects.bulk_create(to_create, batch_size=MAX_EVENTS_PER_BATCH)
+    record_trending_events(to_create, _get_client_ip(request))
     return Response({"accepted": len(to_create)}, status=status.HTTP_201_CREATED)
 
 
@@ -739,3 +754,91 @@ def anonymous_popularity_summary(request):
         limit=request.query_params.get("limit"),
     )
     return Response(summary, status=status.HTTP_200_OK)
+
+
+def _trending_rows(kind, visible_ids, limit):
+    return list(
+        TrendingScore.objects.filter(kind=kind, object_id__in=visible_ids)
+        .order_by("-log_score", "object_id")
+        .values_list("object_id", "log_score")[:limit]
+    )
+
+
+@api_view(["GET"])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def trending(request):
+    kind = request.query_params.get("kind", TrendingScore.KIND_PRODUCT)
+    if kind not in {choice[0] for choice in TrendingScore.KIND_CHOICES}:
+        return Response({"detail": "kind must be 'product' or 'document'."}, status=status.HTTP_400_BAD_REQUEST)
+    limit = _coerce_int(request.query_params.get("limit"), DEFAULT_LIMIT, 1, MAX_TRENDING_LIMIT)
+    now = timezone.now()
+
+    if kind == TrendingScore.KIND_PRODUCT:
+        visible_qs = visible_trending_queryset(kind)
+        rows = _trending_rows(kind, visible_qs.values("id"), limit)
+        objects = visible_qs.prefetch_related("images").in_bulk([object_id for object_id, _ in rows])
+        results = []
+        for object_id, log_score in rows:
+            product = objects.get(object_id)
+            if product is None:
+                # Hidden or deleted between the score query and this one.
+                continue
+            images = list(product.images.all())
+            results.append(
+                {
+                    "id": product.id,
+                    "name": product.name,
+                    "slug": product.slug,
+                    "short_summary": product.short_summary,
+                    "image_url": request.build_absolute_uri(images[0].image.url) if images else "",
+                    "score": round(decayed_score(log_score, now), 4),
+                }
+            )
+    else:
+        visible_qs = visible_trending_queryset(kind)
+        rows = _trending_rows(kind, visible_qs.values("id"), limit)
+        objects = visible_qs.select_related("product").in_bulk([object_id for object_id, _ in rows])
+        results = []
+        for object_id, log_score in rows:
+            document = objects.get(object_id)
+            if document is None:
+                continue
+            results.append(
+                {
+                    "id": document.id,
+                    "title": document.title,
+                    "doc_type": document.doc_type,
+                    "access_type": document.access_type,
+                    "product": {
+                        "id": document.product_id,
+                        "name": document.product.name,
+                        "slug": document.product.slug,
+                    },
+                    "score": round(decayed_score(log_score, now), 4),
+                }
+            )
+
+    return Response(
+        {"kind": kind, "half_life_hours": settings.TRENDING_HALF_LIFE_HOURS, "count": len(results), "results": results},
+        status=status.HTTP_200_OK,
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def search_query_summary(request):
+    days = _coerce_int(request.query_params.get("days"), DEFAULT_SUMMARY_DAYS, 1, MAX_SUMMARY_DAYS)
+    limit = _coerce_int(request.query_params.get("limit"), DEFAULT_LIMIT, 1, MAX_LIMIT)
+    return Response(
+        {
+            "window_days": days,
+            "popular": [
+                {"query": query, "count": count} for query, count in popular_search_queries(days=days, limit=limit)
+            ],
+            "zero_results": [
+                {"query": query, "count": count}
+                for query, count in popular_search_queries(days=days, limit=limit, zero_results=True)
+            ],
+        }
+    )
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import time
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+def _initial_version():
+    # Seed from the clock so an evicted version key never restarts at a value
+    # that already stamped older cached data.
+    return int(time.time() * 1000)
+
+
+# Per-object version keys are created on first read, including for ids that do not exist, so
+# they expire instead of accumulating; a lost key just re-seeds from the clock past any stamp.
+OBJECT_VERSION_TIMEOUT = 24 * 60 * 60
+
+
+def get_cache_version(key):
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_cache_version(key, timeout=None):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = _initial_version()
+        cache.set(key, version, timeout=timeout)
+        return version
+
+
+def _object_version_key(namespace, object_id):
+    return f"{namespace}:{object_id}:version"
+
+
+def get_object_versions(namespace, object_ids):
+    keys = {object_id: _object_version_key(namespace, object_id) for object_id in object_ids}
+    stored = cache.get_many(keys.values())
+    versions = {}
+    for object_id, key in keys.items():
+        version = stored.get(key)
+        if version is None:
+            cache.add(key, _initial_version(), timeout=OBJECT_VERSION_TIMEOUT)
+            # Fall back to an unstored fresh version if the key was evicted again in between.
+            version = cache.get(key) or _initial_version()
+        versions[object_id] = version
+    return versions
+
+
+def object_cache_keys(namespace, object_ids, *parts):
+    """Map each id to a payload key stamped with its current version and any extra key parts."""
+    suffix = ":".join(str(part) for part in parts)
+    versions = get_object_versions(namespace, object_ids)
+    return {object_id: f"{namespace}:{object_id}:{version}:{suffix}" for object_id, version in versions.items()}
+
+
+def bump_object_versions(namespace, object_ids):
+    for object_id in set(object_ids):
+        bump_cache_version(_object_version_key(namespace, object_id), timeout=OBJECT_VERSION_TIMEOUT)
+
+
+def make_fragment(payload):
+    """(digest, payload) cache entry; the digest lets aggregate responses build an ETag without re-serializing."""
+    encoded = json.dumps(payload, cls=DjangoJSONEncoder, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest(), payload
+
+
+def cached_fragment(key, build_payload, timeout):
+    fragment = cache.get(key)
+    if fragment is None:
+        fragment = make_fragment(build_payload())
+        cache.set(key, fragment, timeout=timeout)
+    return fragment
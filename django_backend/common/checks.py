@@ -0,0 +1,16 @@
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Tags, Warning, register
+
+PROCESS_LOCAL_CACHES = (LocMemCache, DummyCache)
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    if not isinstance(caches["default"], PROCESS_LOCAL_CACHES):
+        return []
+    message = "The default cache is local to each process, so invalidations and counters are not shared."
+    hint = "Set CACHE_URL to a shared backend such as redis://127.0.0.1:6379/1."
+    # A warning rather than an error, so tests and one-off commands still run with locmemcache://.
+    return [Warning(message, hint=hint, id="common.W001")]
@@ -0,0 +1,115 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseRedirect, StreamingHttpResponse
+from django.utils.http import http_date, quote_etag
+
+RANGE_HEADER_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _content_disposition(filename, as_attachment):
+    disposition = "attachment" if as_attachment else "inline"
+    if not filename:
+        return disposition
+    try:
+        filename.encode("ascii")
+        return f'{disposition}; filename="{filename}"'
+    except UnicodeEncodeError:
+        return f"{disposition}; filename*=utf-8''{quote(filename)}"
+
+
+def _parse_range(range_header, size):
+    """Return (start, end) for a single satisfiable byte range, None to ignore it, or False if unsatisfiable."""
+    match = RANGE_HEADER_RE.match(range_header.strip())
+    if not match:
+        # Multi-range or malformed headers may be ignored; the full body is served.
+        return None
+    raw_start, raw_end = match.groups()
+    if not raw_start and not raw_end:
+        return None
+    if size == 0:
+        # An empty file has no byte positions, so no range can be satisfied.
+        return False
+    if not raw_start:
+        length = int(raw_end)
+        if length == 0:
+            return False
+        return max(0, size - length), size - 1
+    start = int(raw_start)
+    end = int(raw_end) if raw_end else size - 1
+    if start >= size or end < start:
+        return False
+    return start, min(end, size - 1)
+
+
+def _iter_file_range(path, start, length):
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = handle.read(min(STREAM_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _offloaded_response(name, path, content_type, disposition):
+    """Empty response telling the front server (nginx/Apache) to send the file itself."""
+    response = HttpResponse(content_type=content_type)
+    header = settings.MEDIA_SENDFILE_HEADER
+    if header.lower() == "x-accel-redirect":
+        response[header] = settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(name)
+    else:
+        response[header] = path
+    response["Content-Disposition"] = disposition
+    return response
+
+
+def serve_file(request, storage, name, *, filename=None, as_attachment=False):
+    """Send a stored file, preferring front-server offload and falling back to ranged streaming."""
+    try:
+        path = storage.path(name)
+    except NotImplementedError:
+        # Remote storages serve their own bytes (and ranges).
+        return HttpResponseRedirect(storage.url(name))
+
+    content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    disposition = _content_disposition(filename or os.path.basename(name), as_attachment)
+    if settings.MEDIA_SENDFILE_HEADER:
+        return _offloaded_response(name, path, content_type, disposition)
+
+    stat = os.stat(path)
+    size = stat.st_size
+    etag = quote_etag(f"{int(stat.st_mtime):x}-{size:x}")
+    last_modified = http_date(stat.st_mtime)
+
+    byte_range = None
+    range_header = request.META.get("HTTP_RANGE", "")
+    if_range = request.META.get("HTTP_IF_RANGE", "")
+    if range_header and (not if_range or if_range in (etag, last_modified)):
+        byte_range = _parse_range(range_header, size)
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+    elif byte_range is None:
+        # FileResponse lets the WSGI server use sendfile() for the whole body.
+        response = FileResponse(open(path, "rb"), content_type=content_type)
+        response["Content-Length"] = str(size)
+    else:
+        start, end = byte_range
+        length = end - start + 1
+        response = StreamingHttpResponse(_iter_file_range(path, start, length), status=206, content_type=content_type)
+        response["Content-Length"] = str(length)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    response["Last-Modified"] = last_modified
+    response["Content-Disposition"] = disposition
+    return response
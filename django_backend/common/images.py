@@ -0,0 +1,157 @@
+import base64
+import logging
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_WIDTHS = (320, 640, 960, 1280)
+DERIVATIVE_ROOT = "derivatives"
+PLACEHOLDER_WIDTH = 16
+# Optional per-model columns filled alongside derivatives when the model defines them.
+IMAGE_METADATA_FIELDS = ("width", "height", "placeholder")
+# Smallest-first so clients that read the list in order prefer the better codec.
+DERIVATIVE_FORMATS = (
+    ("avif", "AVIF", {"quality": 60}),
+    ("webp", "WEBP", {"quality": 80, "method": 4}),
+)
+
+
+def _supported_formats():
+    from PIL import features
+
+    supported = []
+    for extension, pil_format, save_options in DERIVATIVE_FORMATS:
+        try:
+            available = features.check(extension)
+        except Exception:
+            available = False
+        if available:
+            supported.append((extension, pil_format, save_options))
+    return supported
+
+
+def needs_derivatives(file_field, derivatives):
+    if not file_field:
+        return False
+    return (derivatives or {}).get("source") != file_field.name
+
+
+def has_image_metadata_fields(model):
+    field_names = {field.name for field in model._meta.get_fields()}
+    return all(name in field_names for name in IMAGE_METADATA_FIELDS)
+
+
+def needs_image_processing(instance, file_field_name, derivatives_field_name):
+    file_field = getattr(instance, file_field_name)
+    if needs_derivatives(file_field, getattr(instance, derivatives_field_name)):
+        return True
+    return bool(file_field) and has_image_metadata_fields(type(instance)) and instance.width is None
+
+
+def _build_placeholder(image):
+    """Tiny blurred-up preview inlined as a data URI (typically a few hundred bytes)."""
+    from PIL import Image
+
+    width, height = image.size
+    thumbnail = image.resize(
+        (PLACEHOLDER_WIDTH, max(1, round(height * PLACEHOLDER_WIDTH / width))),
+        Image.Resampling.BILINEAR,
+    )
+    buffer = BytesIO()
+    thumbnail.save(buffer, format="WEBP", quality=40)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def _target_widths(original_width):
+    widths = [width for width in DERIVATIVE_WIDTHS if width < original_width]
+    # Small originals still get one re-encoded copy at their own width.
+    return widths or [original_width]
+
+
+def _delete_derivative_files(storage, derivatives):
+    for item in (derivatives or {}).get("items", []):
+        try:
+            storage.delete(item["path"])
+        except Exception:
+            logger.warning("Could not delete image derivative %s", item.get("path"), exc_info=True)
+
+
+def process_image(file_field, previous=None):
+    """Write resized AVIF/WebP copies of `file_field`.
+
+    Returns the derivatives JSON stored on the model plus the original's width,
+    height and placeholder data URI.
+    """
+    from PIL import Image, ImageOps
+
+    storage = file_field.storage
+    _delete_derivative_files(storage, previous)
+
+    with file_field.open("rb") as source_file:
+        with Image.open(source_file) as source:
+            source = ImageOps.exif_transpose(source)
+            has_alpha = source.mode in ("RGBA", "LA") or (source.mode == "P" and "transparency" in source.info)
+            source = source.convert("RGBA" if has_alpha else "RGB")
+            original_width, original_height = source.size
+            metadata = {
+                "width": original_width,
+                "height": original_height,
+                "placeholder": _build_placeholder(source),
+            }
+
+            stem = PurePosixPath(file_field.name)
+            items = []
+            for width in _target_widths(original_width):
+                height = max(1, round(original_height * width / original_width))
+                resized = source if width == original_width else source.resize((width, height), Image.Resampling.LANCZOS)
+                for extension, pil_format, save_options in _supported_formats():
+                    buffer = BytesIO()
+                    resized.save(buffer, format=pil_format, **save_options)
+                    name = f"{DERIVATIVE_ROOT}/{stem.parent}/{stem.stem}-{width}w.{extension}"
+                    path = storage.save(name, ContentFile(buffer.getvalue()))
+                    items.append({"path": path, "width": width, "height": height, "format": extension})
+
+    return {"source": file_field.name, "items": items}, metadata
+
+
+def _enqueue_image_processing(model_label, pk, file_field_name, derivatives_field_name):
+    try:
+        from .tasks import process_uploaded_image
+
+        process_uploaded_image.delay(model_label, pk, file_field_name, derivatives_field_name)
+    except Exception:
+        logger.warning("Could not queue image processing for %s #%s", model_label, pk, exc_info=True)
+
+
+def schedule_image_processing(instance, file_field_name, derivatives_field_name):
+    if not needs_image_processing(instance, file_field_name, derivatives_field_name):
+        return
+    model_label = instance._meta.label
+    pk = instance.pk
+    transaction.on_commit(lambda: _enqueue_image_processing(model_label, pk, file_field_name, derivatives_field_name))
+
+
+def build_image_sources(request, file_field, derivatives):
+    """srcset-style list of derivative URLs for the current file, empty until processing finishes."""
+    if not file_field or (derivatives or {}).get("source") != file_field.name:
+        return []
+    storage = file_field.storage
+    return [
+        {
+            "url": request.build_absolute_uri(storage.url(item["path"])),
+            "width": item["width"],
+            "format": item["format"],
+        }
+        for item in derivatives.get("items", [])
+    ]
+
+
+def build_image_metadata(image):
+    """Width, height and placeholder of an image row; blank while a replaced file awaits processing."""
+    if not image.image or (image.derivatives or {}).get("source") != image.image.name:
+        return {"width": None, "height": None, "placeholder": ""}
+    return {"width": image.width, "height": image.height, "placeholder": image.placeholder}
@@ -0,0 +1,43 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from common.images import needs_image_processing
+
+# (model label, file field, derivatives field) for every image upload the pipeline handles.
+IMAGE_SOURCES = (
+    ("products.ProductImage", "image", "derivatives"),
+    ("products.PowerSource", "image_url", "image_derivatives"),
+    ("products.Industry", "image_url", "image_derivatives"),
+    ("content.NewsImage", "image", "derivatives"),
+    ("content.AchievementImage", "image", "derivatives"),
+)
+
+
+class Command(BaseCommand):
+    help = "Queue derivative/dimension/placeholder processing for images that do not have it yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sync", action="store_true", help="Process in this process instead of queueing.")
+
+    def handle(self, *args, **options):
+        from common.tasks import process_uploaded_image
+
+        total = 0
+        for model_label, file_field_name, derivatives_field_name in IMAGE_SOURCES:
+            model = apps.get_model(model_label)
+            queued = 0
+            qs = model.objects.exclude(**{file_field_name: ""}).order_by("pk")
+            for instance in qs.iterator(chunk_size=200):
+                if not needs_image_processing(instance, file_field_name, derivatives_field_name):
+                    continue
+                task_args = (model_label, instance.pk, file_field_name, derivatives_field_name)
+                if options["sync"]:
+                    process_uploaded_image.apply(args=task_args, throw=True)
+                else:
+                    process_uploaded_image.delay(*task_args)
+                queued += 1
+            self.stdout.write(f"{model_label}: {queued}")
+            total += queued
+
+        verb = "Processed" if options["sync"] else "Queued"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {total} images."))
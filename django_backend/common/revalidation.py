@@ -0,0 +1,63 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+# Tags sent to the frontend's revalidation endpoint:
+#   catalogue            product listings, power sources, industries
+#   product:<id>         one product detail page
+#   news, news:<id>      news index / one article (likewise achievements, achievement:<id>)
+#   announcement         the site-wide ribbon
+#   home                 sections of the landing page
+_pending = threading.local()
+
+
+def _enqueue_revalidation(tags):
+    try:
+        from .tasks import send_revalidation_webhook
+
+        send_revalidation_webhook.delay(tags)
+    except Exception:
+        logger.warning("Could not queue frontend revalidation for %s", tags, exc_info=True)
+
+
+def _dispatch_scheduled():
+    """True while the callback holding `_pending.tags` is still queued on the connection.
+
+    Django drops queued callbacks when their transaction, or the savepoint they were queued in, rolls
+    back, and empties the queue on commit. A callback can only lose its place when it is dropped itself:
+    anything queued before it sits in the same or an enclosing savepoint, so it is never shifted.
+    """
+    dispatch = getattr(_pending, "dispatch", None)
+    if dispatch is None:
+        return False
+    hooks = connection.run_on_commit
+    index = _pending.dispatch_index
+    return index < len(hooks) and hooks[index][1] is dispatch
+
+
+def queue_revalidation(*tags):
+    """Collect tags for the current transaction; one webhook task is queued for all of them after commit."""
+    if not settings.NEXTJS_REVALIDATE_URL:
+        return
+    if _dispatch_scheduled():
+        _pending.tags.update(tags)
+        return
+
+    # Nothing scheduled yet, or a rollback discarded the callback; its tags went with it. Each callback
+    # sends its own set, so one replaced while still waiting in a commit's queue loses nothing.
+    pending_tags = set(tags)
+
+    def dispatch():
+        if getattr(_pending, "dispatch", None) is dispatch:
+            _pending.tags = _pending.dispatch = None
+        if pending_tags:
+            _enqueue_revalidation(sorted(pending_tags))
+
+    _pending.tags = pending_tags
+    _pending.dispatch = dispatch
+    _pending.dispatch_index = len(connection.run_on_commit)
+    transaction.on_commit(dispatch)
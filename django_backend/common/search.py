@@ -0,0 +1,145 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity
+from django.db import connection
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.text import slugify
+
+# (source, weight) per searchable model: A = title, B = summary, C = body. A "relation__field"
+# source is read through a correlated subquery so the vector can be written with one UPDATE.
+SEARCH_VECTOR_SOURCES = {
+    "products.Product": (("name", "A"), ("short_summary", "B"), ("description", "C")),
+    "products.ProductCatalogue": (("title", "A"), ("product__name", "B"), ("description", "C")),
+    "content.News": (("title", "A"), ("summary", "B"), ("content", "C")),
+    "content.Achievement": (("title", "A"), ("summary", "B"), ("content", "C")),
+}
+# Long extracted bodies live in a separate `content_search_vector` (weight D) with its own GIN index,
+# so metadata edits never re-parse them.
+SEARCH_CONTENT_SOURCES = {
+    "products.ProductCatalogue": "content_text",
+}
+
+
+def _source_expression(model, source):
+    if "__" not in source:
+        return F(source)
+    relation, field_name = source.split("__", 1)
+    related_model = model._meta.get_field(relation).related_model
+    return Subquery(related_model._default_manager.filter(pk=OuterRef(f"{relation}_id")).values(field_name)[:1])
+
+
+def search_vector_expression(model, label=None):
+    label = label or model._meta.label
+    vector = None
+    for source, weight in SEARCH_VECTOR_SOURCES[label]:
+        part = SearchVector(_source_expression(model, source), weight=weight, config=settings.SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def search_source_fields(label):
+    return {source.split("__", 1)[0] for source, _ in SEARCH_VECTOR_SOURCES[label]}
+
+
+def update_search_vectors(queryset, label=None):
+    """Recompute `search_vector` for every row of `queryset` in a single UPDATE (no signals fire)."""
+    return queryset.update(search_vector=search_vector_expression(queryset.model, label))
+
+
+def update_content_vectors(queryset):
+    """Recompute `content_search_vector` from the extracted body text in a single UPDATE."""
+    source = SEARCH_CONTENT_SOURCES[queryset.model._meta.label]
+    return queryset.update(content_search_vector=SearchVector(source, weight="D", config=settings.SEARCH_CONFIG))
+
+
+def ranked_search(queryset, query):
+    """Filter to rows matching a websearch-style query, annotated with `rank` (ts_rank).
+
+    Models with extracted body text also match on `content_search_vector`; both ranks are summed.
+    """
+    search_query = SearchQuery(query, search_type="websearch", config=settings.SEARCH_CONFIG)
+    if queryset.model._meta.label not in SEARCH_CONTENT_SOURCES:
+        return queryset.filter(search_vector=search_query).annotate(rank=SearchRank(F("search_vector"), search_query))
+    return queryset.filter(Q(search_vector=search_query) | Q(content_search_vector=search_query)).annotate(
+        rank=Coalesce(SearchRank(F("search_vector"), search_query), 0.0)
+        + Coalesce(SearchRank(F("content_search_vector"), search_query), 0.0)
+    )
+
+
+def _safe_slug(value, fallback):
+    slug = slugify(value or "")
+    return slug or fallback
+
+
+def product_search_result(item):
+    return {
+        "id": item.id,
+        "name": item.name,
+        "slug": item.slug or _safe_slug(item.name, "product"),
+        "summary": item.short_summary or "",
+        "power_source_name": item.power_source.name if item.power_source else "",
+        "power_source_slug": item.power_source.slug if item.power_source else "",
+    }
+
+
+def news_search_result(item):
+    return {
+        "id": item.id,
+        "title": item.title,
+        "slug": item.slug or _safe_slug(item.title, "news"),
+        "summary": item.summary or "",
+        "created_at": item.created_at,
+    }
+
+
+def achievement_search_result(item):
+    return {
+        "id": item.id,
+        "title": item.title,
+        "slug": item.slug or _safe_slug(item.title, "achievement"),
+        "summary": item.summary or "",
+        "year": item.year,
+        "created_at": item.created_at,
+    }
+
+
+def document_search_result(item):
+    return {
+        "id": item.id,
+        "title": item.title,
+        "description": item.description or "",
+        "doc_type": item.doc_type,
+        "access_type": item.access_type,
+        "product_id": item.product_id,
+        "product_name": item.product.name if item.product else "",
+        "product_slug": (item.product.slug if item.product else "") or _safe_slug(
+            item.product.name if item.product else "",
+            "product",
+        ),
+    }
+
+
+def suggest_cache_key(query, limit):
+    digest = hashlib.sha1(" ".join(query.casefold().split()).encode("utf-8")).hexdigest()
+    return f"search:suggest:{limit}:{digest}"
+
+
+def apply_suggest_budget():
+    """Inside a transaction: cap statement time and set the `%>` match threshold for trigram lookups."""
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL statement_timeout = %s", [int(settings.SEARCH_SUGGEST_TIMEOUT_MS)])
+        cursor.execute("SET LOCAL pg_trgm.word_similarity_threshold = %s", [float(settings.SEARCH_SUGGEST_MIN_SIMILARITY)])
+
+
+def trigram_suggestions(queryset, field_name, query):
+    """Rows whose `field_name` contains a word-similar match for `query`, best first.
+
+    The `trigram_word_similar` lookup compiles to `%>`, which the gin_trgm_ops index serves.
+    """
+    return (
+        queryset.filter(**{f"{field_name}__trigram_word_similar": query})
+        .annotate(similarity=TrigramWordSimilarity(query, field_name))
+        .order_by("-similarity", field_name)
+    )
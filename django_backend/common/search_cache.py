@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import transaction
+
+from .cache import bump_cache_version, get_cache_version
+
+SEARCH_RESULTS_VERSION_KEY = "search:results:version"
+
+
+def normalize_query(query):
+    return " ".join((query or "").casefold().split())
+
+
+class SearchResultCache:
+    """Per-worker LRU of search results with a TTL; entries are stamped with the shared results version."""
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def __contains__(self, key):
+        # Unlike get(), leaves the hit/miss counters and LRU order alone (used when warming).
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+search_result_cache = SearchResultCache(
+    max_entries=settings.SEARCH_RESULT_CACHE_SIZE,
+    ttl=settings.SEARCH_RESULT_CACHE_TIMEOUT,
+)
+
+
+def search_result_cache_key(query, limit):
+    # Entries from before the last content change never match again and age out of the LRU.
+    return (get_cache_version(SEARCH_RESULTS_VERSION_KEY), normalize_query(query), limit)
+
+
+def invalidate_search_results():
+    transaction.on_commit(lambda: bump_cache_version(SEARCH_RESULTS_VERSION_KEY))
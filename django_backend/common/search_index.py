@@ -0,0 +1,272 @@
+import bisect
+import math
+import re
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from content.models import Achievement, News
+from products.models import Product, ProductCatalogue
+
+from .cache import bump_cache_version, get_cache_version
+from .search import (
+    SEARCH_CONTENT_SOURCES,
+    SEARCH_VECTOR_SOURCES,
+    achievement_search_result,
+    document_search_result,
+    news_search_result,
+    product_search_result,
+)
+
+SEARCH_INDEX_GENERATION_KEY = "search:index:generation"
+SEARCH_INDEX_CHANGE_PREFIX = "search:index:change"
+# Workers further behind than this (or missing a journal entry) rebuild from scratch.
+MAX_JOURNAL_REPLAY = 500
+JOURNAL_TIMEOUT = 24 * 60 * 60
+
+TOKEN_RE = re.compile(r"\w+")
+# Same relative weights Postgres ts_rank gives A/B/C labels.
+FIELD_WEIGHTS = {"A": 1.0, "B": 0.4, "C": 0.2, "D": 0.1}
+PREFIX_MATCH_WEIGHT = 0.5
+MIN_PREFIX_LENGTH = 2
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SEARCH_KINDS = {
+    "products": {
+        "label": "products.Product",
+        "queryset": lambda: Product.objects.filter(is_visible=True).select_related("power_source"),
+        "result": product_search_result,
+        "order": lambda item: (item.name,),
+    },
+    "news": {
+        "label": "content.News",
+        "queryset": lambda: News.objects.filter(is_visible=True),
+        "result": news_search_result,
+        "order": lambda item: (-item.created_at.timestamp(),),
+    },
+    "achievements": {
+        "label": "content.Achievement",
+        "queryset": lambda: Achievement.objects.filter(is_visible=True),
+        "result": achievement_search_result,
+        "order": lambda item: (-item.year, -item.created_at.timestamp()),
+    },
+    "documents": {
+        "label": "products.ProductCatalogue",
+        "queryset": lambda: ProductCatalogue.objects.filter(is_visible=True, product__is_visible=True).select_related(
+            "product"
+        ),
+        "result": document_search_result,
+        "order": lambda item: (item.title,),
+    },
+}
+KIND_BY_LABEL = {config["label"]: kind for kind, config in SEARCH_KINDS.items()}
+
+
+def tokenize(text):
+    return TOKEN_RE.findall((text or "").casefold())
+
+
+def _source_text(item, source):
+    value = item
+    for attribute in source.split("__"):
+        value = getattr(value, attribute, None) if value is not None else None
+    return value or ""
+
+
+class SearchIndex:
+    """BM25 inverted index over the visible rows of the four searchable models."""
+
+    def __init__(self):
+        self.postings = defaultdict(dict)
+        self.doc_terms = {}
+        self.doc_lengths = {}
+        self.results = {}
+        self.order_keys = {}
+        self.total_length = 0.0
+        self._vocabulary = None
+
+    @classmethod
+    def build(cls):
+        index = cls()
+        for kind, config in SEARCH_KINDS.items():
+            for item in config["queryset"]().iterator(chunk_size=500):
+                index.add(kind, item)
+        return index
+
+    def add(self, kind, item):
+        config = SEARCH_KINDS[kind]
+        key = (kind, item.pk)
+        self.remove(key)
+        terms = defaultdict(float)
+        sources = list(SEARCH_VECTOR_SOURCES[config["label"]])
+        if config["label"] in SEARCH_CONTENT_SOURCES:
+            sources.append((SEARCH_CONTENT_SOURCES[config["label"]], "D"))
+        for source, weight in sources:
+            for token in tokenize(_source_text(item, source)):
+                terms[token] += FIELD_WEIGHTS[weight]
+        for term, frequency in terms.items():
+            if term not in self.postings:
+                self._vocabulary = None
+            self.postings[term][key] = frequency
+        self.doc_terms[key] = dict(terms)
+        self.doc_lengths[key] = sum(terms.values())
+        self.total_length += self.doc_lengths[key]
+        self.results[key] = config["result"](item)
+        self.order_keys[key] = config["order"](item)
+
+    def remove(self, key):
+        terms = self.doc_terms.pop(key, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self.postings[term]
+            postings.pop(key, None)
+            if not postings:
+                del self.postings[term]
+                self._vocabulary = None
+        self.total_length -= self.doc_lengths.pop(key)
+        del self.results[key]
+        del self.order_keys[key]
+
+    def refresh(self, kind, ids):
+        ids = set(ids)
+        for object_id in ids:
+            self.remove((kind, object_id))
+        for item in SEARCH_KINDS[kind]["queryset"]().filter(pk__in=ids):
+            self.add(kind, item)
+
+    def apply_changes(self, changes):
+        ids_by_label = defaultdict(set)
+        for label, object_id in changes:
+            ids_by_label[label].add(object_id)
+
+        product_ids = ids_by_label.pop("products.Product", set())
+        power_source_ids = ids_by_label.pop("products.PowerSource", set())
+        if power_source_ids:
+            product_ids |= set(Product.objects.filter(power_source_id__in=power_source_ids).values_list("id", flat=True))
+        if product_ids:
+            self.refresh("products", product_ids)
+            # Document results carry the product name/slug and follow its visibility.
+            document_ids = set(ProductCatalogue.objects.filter(product_id__in=product_ids).values_list("id", flat=True))
+            document_ids |= {
+                key[1] for key, result in self.results.items() if key[0] == "documents" and result["product_id"] in product_ids
+            }
+            ids_by_label["products.ProductCatalogue"] |= document_ids
+
+        for label, ids in ids_by_label.items():
+            if label in KIND_BY_LABEL:
+                self.refresh(KIND_BY_LABEL[label], ids)
+
+    def _expand(self, term):
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        expansions = [(term, 1.0)] if term in self.postings else []
+        if len(term) >= MIN_PREFIX_LENGTH:
+            start = bisect.bisect_left(self._vocabulary, term)
+            for candidate in self._vocabulary[start:]:
+                if not candidate.startswith(term):
+                    break
+                if candidate != term:
+                    expansions.append((candidate, PREFIX_MATCH_WEIGHT))
+        return expansions
+
+    def _term_scores(self, term, total_docs, average_length):
+        scores = {}
+        for expansion, weight in self._expand(term):
+            postings = self.postings[expansion]
+            idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for key, frequency in postings.items():
+                length_norm = 1 - BM25_B + BM25_B * self.doc_lengths[key] / average_length
+                score = weight * idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+                # Best expansion only, so a short prefix doesn't sum over many vocabulary words.
+                if score > scores.get(key, 0.0):
+                    scores[key] = score
+        return scores
+
+    def search(self, query, limit):
+        """{kind: [result, ...]} for rows matching every query word (by prefix), ranked by BM25."""
+        included, excluded = [], []
+        for word in query.split():
+            (excluded if word.startswith("-") and len(word) > 1 else included).extend(tokenize(word.lstrip("-")))
+
+        matches = {kind: [] for kind in SEARCH_KINDS}
+        if not included or not self.doc_lengths:
+            return matches
+
+        total_docs = len(self.doc_lengths)
+        average_length = (self.total_length / total_docs) or 1.0
+        scores = None
+        for term in included:
+            term_scores = self._term_scores(term, total_docs, average_length)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {key: score + term_scores[key] for key, score in scores.items() if key in term_scores}
+            if not scores:
+                return matches
+        for term in excluded:
+            for key in self.postings.get(term, {}):
+                scores.pop(key, None)
+
+        for key in sorted(scores, key=lambda key: (-scores[key], self.order_keys[key])):
+            bucket = matches[key[0]]
+            if len(bucket) < limit:
+                bucket.append(self.results[key])
+        return matches
+
+
+_search_index = None
+_search_index_generation = None
+_search_index_lock = threading.Lock()
+
+
+def _load_journal(start, end):
+    keys = [f"{SEARCH_INDEX_CHANGE_PREFIX}:{generation}" for generation in range(start + 1, end + 1)]
+    entries = cache.get_many(keys)
+    if len(entries) != len(keys):
+        return None
+    return [tuple(entries[key]) for key in keys]
+
+
+def _current_index():
+    """Bring this worker's index up to the shared generation; caller holds the lock."""
+    global _search_index, _search_index_generation
+
+    generation = get_cache_version(SEARCH_INDEX_GENERATION_KEY)
+    if _search_index is not None and _search_index_generation == generation:
+        return _search_index
+
+    changes = None
+    if _search_index is not None and 0 < generation - _search_index_generation <= MAX_JOURNAL_REPLAY:
+        changes = _load_journal(_search_index_generation, generation)
+    if changes is None:
+        _search_index = SearchIndex.build()
+    else:
+        _search_index.apply_changes(changes)
+    _search_index_generation = generation
+    return _search_index
+
+
+def search_catalogue(query, limit):
+    with _search_index_lock:
+        return _current_index().search(query, limit)
+
+
+def _journal_search_change(label, object_id):
+    generation = bump_cache_version(SEARCH_INDEX_GENERATION_KEY)
+    cache.set(f"{SEARCH_INDEX_CHANGE_PREFIX}:{generation}", [label, object_id], timeout=JOURNAL_TIMEOUT)
+
+
+def record_search_change(label, object_id):
+    """Queue an incremental index update for every worker once the current transaction commits."""
+    if settings.SEARCH_INMEMORY_INDEX_ENABLED:
+        transaction.on_commit(lambda: _journal_search_change(label, object_id))
+
+
+def invalidate_search_index():
+    """Force a full rebuild in every worker (for writes that bypass model signals)."""
+    bump_cache_version(SEARCH_INDEX_GENERATION_KEY)
@@ -0,0 +1,91 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from content.models import Achievement, AchievementImage, AnnouncementRibbon, News, NewsImage
+from products.models import Industry, PowerSource, Product, ProductCatalogue, ProductImage, ProductIndustry
+
+from .revalidation import queue_revalidation
+from .search import search_source_fields, update_search_vectors
+from .search_cache import invalidate_search_results
+from .search_index import record_search_change
+
+SEARCHABLE_MODELS = (Product, ProductCatalogue, News, Achievement)
+
+
+def _refresh_search_vector(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & search_source_fields(sender._meta.label):
+        return
+    update_search_vectors(sender._default_manager.filter(pk=instance.pk))
+    if sender is Product:
+        # Document vectors embed the product name.
+        update_search_vectors(ProductCatalogue.objects.filter(product_id=instance.pk))
+
+
+for _model in SEARCHABLE_MODELS:
+    post_save.connect(_refresh_search_vector, sender=_model, dispatch_uid=f"common.search.save.{_model.__name__}")
+
+
+def _search_content_changed(sender, instance, **kwargs):
+    # Product results include the power source name, so PowerSource saves count too.
+    invalidate_search_results()
+    record_search_change(sender._meta.label, instance.pk)
+
+
+for _model in (*SEARCHABLE_MODELS, PowerSource):
+    post_save.connect(_search_content_changed, sender=_model, dispatch_uid=f"common.search_index.save.{_model.__name__}")
+for _model in SEARCHABLE_MODELS:
+    post_delete.connect(_search_content_changed, sender=_model, dispatch_uid=f"common.search_index.delete.{_model.__name__}")
+
+
+def _revalidation_tags(sender, instance):
+    if sender is Product:
+        return ("catalogue", f"product:{instance.pk}")
+    if sender in (ProductImage, ProductIndustry):
+        # Listing cards and filters show these too.
+        return ("catalogue", f"product:{instance.product_id}")
+    if sender is ProductCatalogue:
+        return (f"product:{instance.product_id}",)
+    if sender in (PowerSource, Industry):
+        return ("catalogue", "home")
+    if sender is News:
+        return ("news", f"news:{instance.pk}", "home")
+    if sender is NewsImage:
+        return ("news", f"news:{instance.news_id}", "home")
+    if sender is Achievement:
+        return ("achievements", f"achievement:{instance.pk}", "home")
+    if sender is AchievementImage:
+        return ("achievements", f"achievement:{instance.achievement_id}", "home")
+    return ("announcement",)
+
+
+def _frontend_content_changed(sender, instance, **kwargs):
+    queue_revalidation(*_revalidation_tags(sender, instance))
+
+
+REVALIDATED_MODELS = (
+    Product,
+    ProductImage,
+    ProductIndustry,
+    ProductCatalogue,
+    PowerSource,
+    Industry,
+    News,
+    NewsImage,
+    Achievement,
+    AchievementImage,
+    AnnouncementRibbon,
+)
+for _model in REVALIDATED_MODELS:
+    post_save.connect(_frontend_content_changed, sender=_model, dispatch_uid=f"common.revalidate.save.{_model.__name__}")
+    post_delete.connect(_frontend_content_changed, sender=_model, dispatch_uid=f"common.revalidate.delete.{_model.__name__}")
+
+
+def _product_industries_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    product_ids = (pk_set or []) if reverse else [instance.pk]
+    queue_revalidation("catalogue", *(f"product:{product_id}" for product_id in product_ids))
+
+
+m2m_changed.connect(
+    _product_industries_changed, sender=Product.industries.through, dispatch_uid="common.revalidate.m2m.industries"
+)
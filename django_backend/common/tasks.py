@@ -0,0 +1,78 @@
+import json
+import urllib.request
+
+from django.apps import apps
+from django.conf import settings
+
+from .images import IMAGE_METADATA_FIELDS, has_image_metadata_fields, needs_image_processing, process_image
+
+MAX_IMAGE_PROCESSING_RETRIES = 2
+MAX_REVALIDATION_RETRIES = 5
+
+
+def post_revalidation(tags):
+    request = urllib.request.Request(
+        settings.NEXTJS_REVALIDATE_URL,
+        data=json.dumps({"tags": tags}).encode("utf-8"),
+        headers={
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {settings.NEXTJS_REVALIDATE_SECRET}",
+        },
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=settings.NEXTJS_REVALIDATE_TIMEOUT) as response:
+        return response.status
+
+
+try:
+    from celery import shared_task
+
+    @shared_task(bind=True, max_retries=MAX_IMAGE_PROCESSING_RETRIES, default_retry_delay=30)
+    def process_uploaded_image(self, model_label: str, pk: int, file_field_name: str, derivatives_field_name: str):
+        model = apps.get_model(model_label)
+        instance = model.objects.filter(pk=pk).first()
+        if not instance:
+            return {"status": "missing", "model": model_label, "id": pk}
+
+        if not needs_image_processing(instance, file_field_name, derivatives_field_name):
+            return {"status": "up_to_date", "model": model_label, "id": pk}
+
+        try:
+            derivatives, metadata = process_image(
+                getattr(instance, file_field_name),
+                previous=getattr(instance, derivatives_field_name),
+            )
+        except Exception as exc:
+            if self.request.retries < MAX_IMAGE_PROCESSING_RETRIES:
+                raise self.retry(exc=exc)
+            raise
+
+        update_fields = [derivatives_field_name]
+        setattr(instance, derivatives_field_name, derivatives)
+        if has_image_metadata_fields(model):
+            for field_name in IMAGE_METADATA_FIELDS:
+                setattr(instance, field_name, metadata[field_name])
+            update_fields.extend(IMAGE_METADATA_FIELDS)
+
+        # save() rather than update() so post_save consumers (e.g. payload caches) see the new sources.
+        instance.save(update_fields=update_fields)
+        return {"status": "processed", "model": model_label, "id": pk, "derivatives": len(derivatives["items"])}
+
+    @shared_task(bind=True, max_retries=MAX_REVALIDATION_RETRIES)
+    def send_revalidation_webhook(self, tags):
+        if not settings.NEXTJS_REVALIDATE_URL:
+            return {"status": "disabled", "tags": tags}
+        try:
+            status = post_revalidation(tags)
+        except Exception as exc:
+            # 5s, 10s, 20s, ... so a frontend deploy does not drop the notification.
+            raise self.retry(exc=exc, countdown=5 * 2**self.request.retries)
+        return {"status": "sent", "tags": tags, "http_status": status}
+
+except Exception:
+    # Celery may not be installed in local setup yet. Keep module importable.
+    def process_uploaded_image(*args, **kwargs):  # type: ignore[no-redef]
+        raise RuntimeError("Celery is not installed/configured. Install celery and run a worker.")
+
+    def send_revalidation_webhook(*args, **kwargs):  # type: ignore[no-redef]
+        raise RuntimeError("Celery is not installed/configured. Install celery and run a worker.")
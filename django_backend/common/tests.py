@@ -1,3 +1,100 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+
+from . import revalidation
+from .files import _parse_range
+
+
+class ParseRangeTests(SimpleTestCase):
+    def test_explicit_range(self):
+        self.assertEqual(_parse_range("bytes=0-99", 1000), (0, 99))
+
+    def test_open_ended_range(self):
+        self.assertEqual(_parse_range("bytes=900-", 1000), (900, 999))
+
+    def test_end_is_clamped_to_size(self):
+        self.assertEqual(_parse_range("bytes=500-5000", 1000), (500, 999))
+
+    def test_suffix_range(self):
+        self.assertEqual(_parse_range("bytes=-100", 1000), (900, 999))
+
+    def test_suffix_longer_than_file(self):
+        self.assertEqual(_parse_range("bytes=-5000", 1000), (0, 999))
+
+    def test_zero_length_suffix_is_unsatisfiable(self):
+        self.assertIs(_parse_range("bytes=-0", 1000), False)
+
+    def test_start_past_end_of_file_is_unsatisfiable(self):
+        self.assertIs(_parse_range("bytes=1000-", 1000), False)
+
+    def test_reversed_range_is_unsatisfiable(self):
+        self.assertIs(_parse_range("bytes=50-10", 1000), False)
+
+    def test_empty_file_is_unsatisfiable(self):
+        self.assertIs(_parse_range("bytes=0-", 0), False)
+        self.assertIs(_parse_range("bytes=-10", 0), False)
+
+    def test_malformed_and_multi_range_headers_are_ignored(self):
+        self.assertIsNone(_parse_range("bytes=-", 1000))
+        self.assertIsNone(_parse_range("items=0-10", 1000))
+        self.assertIsNone(_parse_range("bytes=0-10,20-30", 1000))
+
+
+class FakeCommitHooks:
+    """The part of a connection queue_revalidation relies on: hooks run on commit and dropped on rollback."""
+
+    def __init__(self):
+        self.run_on_commit = []
+
+    def on_commit(self, func):
+        self.run_on_commit.append((set(), func, False))
+
+    def commit(self):
+        hooks, self.run_on_commit = self.run_on_commit, []
+        for _, func, _ in hooks:
+            func()
+
+    def rollback(self):
+        self.run_on_commit = []
+
+
+@override_settings(NEXTJS_REVALIDATE_URL="http://frontend.test/api/revalidate")
+class QueueRevalidationTests(SimpleTestCase):
+    def setUp(self):
+        self.hooks = FakeCommitHooks()
+        self.sent = []
+        revalidation._pending.__dict__.clear()
+        for patcher in (
+            mock.patch.object(revalidation, "connection", self.hooks),
+            mock.patch.object(revalidation.transaction, "on_commit", self.hooks.on_commit),
+            mock.patch.object(revalidation, "_enqueue_revalidation", self.sent.append),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_tags_are_coalesced_into_one_dispatch(self):
+        revalidation.queue_revalidation("catalogue", "product:1")
+        revalidation.queue_revalidation("catalogue", "product:2")
+        self.assertEqual(len(self.hooks.run_on_commit), 1)
+        self.hooks.commit()
+        self.assertEqual(self.sent, [["catalogue", "product:1", "product:2"]])
+
+    def test_rollback_then_new_write_still_dispatches(self):
+        revalidation.queue_revalidation("news:1")
+        self.hooks.rollback()
+        revalidation.queue_revalidation("news:2")
+        self.hooks.commit()
+        self.assertEqual(self.sent, [["news:2"]])
+
+    def test_write_after_commit_schedules_a_new_dispatch(self):
+        revalidation.queue_revalidation("home")
+        self.hooks.commit()
+        revalidation.queue_revalidation("announcement")
+        self.hooks.commit()
+        self.assertEqual(self.sent, [["home"], ["announcement"]])
+
+    def test_nothing_is_queued_without_a_frontend_url(self):
+        with override_settings(NEXTJS_REVALIDATE_URL=""):
+            revalidation.queue_revalidation("home")
+        self.assertEqual(self.hooks.run_on_commit, [])
@@ -4,4 +4,7 @@ from . import views
 urlpatterns = [
     path("api/healthcheck", views.healthCheck, name="healthCheck"),
     path("api/search", views.global_search, name="global_search"),
+    path("api/search/suggest", views.search_suggest, name="search_suggest"),
+    path("api/bootstrap/home", views.bootstrap_home, name="bootstrap_home"),
+    path("api/search/cache-stats", views.search_cache_stats, name="search_cache_stats"),
 ]
@@ -1,14 +1,70 @@
-from django.db import connection
-from django.db.models import Q
-from django.http import JsonResponse
+import hashlib
+import logging
+import os
+import posixpath
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import OperationalError, close_old_connections, connection, transaction
+from django.http import Http404, JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.utils.text import slugify
-from rest_framework.decorators import api_view
+from django.views.decorators.http import require_safe
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 
+from analytics.search_log import record_search_query
+from content.cache import get_announcement_fragment, get_recent_achievements_fragment, get_recent_news_fragment
 from content.models import Achievement, News
+from products.cache import get_industries_fragment, get_power_sources_fragment
 from products.models import Product, ProductCatalogue
 
+from .files import serve_file
+from .search import (
+    achievement_search_result,
+    apply_suggest_budget,
+    document_search_result,
+    news_search_result,
+    product_search_result,
+    ranked_search,
+    suggest_cache_key,
+    trigram_suggestions,
+)
+from .search_cache import normalize_query, search_result_cache, search_result_cache_key
+from .search_index import search_catalogue
+
+SUGGEST_MAX_QUERY_LENGTH = 64
+SEARCH_DEFAULT_LIMIT = 6
+SUGGEST_DEFAULT_LIMIT = 5
+HOME_UPDATES_LIMIT = 12
+
+logger = logging.getLogger(__name__)
+
+# Media folders that must go through their own access-checked views.
+PROTECTED_MEDIA_PREFIXES = ("product_catalogues/",)
+
 # Create your views here.
+@require_safe
+def serve_media(request, path):
+    name = posixpath.normpath(path).lstrip("/")
+    if name.startswith(("..", ".")) or name.startswith(PROTECTED_MEDIA_PREFIXES):
+        raise Http404("File not found.")
+    if not default_storage.exists(name):
+        raise Http404("File not found.")
+    try:
+        is_file = os.path.isfile(default_storage.path(name))
+    except NotImplementedError:
+        # Remote storages only expose files under their names.
+        is_file = True
+    if not is_file:
+        raise Http404("File not found.")
+    return serve_file(request, default_storage, name)
+
+
 def healthCheck(request):
     server_status = "ok"
     db_status = "ok"
@@ -31,6 +87,26 @@ def healthCheck(request):
     )
 
 
+@api_view(["GET"])
+def bootstrap_home(request):
+    fragments = {
+        "power_sources": get_power_sources_fragment(request),
+        "industries": get_industries_fragment(request),
+        "news": get_recent_news_fragment(request, HOME_UPDATES_LIMIT),
+        "achievements": get_recent_achievements_fragment(request, HOME_UPDATES_LIMIT),
+        "announcement": get_announcement_fragment(),
+    }
+    # The ETag comes from the fragment digests, so a revalidation hit never serializes the payloads.
+    digest = hashlib.sha1("|".join(digest for digest, _ in fragments.values()).encode("ascii")).hexdigest()
+    etag = f'"{digest}"'
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = Response({name: payload for name, (_, payload) in fragments.items()})
+    response["ETag"] = etag
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
 def _coerce_limit(raw_value, default=6, max_limit=20):
     try:
         value = int(raw_value)
@@ -44,10 +120,99 @@ def _safe_slug(value, fallback):
     return slug or fallback
 
 
+def _search_products(query, limit):
+    products_qs = ranked_search(
+        Product.objects.filter(is_visible=True).select_related("power_source"), query
+    ).order_by("-rank", "name")[:limit]
+    return [product_search_result(item) for item in products_qs]
+
+
+def _search_news(query, limit):
+    news_qs = ranked_search(News.objects.filter(is_visible=True), query).order_by("-rank", "-created_at")[:limit]
+    return [news_search_result(item) for item in news_qs]
+
+
+def _search_achievements(query, limit):
+    achievements_qs = ranked_search(Achievement.objects.filter(is_visible=True), query).order_by(
+        "-rank", "-year", "-created_at"
+    )[:limit]
+    return [achievement_search_result(item) for item in achievements_qs]
+
+
+def _search_documents(query, limit):
+    documents_qs = ranked_search(
+        ProductCatalogue.objects.filter(is_visible=True, product__is_visible=True)
+        .select_related("product")
+        .defer("content_text"),
+        query,
+    ).order_by("-rank", "title")[:limit]
+    return [document_search_result(item) for item in documents_qs]
+
+
+SEARCH_SUBQUERIES = {
+    "products": _search_products,
+    "news": _search_news,
+    "achievements": _search_achievements,
+    "documents": _search_documents,
+}
+
+_search_executor = None
+_search_executor_lock = threading.Lock()
+
+
+def _get_search_executor():
+    global _search_executor
+    with _search_executor_lock:
+        if _search_executor is None:
+            _search_executor = ThreadPoolExecutor(
+                max_workers=settings.SEARCH_PARALLEL_WORKERS, thread_name_prefix="global-search"
+            )
+        return _search_executor
+
+
+def _run_pooled_subquery(search, query, limit):
+    # Pool threads keep their own DB connection; apply CONN_MAX_AGE/health checks around each use.
+    close_old_connections()
+    try:
+        return search(query, limit)
+    finally:
+        close_old_connections()
+
+
+def _search_database(query, limit):
+    # Pool threads use other connections and cannot see this connection's uncommitted writes.
+    if not settings.SEARCH_PARALLEL_QUERIES or connection.in_atomic_block:
+        return {kind: search(query, limit) for kind, search in SEARCH_SUBQUERIES.items()}
+
+    executor = _get_search_executor()
+    futures = {
+        kind: executor.submit(_run_pooled_subquery, search, query, limit) for kind, search in SEARCH_SUBQUERIES.items()
+    }
+    return {kind: future.result() for kind, future in futures.items()}
+
+
+def _compute_search_results(query, limit):
+    if settings.SEARCH_INMEMORY_INDEX_ENABLED:
+        return search_catalogue(normalize_query(query), limit)
+    return _search_database(normalize_query(query), limit)
+
+
+def warm_search_caches(queries, limit=SEARCH_DEFAULT_LIMIT):
+    """Fill this worker's result cache for `queries` (e.g. the popular ones); returns how many were computed."""
+    warmed = 0
+    for query in queries:
+        cache_key = search_result_cache_key(query, limit)
+        if cache_key in search_result_cache:
+            continue
+        search_result_cache.set(cache_key, _compute_search_results(query, limit))
+        warmed += 1
+    return warmed
+
+
 @api_view(["GET"])
 def global_search(request):
     query = (request.GET.get("q") or "").strip()
-    limit = _coerce_limit(request.GET.get("limit"), default=6, max_limit=20)
+    limit = _coerce_limit(request.GET.get("limit"), default=SEARCH_DEFAULT_LIMIT, max_limit=20)
 
     if len(query) < 2:
         return Response(
@@ -58,117 +223,114 @@ def global_search(request):
             }
         )
 
-    products_qs = (
-        Product.objects.filter(is_visible=True)
-        .select_related("power_source")
-        .filter(
-            Q(name__icontains=query)
-            | Q(short_summary__icontains=query)
-            | Q(description__icontains=query)
-        )
-        .order_by("name")[:limit]
-    )
+    cache_key = search_result_cache_key(query, limit)
+    results = search_result_cache.get(cache_key)
+    if results is None:
+        results = _compute_search_results(query, limit)
+        search_result_cache.set(cache_key, results)
+    record_search_query(normalize_query(query), zero_results=not any(results.values()))
 
-    news_qs = (
-        News.objects.filter(is_visible=True)
-        .filter(
-            Q(title__icontains=query)
-            | Q(summary__icontains=query)
-            | Q(content__icontains=query)
-        )
-        .order_by("-created_at")[:limit]
-    )
+    counts = {kind: len(items) for kind, items in results.items()}
+    counts["total"] = counts["products"] + counts["news"] + counts["documents"]
 
-    achievements_qs = (
-        Achievement.objects.filter(is_visible=True)
-        .filter(
-            Q(title__icontains=query)
-            | Q(summary__icontains=query)
-            | Q(content__icontains=query)
-        )
-        .order_by("-year", "-created_at")[:limit]
+    return Response(
+        {
+            "query": query,
+            "counts": counts,
+            "results": results,
+        }
     )
 
-    documents_qs = (
-        ProductCatalogue.objects.filter(is_visible=True, product__is_visible=True)
-        .select_related("product")
-        .filter(
-            Q(title__icontains=query)
-            | Q(description__icontains=query)
-            | Q(product__name__icontains=query)
-        )
-        .order_by("title")[:limit]
-    )
 
-    products = [
-        {
-            "id": item.id,
-            "name": item.name,
-            "slug": item.slug or _safe_slug(item.name, "product"),
-            "summary": item.short_summary or "",
-            "power_source_name": item.power_source.name if item.power_source else "",
-            "power_source_slug": item.power_source.slug if item.power_source else "",
-        }
-        for item in products_qs
-    ]
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def search_cache_stats(request):
+    # Counters are per worker process.
+    return Response(search_result_cache.stats())
 
-    news = [
-        {
-            "id": item.id,
-            "title": item.title,
-            "slug": item.slug or _safe_slug(item.title, "news"),
-            "summary": item.summary or "",
-            "created_at": item.created_at,
-        }
-        for item in news_qs
-    ]
 
-    achievements = [
-        {
-            "id": item.id,
-            "title": item.title,
-            "slug": item.slug or _safe_slug(item.title, "achievement"),
-            "summary": item.summary or "",
-            "year": item.year,
-            "created_at": item.created_at,
+def _build_suggestions(query, limit):
+    with transaction.atomic():
+        apply_suggest_budget()
+        products = trigram_suggestions(Product.objects.filter(is_visible=True), "name", query).values(
+            "id", "name", "slug", "similarity"
+        )[:limit]
+        documents = trigram_suggestions(
+            ProductCatalogue.objects.filter(is_visible=True, product__is_visible=True), "title", query
+        ).values("id", "title", "doc_type", "product_id", "product__slug", "similarity")[:limit]
+        news = trigram_suggestions(News.objects.filter(is_visible=True), "title", query).values(
+            "id", "title", "slug", "similarity"
+        )[:limit]
+        return {
+            "products": [
+                {
+                    "id": item["id"],
+                    "name": item["name"],
+                    "slug": item["slug"] or _safe_slug(item["name"], "product"),
+                    "similarity": round(item["similarity"], 3),
+                }
+                for item in products
+            ],
+            "documents": [
+                {
+                    "id": item["id"],
+                    "title": item["title"],
+                    "doc_type": item["doc_type"],
+                    "product_id": item["product_id"],
+                    "product_slug": item["product__slug"],
+                    "similarity": round(item["similarity"], 3),
+                }
+                for item in documents
+            ],
+            "news": [
+                {
+                    "id": item["id"],
+                    "title": item["title"],
+                    "slug": item["slug"] or _safe_slug(item["title"], "news"),
+                    "similarity": round(item["similarity"], 3),
+                }
+                for item in news
+            ],
         }
-        for item in achievements_qs
-    ]
 
-    documents = [
-        {
-            "id": item.id,
-            "title": item.title,
-            "description": item.description or "",
-            "doc_type": item.doc_type,
-            "access_type": item.access_type,
-            "product_id": item.product_id,
-            "product_name": item.product.name if item.product else "",
-            "product_slug": (item.product.slug if item.product else "") or _safe_slug(
-                item.product.name if item.product else "",
-                "product",
-            ),
-        }
-        for item in documents_qs
-    ]
-
-    counts = {
-        "products": len(products),
-        "news": len(news),
-        "achievements": len(achievements),
-        "documents": len(documents),
+
+def warm_search_suggestions(queries, limit=SUGGEST_DEFAULT_LIMIT, timeout=None):
+    """Cache suggestions for every prefix of `queries` the autocomplete would send; returns how many were computed."""
+    prefixes = {
+        query[:length]
+        for query in (" ".join(query.split())[:SUGGEST_MAX_QUERY_LENGTH] for query in queries)
+        for length in range(2, len(query) + 1)
     }
-    counts["total"] = counts["products"] + counts["news"] + counts["documents"]
+    warmed = 0
+    for prefix in sorted(prefixes):
+        cache_key = suggest_cache_key(prefix, limit)
+        if cache.get(cache_key) is not None:
+            continue
+        try:
+            results = _build_suggestions(prefix, limit)
+        except OperationalError:
+            continue
+        cache.set(cache_key, results, timeout=timeout or settings.SEARCH_SUGGEST_CACHE_TIMEOUT)
+        warmed += 1
+    return warmed
 
-    return Response(
-        {
-            "query": query,
-            "counts": counts,
-            "results": {
-                "products": products,
-                "news": news,
-                "achievements": achievements,
-                "documents": documents,
-            },
-        }
-    )
+
+@api_view(["GET"])
+def search_suggest(request):
+    query = " ".join((request.GET.get("q") or "").split())[:SUGGEST_MAX_QUERY_LENGTH]
+    limit = _coerce_limit(request.GET.get("limit"), default=SUGGEST_DEFAULT_LIMIT, max_limit=10)
+    empty = {"products": [], "documents": [], "news": []}
+    if len(query) < 2:
+        return Response({"query": query, "results": empty})
+
+    cache_key = suggest_cache_key(query, limit)
+    results = cache.get(cache_key)
+    if results is None:
+        try:
+            results = _build_suggestions(query, limit)
+        except OperationalError:
+            # statement_timeout hit: drop this keystroke rather than hold the request.
+            logger.info("Search suggestions for %r exceeded the latency budget", query)
+            return Response({"query": query, "results": empty, "timed_out": True})
+        cache.set(cache_key, results, timeout=settings.SEARCH_SUGGEST_CACHE_TIMEOUT)
+    return Response({"query": query, "results": results})
@@ -0,0 +1,213 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Min, Prefetch, Q
+from django.utils import timezone
+
+from common.cache import bump_cache_version, bump_object_versions, cached_fragment, get_cache_version, make_fragment
+from common.images import build_image_metadata, build_image_sources
+
+from .models import Achievement, AchievementImage, AnnouncementRibbon, News, NewsImage
+
+NEWS_DETAIL_CACHE_NAMESPACE = "content:news:detail"
+ACHIEVEMENT_DETAIL_CACHE_NAMESPACE = "content:achievements:detail"
+NEWS_LIST_VERSION_KEY = "content:news:list:version"
+ACHIEVEMENT_LIST_VERSION_KEY = "content:achievements:list:version"
+ANNOUNCEMENT_VERSION_KEY = "content:announcement-ribbon:version"
+
+
+def invalidate_news_details(news_ids):
+    bump_object_versions(NEWS_DETAIL_CACHE_NAMESPACE, news_ids)
+
+
+def invalidate_achievement_details(achievement_ids):
+    bump_object_versions(ACHIEVEMENT_DETAIL_CACHE_NAMESPACE, achievement_ids)
+
+
+def invalidate_news_list():
+    bump_cache_version(NEWS_LIST_VERSION_KEY)
+
+
+def invalidate_achievement_list():
+    bump_cache_version(ACHIEVEMENT_LIST_VERSION_KEY)
+
+
+def invalidate_announcement():
+    bump_cache_version(ANNOUNCEMENT_VERSION_KEY)
+
+
+def _build_file_url(request, file_field):
+    if not file_field:
+        return ""
+    return request.build_absolute_uri(file_field.url)
+
+
+def build_image_payloads(request, images, fallback_file=None):
+    payloads = [
+        {
+            "url": _build_file_url(request, image.image),
+            **build_image_metadata(image),
+            "srcset": build_image_sources(request, image.image, image.derivatives),
+        }
+        for image in images
+        if image.image
+    ]
+    if not payloads and fallback_file:
+        payloads = [
+            {
+                "url": _build_file_url(request, fallback_file),
+                "width": None,
+                "height": None,
+                "placeholder": "",
+                "srcset": [],
+            }
+        ]
+    return payloads
+
+
+def _first_image_payload(request, images, fallback_file=None):
+    payloads = build_image_payloads(request, images, fallback_file=fallback_file)
+    return payloads[0] if payloads else None
+
+
+def news_summary_queryset():
+    # news_visible_created_idx serves the filter and the created_at order; id only breaks ties, so offset
+    # pages neither repeat nor skip rows that share a timestamp.
+    return (
+        News.objects.filter(is_visible=True)
+        .only("id", "title", "slug", "summary", "cover_image_url", "created_at")
+        .prefetch_related(
+            Prefetch("images", queryset=NewsImage.objects.order_by("display_order", "id")[:1], to_attr="first_images")
+        )
+        .order_by("-created_at", "-id")
+    )
+
+
+def build_news_summary_payload(request, item):
+    return {
+        "id": item.id,
+        "title": item.title,
+        "slug": item.slug,
+        "summary": item.summary,
+        "created_at": item.created_at,
+        "image": _first_image_payload(request, item.first_images, fallback_file=item.cover_image_url),
+    }
+
+
+def achievement_summary_queryset():
+    # Newest first rather than the full list's -year order: ach_visible_created_idx serves the filter and the
+    # page slice, and the news & achievements index merges both paged streams by created_at. id breaks ties
+    # so offset pages stay stable.
+    return (
+        Achievement.objects.filter(is_visible=True)
+        .only("id", "title", "slug", "summary", "year", "image_url", "created_at")
+        .prefetch_related(
+            Prefetch("images", queryset=AchievementImage.objects.order_by("display_order", "id")[:1], to_attr="first_images")
+        )
+        .order_by("-created_at", "-id")
+    )
+
+
+def build_achievement_summary_payload(request, item):
+    return {
+        "id": item.id,
+        "title": item.title,
+        "slug": item.slug,
+        "summary": item.summary,
+        "year": item.year,
+        "created_at": item.created_at,
+        "image": _first_image_payload(request, item.first_images, fallback_file=item.image_url),
+    }
+
+
+def _recent_summaries_fragment(request, version_key, queryset, build_payload, limit):
+    version = get_cache_version(version_key)
+    # Absolute file URLs depend on the requesting origin, so it is part of the key.
+    cache_key = f"{version_key}:{version}:recent:{limit}:{request.build_absolute_uri('/')}"
+
+    def build():
+        data = [build_payload(request, item) for item in queryset[:limit]]
+        return {"count": len(data), "results": data}
+
+    return cached_fragment(cache_key, build, settings.LIST_FRAGMENT_CACHE_TIMEOUT)
+
+
+def get_recent_news_fragment(request, limit):
+    """(digest, payload) of the newest `limit` news summaries, cached until any news item changes."""
+    return _recent_summaries_fragment(
+        request, NEWS_LIST_VERSION_KEY, news_summary_queryset(), build_news_summary_payload, limit
+    )
+
+
+def get_recent_achievements_fragment(request, limit):
+    """(digest, payload) of the newest `limit` achievement summaries, cached until any achievement changes."""
+    return _recent_summaries_fragment(
+        request, ACHIEVEMENT_LIST_VERSION_KEY, achievement_summary_queryset(), build_achievement_summary_payload, limit
+    )
+
+
+def _build_announcement_payload(now):
+    announcements_qs = (
+        AnnouncementRibbon.objects.filter(is_enabled=True)
+        .filter(Q(starts_at__isnull=True) | Q(starts_at__lte=now))
+        .filter(Q(ends_at__isnull=True) | Q(ends_at__gte=now))
+        .order_by("-updated_at")
+    )
+
+    announcements = list(announcements_qs)
+    if not announcements:
+        return {"enabled": False, "result": None}
+
+    latest = announcements[0]
+    results = [
+        {
+            "id": item.id,
+            "text": item.text or "",
+            "message": item.message or "",
+            "link_url": item.link_url or "",
+            "starts_at": item.starts_at,
+            "ends_at": item.ends_at,
+            "updated_at": item.updated_at,
+        }
+        for item in announcements
+    ]
+
+    return {
+        "enabled": True,
+        "count": len(results),
+        "results": results,
+        "result": {
+            "id": latest.id,
+            "text": latest.text or "",
+            "message": latest.message or "",
+            "link_url": latest.link_url or "",
+            "starts_at": latest.starts_at,
+            "ends_at": latest.ends_at,
+            "updated_at": latest.updated_at,
+        },
+    }
+
+
+def _announcement_cache_timeout(now):
+    """Seconds until the next enabled ribbon starts or ends, capped at ANNOUNCEMENT_CACHE_TIMEOUT."""
+    boundaries = AnnouncementRibbon.objects.filter(is_enabled=True).aggregate(
+        next_start=Min("starts_at", filter=Q(starts_at__gt=now)),
+        next_end=Min("ends_at", filter=Q(ends_at__gte=now)),
+    )
+    timeout = settings.ANNOUNCEMENT_CACHE_TIMEOUT
+    for boundary in boundaries.values():
+        if boundary is not None:
+            # A ribbon stays active through ends_at itself, so expire just after it.
+            timeout = min(timeout, int((boundary - now).total_seconds()) + 1)
+    return max(1, timeout)
+
+
+def get_announcement_fragment():
+    """(digest, payload) of the active ribbon, cached until the next schedule boundary or edit."""
+    # The version is read before the query, so a ribbon built from pre-edit rows lands under the old key.
+    cache_key = f"content:announcement-ribbon:{get_cache_version(ANNOUNCEMENT_VERSION_KEY)}"
+    fragment = cache.get(cache_key)
+    if fragment is None:
+        now = timezone.now()
+        fragment = make_fragment(_build_announcement_payload(now))
+        cache.set(cache_key, fragment, timeout=_announcement_cache_timeout(now))
+    return fragment
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-19 05:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0007_add_news_achievement_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="achievementimage",
+            name="derivatives",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name="newsimage",
+            name="derivatives",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 6.0.2 on 2026-10-19 06:04
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import F
+
+
+# A frozen copy of the weights in common.search at the time of this migration.
+def backfill_search_vectors(apps, schema_editor):
+    config = settings.SEARCH_CONFIG
+    for model_name in ("News", "Achievement"):
+        apps.get_model("content", model_name).objects.update(
+            search_vector=SearchVector(F("title"), weight="A", config=config)
+            + SearchVector(F("summary"), weight="B", config=config)
+            + SearchVector(F("content"), weight="C", config=config)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0009_image_dimensions_placeholder"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="achievement",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="news",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="achievement",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="ach_search_gin"),
+        ),
+        migrations.AddIndex(
+            model_name="news",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="news_search_gin"),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
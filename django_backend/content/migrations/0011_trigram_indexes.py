@@ -0,0 +1,20 @@
+# Generated by Django 6.0.2 on 2026-10-19 06:04
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0010_search_vectors"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="news",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["title"], name="news_title_trgm", opclasses=["gin_trgm_ops"]),
+        ),
+    ]
@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator, MaxLengthValidator, MinLengthValidator, RegexValidator
 from django.db import models
@@ -63,6 +65,8 @@ class Achievement(models.Model):
         ],
     )
     is_visible = models.BooleanField(default=True)
+    # Weighted title/summary/content tsvector, maintained by common.signals.
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -71,6 +75,7 @@ class Achievement(models.Model):
         indexes = [
             models.Index(fields=["created_at"], name="achievement_created_idx"),
             models.Index(fields=["is_visible", "-created_at"], name="ach_visible_created_idx"),
+            GinIndex(fields=["search_vector"], name="ach_search_gin"),
         ]
 
 
@@ -100,6 +105,8 @@ class News(models.Model):
         ],
     )
     is_visible = models.BooleanField(default=True)
+    # Weighted title/summary/content tsvector, maintained by common.signals.
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -108,6 +115,8 @@ class News(models.Model):
         indexes = [
             models.Index(fields=["created_at"], name="news_created_idx"),
             models.Index(fields=["is_visible", "-created_at"], name="news_visible_created_idx"),
+            GinIndex(fields=["search_vector"], name="news_search_gin"),
+            GinIndex(fields=["title"], name="news_title_trgm", opclasses=["gin_trgm_ops"]),
         ]
 
 
@@ -121,6 +130,11 @@ class NewsImage(models.Model):
             validate_image_file_size,
         ],
     )
+    # Resized WebP/AVIF copies written by common.tasks.process_uploaded_image.
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
+    width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    placeholder = models.TextField(blank=True, default="", editable=False)
     display_order = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -139,6 +153,11 @@ class AchievementImage(models.Model):
             validate_image_file_size,
         ],
     )
+    # Resized WebP/AVIF copies written by common.tasks.process_uploaded_image.
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
+    width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    placeholder = models.TextField(blank=True, default="", editable=False)
     display_order = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -0,0 +1,46 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from common.images import schedule_image_processing
+
+from .cache import (
+    invalidate_achievement_details,
+    invalidate_achievement_list,
+    invalidate_announcement,
+    invalidate_news_details,
+    invalidate_news_list,
+)
+from .models import Achievement, AchievementImage, AnnouncementRibbon, News, NewsImage
+
+
+def _content_image_saved(sender, instance, **kwargs):
+    schedule_image_processing(instance, "image", "derivatives")
+
+
+def _news_changed(sender, instance, **kwargs):
+    news_id = instance.pk if sender is News else instance.news_id
+    transaction.on_commit(lambda: invalidate_news_details([news_id]))
+    transaction.on_commit(invalidate_news_list)
+
+
+def _achievement_changed(sender, instance, **kwargs):
+    achievement_id = instance.pk if sender is Achievement else instance.achievement_id
+    transaction.on_commit(lambda: invalidate_achievement_details([achievement_id]))
+    transaction.on_commit(invalidate_achievement_list)
+
+
+def _announcement_changed(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_announcement)
+
+
+for _model in (NewsImage, AchievementImage):
+    post_save.connect(_content_image_saved, sender=_model, dispatch_uid=f"content.images.save.{_model.__name__}")
+
+for _model in (News, NewsImage):
+    post_save.connect(_news_changed, sender=_model, dispatch_uid=f"content.detail.save.{_model.__name__}")
+    post_delete.connect(_news_changed, sender=_model, dispatch_uid=f"content.detail.delete.{_model.__name__}")
+for _model in (Achievement, AchievementImage):
+    post_save.connect(_achievement_changed, sender=_model, dispatch_uid=f"content.detail.save.{_model.__name__}")
+    post_delete.connect(_achievement_changed, sender=_model, dispatch_uid=f"content.detail.delete.{_model.__name__}")
+post_save.connect(_announcement_changed, sender=AnnouncementRibbon, dispatch_uid="content.announcement.save")
+post_delete.connect(_announcement_changed, sender=AnnouncementRibbon, dispatch_uid="content.announcement.delete")
@@ -1,9 +1,17 @@
-from django.urls import path
+from django.urls import path, re_path
 
 from . import views
 
 urlpatterns = [
     path("api/content/news", views.get_news, name="get_news"),
+    path("api/content/news/summaries", views.get_news_summaries, name="get_news_summaries"),
+    re_path(r"^api/content/news/(?P<slug>[-a-zA-Z0-9_]+)-(?P<news_id>\d+)$", views.get_news_detail, name="get_news_detail"),
     path("api/content/achievements", views.get_achievements, name="get_achievements"),
+    path("api/content/achievements/summaries", views.get_achievement_summaries, name="get_achievement_summaries"),
+    re_path(
+        r"^api/content/achievements/(?P<slug>[-a-zA-Z0-9_]+)-(?P<achievement_id>\d+)$",
+        views.get_achievement_detail,
+        name="get_achievement_detail",
+    ),
     path("api/content/announcement-ribbon", views.get_latest_announcement, name="get_latest_announcement"),
 ]
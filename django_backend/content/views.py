@@ -1,115 +1,144 @@
-from django.db.models import Q
-from django.utils import timezone
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404
+from django.utils.text import slugify
 from rest_framework.decorators import api_view
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
-from .models import Achievement, AnnouncementRibbon, News
-
-
-def _build_file_url(request, file_field):
-    if not file_field:
-        return ""
-    return request.build_absolute_uri(file_field.url)
+from common.cache import object_cache_keys
+
+from .cache import (
+    ACHIEVEMENT_DETAIL_CACHE_NAMESPACE,
+    NEWS_DETAIL_CACHE_NAMESPACE,
+    achievement_summary_queryset,
+    build_achievement_summary_payload,
+    build_image_payloads,
+    build_news_summary_payload,
+    get_announcement_fragment,
+    news_summary_queryset,
+)
+from .models import Achievement, News
+
+
+class SummaryPagination(PageNumberPagination):
+    page_size = 12
+    page_size_query_param = "page_size"
+    max_page_size = 48
+
+
+def _build_news_payload(request, item):
+    images = build_image_payloads(request, item.images.all(), fallback_file=item.cover_image_url)
+    image_urls = [image["url"] for image in images]
+    return {
+        "id": item.id,
+        "title": item.title,
+        "slug": item.slug,
+        "summary": item.summary,
+        "content": item.content,
+        "cover_image_url": image_urls[0] if image_urls else "",
+        "image_urls": image_urls,
+        "images": images,
+        "is_visible": item.is_visible,
+        "created_at": item.created_at,
+        "updated_at": item.updated_at,
+    }
+
+
+def _build_achievement_payload(request, item):
+    images = build_image_payloads(request, item.images.all(), fallback_file=item.image_url)
+    image_urls = [image["url"] for image in images]
+    return {
+        "id": item.id,
+        "title": item.title,
+        "slug": item.slug,
+        "summary": item.summary,
+        "content": item.content,
+        "year": item.year,
+        "image_url": image_urls[0] if image_urls else "",
+        "image_urls": image_urls,
+        "images": images,
+        "is_visible": item.is_visible,
+        "created_at": item.created_at,
+        "updated_at": item.updated_at,
+    }
+
+
+def _get_cached_detail_payload(request, namespace, queryset, item_id, build_payload):
+    """Detail payload of a visible item, served from its per-item cache entry when present."""
+    # Absolute file URLs depend on the requesting origin, so it is part of the key.
+    cache_key = object_cache_keys(namespace, [item_id], request.build_absolute_uri("/"))[item_id]
+    payload = cache.get(cache_key)
+    if payload is None:
+        item = queryset.filter(id=item_id).first()
+        if item is None:
+            return None
+        payload = build_payload(request, item)
+        cache.set(cache_key, payload, timeout=settings.CONTENT_DETAIL_CACHE_TIMEOUT)
+    return payload
+
+
+def _canonical_slug(payload, fallback):
+    # Items saved before slugs existed have none; links to them use the slugified title, as search does.
+    return payload["slug"] or slugify(payload["title"] or "") or fallback
 
 
 @api_view(["GET"])
 def get_news(request):
     news_qs = News.objects.filter(is_visible=True).prefetch_related("images").order_by("-created_at")
-    data = []
-
-    for item in news_qs:
-        image_urls = [_build_file_url(request, image.image) for image in item.images.all() if image.image]
-        if not image_urls and item.cover_image_url:
-            image_urls = [_build_file_url(request, item.cover_image_url)]
-
-        data.append(
-            {
-                "id": item.id,
-                "title": item.title,
-                "slug": item.slug,
-                "summary": item.summary,
-                "content": item.content,
-                "cover_image_url": image_urls[0] if image_urls else "",
-                "image_urls": image_urls,
-                "is_visible": item.is_visible,
-                "created_at": item.created_at,
-                "updated_at": item.updated_at,
-            }
-        )
-
+    data = [_build_news_payload(request, item) for item in news_qs]
     return Response({"count": len(data), "results": data})
 
 
+@api_view(["GET"])
+def get_news_detail(request, slug, news_id):
+    news_qs = News.objects.filter(is_visible=True).prefetch_related("images")
+    payload = _get_cached_detail_payload(request, NEWS_DETAIL_CACHE_NAMESPACE, news_qs, int(news_id), _build_news_payload)
+    if payload is None or _canonical_slug(payload, "news") != slug:
+        raise Http404("No News matches the given query.")
+    return Response(payload)
+
+
 @api_view(["GET"])
 def get_achievements(request):
     achievements_qs = Achievement.objects.filter(is_visible=True).prefetch_related("images").order_by("-year", "-created_at")
-    data = []
-
-    for item in achievements_qs:
-        image_urls = [_build_file_url(request, image.image) for image in item.images.all() if image.image]
-        if not image_urls and item.image_url:
-            image_urls = [_build_file_url(request, item.image_url)]
-
-        data.append(
-            {
-                "id": item.id,
-                "title": item.title,
-                "slug": item.slug,
-                "summary": item.summary,
-                "content": item.content,
-                "year": item.year,
-                "image_url": image_urls[0] if image_urls else "",
-                "image_urls": image_urls,
-                "is_visible": item.is_visible,
-                "created_at": item.created_at,
-                "updated_at": item.updated_at,
-            }
-        )
-
+    data = [_build_achievement_payload(request, item) for item in achievements_qs]
     return Response({"count": len(data), "results": data})
 
 
 @api_view(["GET"])
-def get_latest_announcement(request):
-    now = timezone.now()
-    announcements_qs = (
-        AnnouncementRibbon.objects.filter(is_enabled=True)
-        .filter(Q(starts_at__isnull=True) | Q(starts_at__lte=now))
-        .filter(Q(ends_at__isnull=True) | Q(ends_at__gte=now))
-        .order_by("-updated_at")
+def get_achievement_detail(request, slug, achievement_id):
+    achievements_qs = Achievement.objects.filter(is_visible=True).prefetch_related("images")
+    payload = _get_cached_detail_payload(
+        request, ACHIEVEMENT_DETAIL_CACHE_NAMESPACE, achievements_qs, int(achievement_id), _build_achievement_payload
+    )
+    if payload is None or _canonical_slug(payload, "achievement") != slug:
+        raise Http404("No Achievement matches the given query.")
+    return Response(payload)
+
+
+def _paginated_summaries(request, queryset, build_payload):
+    if request.query_params.get("order") == "oldest":
+        queryset = queryset.reverse()
+    paginator = SummaryPagination()
+    page = paginator.paginate_queryset(queryset, request)
+    return paginator.get_paginated_response([build_payload(item) for item in page])
+
+
+@api_view(["GET"])
+def get_news_summaries(request):
+    return _paginated_summaries(
+        request, news_summary_queryset(), lambda item: build_news_summary_payload(request, item)
     )
 
-    announcements = list(announcements_qs)
-    if not announcements:
-        return Response({"enabled": False, "result": None})
-
-    latest = announcements[0]
-    results = [
-        {
-            "id": item.id,
-            "text": item.text or "",
-            "message": item.message or "",
-            "link_url": item.link_url or "",
-            "starts_at": item.starts_at,
-            "ends_at": item.ends_at,
-            "updated_at": item.updated_at,
-        }
-        for item in announcements
-    ]
-
-    return Response(
-        {
-            "enabled": True,
-            "count": len(results),
-            "results": results,
-            "result": {
-                "id": latest.id,
-                "text": latest.text or "",
-                "message": latest.message or "",
-                "link_url": latest.link_url or "",
-                "starts_at": latest.starts_at,
-                "ends_at": latest.ends_at,
-                "updated_at": latest.updated_at,
-            },
-        }
+
+@api_view(["GET"])
+def get_achievement_summaries(request):
+    return _paginated_summaries(
+        request, achievement_summary_queryset(), lambda item: build_achievement_summary_payload(request, item)
     )
+
+
+@api_view(["GET"])
+def get_latest_announcement(request):
+    return Response(get_announcement_fragment()[1])
@@ -65,6 +65,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 
     # Third-party
     "rest_framework",
@@ -133,6 +134,60 @@ DATABASES = {
 }
 
 
+# Cache
+# Must be shared by every web and Celery process: cache versions, download counters and
+# invalidations all rely on it. common.checks rejects process-local backends when DEBUG is off.
+
+CACHES = {
+    "default": env.cache_url("CACHE_URL", default="redis://127.0.0.1:6379/1"),
+}
+# Pending document download counts (a Redis hash drained by the flush-document-downloads task).
+# Must not be evicted like a cache, so keep it out of an LRU-configured cache database.
+DOWNLOAD_COUNTER_REDIS_URL = env("DOWNLOAD_COUNTER_REDIS_URL", default="redis://127.0.0.1:6379/2")
+PRODUCT_DETAIL_CACHE_TIMEOUT = env.int("PRODUCT_DETAIL_CACHE_TIMEOUT", default=60 * 60)
+CONTENT_DETAIL_CACHE_TIMEOUT = env.int("CONTENT_DETAIL_CACHE_TIMEOUT", default=60 * 60)
+# Power source/industry lists and recent news/achievements (also assembled by /api/bootstrap/home).
+LIST_FRAGMENT_CACHE_TIMEOUT = env.int("LIST_FRAGMENT_CACHE_TIMEOUT", default=60 * 60)
+# Upper bound only: the ribbon entry also expires at the next starts_at/ends_at and on every edit.
+ANNOUNCEMENT_CACHE_TIMEOUT = env.int("ANNOUNCEMENT_CACHE_TIMEOUT", default=60 * 60)
+
+# Co-view recommendations shown on product detail pages
+RELATED_PRODUCTS_TOP_K = env.int("RELATED_PRODUCTS_TOP_K", default=6)
+RELATED_PRODUCTS_WINDOW_DAYS = env.int("RELATED_PRODUCTS_WINDOW_DAYS", default=90)
+# Trending scores halve every TRENDING_HALF_LIFE_HOURS; clear analytics_trending_scores after changing it.
+TRENDING_HALF_LIFE_HOURS = env.float("TRENDING_HALF_LIFE_HOURS", default=72.0)
+# Repeated events for one object from the same session or IP only count once per window.
+TRENDING_DEDUP_SECONDS = env.int("TRENDING_DEDUP_SECONDS", default=30 * 60)
+# Number of reverse proxies in front of Django that append to X-Forwarded-For; 0 trusts REMOTE_ADDR only.
+TRUSTED_PROXY_COUNT = env.int("TRUSTED_PROXY_COUNT", default=0)
+
+# Full-text search: text search configuration used for stored vectors and queries.
+# Changing it requires rebuilding the vectors (re-save rows or re-run the backfill migrations).
+SEARCH_CONFIG = env("SEARCH_CONFIG", default="english")
+# Serve /api/search from a per-worker in-memory BM25 index instead of Postgres queries.
+SEARCH_INMEMORY_INDEX_ENABLED = env.bool("SEARCH_INMEMORY_INDEX_ENABLED", default=False)
+# Run the four /api/search sub-queries concurrently on a bounded thread pool (one DB connection per pool thread).
+SEARCH_PARALLEL_QUERIES = env.bool("SEARCH_PARALLEL_QUERIES", default=False)
+SEARCH_PARALLEL_WORKERS = env.int("SEARCH_PARALLEL_WORKERS", default=4)
+# Per-worker LRU of /api/search results, keyed by normalized query and limit.
+SEARCH_RESULT_CACHE_SIZE = env.int("SEARCH_RESULT_CACHE_SIZE", default=512)
+SEARCH_RESULT_CACHE_TIMEOUT = env.int("SEARCH_RESULT_CACHE_TIMEOUT", default=5 * 60)
+# Extracted PDF text stored per document for body search (pypdf must be installed on workers).
+DOCUMENT_TEXT_MAX_CHARS = env.int("DOCUMENT_TEXT_MAX_CHARS", default=200_000)
+# Search telemetry: per-worker query counts, upserted into SearchQueryStat at most once per interval.
+SEARCH_QUERY_LOG_ENABLED = env.bool("SEARCH_QUERY_LOG_ENABLED", default=True)
+SEARCH_QUERY_LOG_FLUSH_SECONDS = env.int("SEARCH_QUERY_LOG_FLUSH_SECONDS", default=60)
+SEARCH_QUERY_LOG_MAX_PENDING = env.int("SEARCH_QUERY_LOG_MAX_PENDING", default=1000)
+# The most searched queries of the last few days are pre-computed into the result and suggestion caches.
+SEARCH_POPULAR_QUERY_DAYS = env.int("SEARCH_POPULAR_QUERY_DAYS", default=7)
+SEARCH_WARM_QUERY_COUNT = env.int("SEARCH_WARM_QUERY_COUNT", default=20)
+SEARCH_WARM_SECONDS = env.int("SEARCH_WARM_SECONDS", default=5 * 60)
+# Autocomplete fires per keystroke: queries past the budget are cancelled and return no suggestions.
+SEARCH_SUGGEST_TIMEOUT_MS = env.int("SEARCH_SUGGEST_TIMEOUT_MS", default=150)
+SEARCH_SUGGEST_MIN_SIMILARITY = env.float("SEARCH_SUGGEST_MIN_SIMILARITY", default=0.3)
+SEARCH_SUGGEST_CACHE_TIMEOUT = env.int("SEARCH_SUGGEST_CACHE_TIMEOUT", default=60)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -170,6 +225,11 @@ USE_TZ = True
 STATIC_URL = "static/"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+# Hand file bodies to the front server instead of streaming them from Python:
+# "X-Accel-Redirect" for nginx (with an `internal` location aliased to MEDIA_ROOT at
+# MEDIA_ACCEL_REDIRECT_PREFIX) or "X-Sendfile" for Apache/lighttpd. Empty serves with Range support.
+MEDIA_SENDFILE_HEADER = env("MEDIA_SENDFILE_HEADER", default="")
+MEDIA_ACCEL_REDIRECT_PREFIX = env("MEDIA_ACCEL_REDIRECT_PREFIX", default="/protected-media/")
 
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
@@ -218,3 +278,23 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
+
+CELERY_BEAT_SCHEDULE = {
+    "flush-document-downloads": {
+        "task": "products.tasks.flush_document_downloads",
+        "schedule": env.int("DOCUMENT_DOWNLOAD_FLUSH_SECONDS", default=60),
+    },
+    "rebuild-related-products": {
+        "task": "analytics.tasks.rebuild_related_products_task",
+        "schedule": env.int("RELATED_PRODUCTS_REBUILD_SECONDS", default=6 * 60 * 60),
+    },
+    "warm-search-suggestions": {
+        "task": "analytics.tasks.warm_search_suggestions_task",
+        "schedule": SEARCH_WARM_SECONDS,
+    },
+}
+
+# Next.js on-demand revalidation: tags are POSTed here (with the secret as a bearer token) after commits.
+NEXTJS_REVALIDATE_URL = env("NEXTJS_REVALIDATE_URL", default="")
+NEXTJS_REVALIDATE_SECRET = env("NEXTJS_REVALIDATE_SECRET", default="")
+NEXTJS_REVALIDATE_TIMEOUT = env.int("NEXTJS_REVALIDATE_TIMEOUT", default=5)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Industry, PowerSource, Product, ProductCatalogue, ProductImage, ProductIndustry
+from .models import Industry, PowerSource, Product, ProductCatalogue, ProductImage, ProductIndustry, RelatedProduct
 
 
 class ProductIndustryInline(admin.TabularInline):
@@ -59,9 +59,10 @@ class ProductAdmin(admin.ModelAdmin):
 
 @admin.register(ProductCatalogue)
 class ProductCatalogueAdmin(admin.ModelAdmin):
-    list_display = ("id", "title", "doc_type", "product", "access_type", "is_visible", "sort_order", "created_at")
+    list_display = ("id", "title", "doc_type", "product", "access_type", "is_visible", "sort_order", "download_count", "created_at")
     list_filter = ("doc_type", "access_type", "is_visible", "created_at")
     search_fields = ("title", "description", "file")
+    readonly_fields = ("download_count", "content_sha256")
 
 
 @admin.register(ProductIndustry)
@@ -77,3 +78,10 @@ class ProductImageAdmin(admin.ModelAdmin):
     list_display = ("id", "product", "display_order", "created_at")
     list_filter = ("product",)
     search_fields = ("product__name",)
+
+
+@admin.register(RelatedProduct)
+class RelatedProductAdmin(admin.ModelAdmin):
+    list_display = ("id", "product", "rank", "related", "score")
+    search_fields = ("product__name", "related__name")
+    list_select_related = ("product", "related")
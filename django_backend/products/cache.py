@@ -0,0 +1,143 @@
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from common.cache import bump_cache_version, bump_object_versions, cached_fragment, get_cache_version
+from common.images import build_image_sources
+
+from .models import Industry, PowerSource, ProductCatalogue
+
+PRODUCT_DETAIL_CACHE_NAMESPACE = "products:detail"
+POWER_SOURCE_LIST_VERSION_KEY = "products:power-sources:version"
+INDUSTRY_LIST_VERSION_KEY = "products:industries:version"
+DOCUMENT_DOWNLOAD_COUNTER_KEY = "products:downloads"
+
+logger = logging.getLogger(__name__)
+_download_counter_redis = None
+
+
+def invalidate_product_details(product_ids):
+    bump_object_versions(PRODUCT_DETAIL_CACHE_NAMESPACE, product_ids)
+
+
+def invalidate_power_source_list():
+    bump_cache_version(POWER_SOURCE_LIST_VERSION_KEY)
+
+
+def invalidate_industry_list():
+    bump_cache_version(INDUSTRY_LIST_VERSION_KEY)
+
+
+def build_file_url(request, file_field):
+    if not file_field:
+        return ""
+    return request.build_absolute_uri(file_field.url)
+
+
+def _build_power_sources_payload(request):
+    power_sources_qs = PowerSource.objects.filter(is_visible=True).order_by("sort_order", "name")
+    data = [
+        {
+            "id": item.id,
+            "name": item.name,
+            "slug": item.slug,
+            "summary": item.short_description,
+            "image_url": build_file_url(request, item.image_url),
+            "image_srcset": build_image_sources(request, item.image_url, item.image_derivatives),
+            "sort_order": item.sort_order,
+            "is_visible": item.is_visible,
+            "created_at": item.created_at,
+            "updated_at": item.updated_at,
+        }
+        for item in power_sources_qs
+    ]
+    return {"count": len(data), "results": data}
+
+
+def get_power_sources_fragment(request):
+    """(digest, payload) of the visible power source list, cached until a power source changes."""
+    version = get_cache_version(POWER_SOURCE_LIST_VERSION_KEY)
+    # Absolute file URLs depend on the requesting origin, so it is part of the key.
+    cache_key = f"products:power-sources:{version}:{request.build_absolute_uri('/')}"
+    return cached_fragment(cache_key, lambda: _build_power_sources_payload(request), settings.LIST_FRAGMENT_CACHE_TIMEOUT)
+
+
+def _build_industries_payload(request):
+    industries_qs = Industry.objects.filter(is_visible=True).order_by("sort_order", "name")
+    data = [
+        {
+            "id": item.id,
+            "name": item.name,
+            "slug": item.slug,
+            "image_url": build_file_url(request, item.image_url),
+            "image_srcset": build_image_sources(request, item.image_url, item.image_derivatives),
+            "accent_color": item.accent_color,
+            "sort_order": item.sort_order,
+            "is_visible": item.is_visible,
+        }
+        for item in industries_qs
+    ]
+    return {"count": len(data), "results": data}
+
+
+def get_industries_fragment(request):
+    """(digest, payload) of the visible industry list, cached until an industry changes."""
+    version = get_cache_version(INDUSTRY_LIST_VERSION_KEY)
+    cache_key = f"products:industries:{version}:{request.build_absolute_uri('/')}"
+    return cached_fragment(cache_key, lambda: _build_industries_payload(request), settings.LIST_FRAGMENT_CACHE_TIMEOUT)
+
+
+def _download_counter_client():
+    global _download_counter_redis
+    if _download_counter_redis is None:
+        import redis
+
+        _download_counter_redis = redis.Redis.from_url(settings.DOWNLOAD_COUNTER_REDIS_URL)
+    return _download_counter_redis
+
+
+def record_document_download(document_id):
+    """Count one download in the shared hash; its fields are exactly the documents with pending counts."""
+    try:
+        _download_counter_client().hincrby(DOCUMENT_DOWNLOAD_COUNTER_KEY, document_id, 1)
+    except Exception:
+        # Counting is best-effort; the download itself must still be served.
+        logger.warning("Could not count download of document %s", document_id, exc_info=True)
+
+
+def _restore_download_counts(client, counts):
+    pipe = client.pipeline()
+    for document_id, pending in counts.items():
+        pipe.hincrby(DOCUMENT_DOWNLOAD_COUNTER_KEY, document_id, pending)
+    pipe.execute()
+
+
+def flush_document_download_counts():
+    """Move pending download counters from Redis into ProductCatalogue.download_count.
+
+    Returns {document_id: downloads} for the counts that were flushed.
+    """
+    client = _download_counter_client()
+    # Read and clear in one MULTI so concurrent flushes take disjoint snapshots
+    # and downloads counted after it wait for the next flush.
+    pipe = client.pipeline()
+    pipe.hgetall(DOCUMENT_DOWNLOAD_COUNTER_KEY)
+    pipe.delete(DOCUMENT_DOWNLOAD_COUNTER_KEY)
+    pending, _ = pipe.execute()
+    counts = {int(document_id): int(downloads) for document_id, downloads in pending.items() if int(downloads) > 0}
+    if not counts:
+        return {}
+
+    try:
+        with transaction.atomic():
+            existing = set(ProductCatalogue.objects.filter(id__in=counts).values_list("id", flat=True))
+            # Sorted so concurrent flushes lock rows in the same order.
+            for document_id in sorted(existing):
+                ProductCatalogue.objects.filter(id=document_id).update(download_count=F("download_count") + counts[document_id])
+    except Exception:
+        _restore_download_counts(client, counts)
+        raise
+    # Counts for documents deleted since the download are dropped.
+    return {document_id: counts[document_id] for document_id in sorted(existing)}
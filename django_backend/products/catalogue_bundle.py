@@ -0,0 +1,202 @@
+import hashlib
+import json
+from decimal import Decimal
+from pathlib import Path
+
+from django.core.files import File
+
+BUNDLE_MANIFEST = "catalogue.json"
+BUNDLE_MEDIA_DIR = "media"
+BUNDLE_FORMAT_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Optional keys of each bundle row and the value assumed when a row leaves them out.
+POWER_SOURCE_DEFAULTS = {"slug": None, "short_description": "", "image": "", "sort_order": 0, "is_visible": True}
+INDUSTRY_DEFAULTS = {"image": "", "accent_color": "#FFFFFF", "sort_order": 0, "is_visible": True}
+PRODUCT_DEFAULTS = {
+    "power_source": None,
+    "industries": [],
+    "short_summary": "",
+    "description": "",
+    "is_visible": True,
+    "torque_min_nm": None,
+    "torque_max_nm": None,
+    "thrust_min_n": None,
+    "thrust_max_n": None,
+    "specification": None,
+    "features": None,
+    "images": [],
+    "documents": [],
+}
+IMAGE_DEFAULTS = {"display_order": 0}
+DOCUMENT_DEFAULTS = {
+    "doc_type": "CATALOGUE",
+    "description": "",
+    "access_type": "DIRECT",
+    "is_visible": True,
+    "sort_order": 0,
+    "file": "",
+}
+DECIMAL_FIELDS = ("torque_min_nm", "torque_max_nm", "thrust_min_n", "thrust_max_n")
+
+
+def _with_defaults(row, required, defaults):
+    canonical = {field: row[field] for field in required}
+    for field, default in defaults.items():
+        canonical[field] = row.get(field, default)
+    return canonical
+
+
+def _decimal_text(value):
+    if value in (None, ""):
+        return None
+    return f"{Decimal(str(value)):.3f}"
+
+
+def canonical_power_source(row):
+    return _with_defaults(row, ("name",), POWER_SOURCE_DEFAULTS)
+
+
+def canonical_industry(row):
+    return _with_defaults(row, ("slug", "name"), INDUSTRY_DEFAULTS)
+
+
+def canonical_image(row):
+    return _with_defaults(row, ("file",), IMAGE_DEFAULTS)
+
+
+def canonical_document(row):
+    return _with_defaults(row, ("title",), DOCUMENT_DEFAULTS)
+
+
+def canonical_product(row):
+    product = _with_defaults(row, ("slug", "name"), PRODUCT_DEFAULTS)
+    for field in DECIMAL_FIELDS:
+        product[field] = _decimal_text(product[field])
+    product["industries"] = sorted(set(product["industries"]))
+    product["images"] = sorted(
+        (canonical_image(image) for image in product["images"]),
+        key=lambda image: (image["display_order"], image["file"]),
+    )
+    product["documents"] = sorted((canonical_document(document) for document in product["documents"]), key=lambda document: document["title"])
+    return product
+
+
+def row_hash(row):
+    """Stable content hash of a canonical row, used to skip rows that have not changed."""
+    return hashlib.sha256(json.dumps(row, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def power_source_row(power_source):
+    return canonical_power_source(
+        {
+            "name": power_source.name,
+            "slug": power_source.slug,
+            "short_description": power_source.short_description,
+            "image": power_source.image_url.name or "",
+            "sort_order": power_source.sort_order,
+            "is_visible": power_source.is_visible,
+        }
+    )
+
+
+def industry_row(industry):
+    return canonical_industry(
+        {
+            "name": industry.name,
+            "slug": industry.slug,
+            "image": industry.image_url.name or "",
+            "accent_color": industry.accent_color,
+            "sort_order": industry.sort_order,
+            "is_visible": industry.is_visible,
+        }
+    )
+
+
+def document_row(document):
+    return canonical_document(
+        {
+            "title": document.title,
+            "doc_type": document.doc_type,
+            "description": document.description,
+            "access_type": document.access_type,
+            "is_visible": document.is_visible,
+            "sort_order": document.sort_order,
+            "file": document.file.name or "",
+        }
+    )
+
+
+def product_row(product):
+    """Bundle row for a product with `industries`, `images` and `catalogues` prefetched."""
+    return canonical_product(
+        {
+            "slug": product.slug,
+            "name": product.name,
+            "power_source": product.power_source.name if product.power_source else None,
+            "industries": [industry.slug for industry in product.industries.all()],
+            "short_summary": product.short_summary,
+            "description": product.description,
+            "is_visible": product.is_visible,
+            "torque_min_nm": product.torque_min_nm,
+            "torque_max_nm": product.torque_max_nm,
+            "thrust_min_n": product.thrust_min_n,
+            "thrust_max_n": product.thrust_max_n,
+            "specification": product.specification,
+            "features": product.features,
+            "images": [{"file": image.image.name, "display_order": image.display_order} for image in product.images.all()],
+            "documents": [document_row(document) for document in product.catalogues.all()],
+        }
+    )
+
+
+def file_sha256(handle):
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def bundle_file_path(media_dir, name):
+    media_dir = Path(media_dir).resolve()
+    path = (media_dir / name).resolve()
+    if media_dir not in path.parents:
+        raise ValueError(f"Bundle file {name!r} is outside the media directory.")
+    return path
+
+
+def import_bundle_file(storage, media_dir, name, dry_run=False):
+    """Return the storage name for a bundled file, copying it only when the stored bytes differ."""
+    if not name:
+        return ""
+    source = bundle_file_path(media_dir, name)
+    if not source.is_file():
+        raise FileNotFoundError(f"Bundle file {name!r} is missing from {media_dir}.")
+    if storage.exists(name) and storage.size(name) == source.stat().st_size:
+        with source.open("rb") as handle:
+            source_hash = file_sha256(handle)
+        with storage.open(name, "rb") as handle:
+            if file_sha256(handle) == source_hash:
+                return name
+    if dry_run:
+        # Any value other than `name` marks the referencing row as changed.
+        return f"{name} (changed)"
+    with source.open("rb") as handle:
+        return storage.save(name, File(handle, name=source.name))
+
+
+def export_bundle_file(storage, media_dir, name):
+    """Copy a stored file into the bundle unless an identical copy is already there."""
+    target = bundle_file_path(media_dir, name)
+    # The size check only skips hashing files that certainly differ.
+    if target.is_file() and target.stat().st_size == storage.size(name):
+        with target.open("rb") as handle:
+            target_hash = file_sha256(handle)
+        with storage.open(name, "rb") as handle:
+            if file_sha256(handle) == target_hash:
+                return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with storage.open(name, "rb") as source, target.open("wb") as handle:
+        for chunk in source.chunks():
+            handle.write(chunk)
+    return True
@@ -0,0 +1,18 @@
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.checks import Error, register
+
+REDIS_URL_SCHEMES = ("redis", "rediss", "unix")
+
+
+@register()
+def check_download_counter_store(app_configs, **kwargs):
+    hint = "Set DOWNLOAD_COUNTER_REDIS_URL to a Redis database shared by the web and Celery processes."
+    if urlsplit(settings.DOWNLOAD_COUNTER_REDIS_URL or "").scheme not in REDIS_URL_SCHEMES:
+        return [Error("DOWNLOAD_COUNTER_REDIS_URL is not a Redis URL.", hint=hint, id="products.E001")]
+    try:
+        import redis  # noqa: F401
+    except ImportError:
+        return [Error("Document download counters need the redis package.", hint="pip install redis", id="products.E002")]
+    return []
@@ -0,0 +1,74 @@
+import logging
+
+from django.conf import settings
+from django.db import transaction
+
+from common.search import update_content_vectors
+
+from .catalogue_bundle import file_sha256
+from .models import ProductCatalogue
+
+logger = logging.getLogger(__name__)
+
+
+def extract_pdf_text(file_field):
+    """Whitespace-normalized text of every page, capped at DOCUMENT_TEXT_MAX_CHARS."""
+    from pypdf import PdfReader
+
+    limit = settings.DOCUMENT_TEXT_MAX_CHARS
+    parts, length = [], 0
+    with file_field.open("rb") as handle:
+        for page in PdfReader(handle).pages:
+            # Postgres text columns reject NUL bytes, which some PDF fonts emit.
+            text = " ".join((page.extract_text() or "").replace("\x00", " ").split())
+            if text:
+                parts.append(text)
+                length += len(text) + 1
+            if length >= limit:
+                break
+    return " ".join(parts)[:limit]
+
+
+def refresh_document_text(document):
+    """Re-extract the PDF text when the file bytes changed since the last run; returns a status string."""
+    if not document.file:
+        if not document.content_sha256:
+            return "no_file"
+        text, digest = "", ""
+    else:
+        with document.file.open("rb") as handle:
+            digest = file_sha256(handle)
+        if digest == document.content_sha256:
+            return "up_to_date"
+        try:
+            text = extract_pdf_text(document.file)
+        except ImportError:
+            raise
+        except Exception:
+            # Unreadable or encrypted PDFs are recorded with no text so they are not retried until replaced.
+            logger.warning("Could not extract text from document #%s", document.pk, exc_info=True)
+            text = ""
+
+    document.content_text = text
+    document.content_sha256 = digest
+    with transaction.atomic():
+        # save() so search caches and the in-memory index pick up the change on commit.
+        document.save(update_fields=["content_text", "content_sha256"])
+        update_content_vectors(ProductCatalogue.objects.filter(pk=document.pk))
+    return "extracted" if text else "empty"
+
+
+def _enqueue_text_extraction(document_id):
+    try:
+        from .tasks import extract_document_text
+
+        extract_document_text.delay(document_id)
+    except Exception:
+        logger.warning("Could not queue text extraction for document #%s", document_id, exc_info=True)
+
+
+def schedule_text_extraction(document):
+    if not document.file and not document.content_sha256:
+        return
+    document_id = document.pk
+    transaction.on_commit(lambda: _enqueue_text_extraction(document_id))
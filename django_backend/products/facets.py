@@ -0,0 +1,231 @@
+import threading
+from decimal import Decimal
+
+from common.cache import bump_cache_version, get_cache_version
+
+from .models import Industry, PowerSource, Product, ProductIndustry
+
+FACET_INDEX_VERSION_KEY = "products:facet_index:version"
+
+# Half-open [low, high) buckets; a product lands in every bucket its rated range overlaps.
+TORQUE_BUCKETS_NM = (
+    (Decimal("0"), Decimal("50")),
+    (Decimal("50"), Decimal("250")),
+    (Decimal("250"), Decimal("1000")),
+    (Decimal("1000"), Decimal("5000")),
+    (Decimal("5000"), None),
+)
+THRUST_BUCKETS_N = (
+    (Decimal("0"), Decimal("1000")),
+    (Decimal("1000"), Decimal("5000")),
+    (Decimal("5000"), Decimal("25000")),
+    (Decimal("25000"), Decimal("100000")),
+    (Decimal("100000"), None),
+)
+
+_facet_index = None
+_facet_index_version = None
+_facet_index_lock = threading.Lock()
+
+
+def _bucket_key(low, high):
+    if high is None:
+        return f"{low.normalize():f}+"
+    return f"{low.normalize():f}-{high.normalize():f}"
+
+
+def _range_overlaps_bucket(range_min, range_max, low, high):
+    if range_max < low:
+        return False
+    return high is None or range_min < high
+
+
+def _range_covers(range_min, range_max, requested_min, requested_max):
+    # Mirrors the torque/thrust Q objects in get_products: the product's rated range
+    # must contain the requested value (or the whole requested span).
+    if requested_min is None:
+        requested_min = requested_max
+    if requested_max is None:
+        requested_max = requested_min
+    return range_min <= requested_min and range_max >= requested_max
+
+
+class FacetIndex:
+    """Bitset index over visible products; bit ``n`` is the n-th product by id.
+
+    Every power source and industry gets a mask, because get_products filters on any slug;
+    only the visible ones are listed as facets.
+    """
+
+    def __init__(self, products, power_sources, industries, product_industries):
+        self.positions = {}
+        self.all_mask = 0
+        self.power_sources = [
+            {"id": ps.id, "name": ps.name, "slug": ps.slug} for ps in power_sources if ps.slug and ps.is_visible
+        ]
+        self.industries = [{"id": ind.id, "name": ind.name, "slug": ind.slug} for ind in industries if ind.is_visible]
+        self.power_source_masks = {ps.slug: 0 for ps in power_sources if ps.slug}
+        self.industry_masks = {ind.slug: 0 for ind in industries}
+        self.torque_bucket_masks = [0] * len(TORQUE_BUCKETS_NM)
+        self.thrust_bucket_masks = [0] * len(THRUST_BUCKETS_N)
+        self.torque_ranges = []
+        self.thrust_ranges = []
+
+        power_source_slugs = {ps.id: ps.slug for ps in power_sources}
+        industry_slugs = {ind.id: ind.slug for ind in industries}
+
+        for position, row in enumerate(products):
+            bit = 1 << position
+            self.positions[row["id"]] = position
+            self.all_mask |= bit
+
+            slug = power_source_slugs.get(row["power_source_id"])
+            if slug in self.power_source_masks:
+                self.power_source_masks[slug] |= bit
+
+            torque_min, torque_max = row["torque_min_nm"], row["torque_max_nm"]
+            if torque_min is not None and torque_max is not None:
+                self.torque_ranges.append((bit, torque_min, torque_max))
+                for index, (low, high) in enumerate(TORQUE_BUCKETS_NM):
+                    if _range_overlaps_bucket(torque_min, torque_max, low, high):
+                        self.torque_bucket_masks[index] |= bit
+
+            thrust_min, thrust_max = row["thrust_min_n"], row["thrust_max_n"]
+            if thrust_min is not None and thrust_max is not None:
+                self.thrust_ranges.append((bit, thrust_min, thrust_max))
+                for index, (low, high) in enumerate(THRUST_BUCKETS_N):
+                    if _range_overlaps_bucket(thrust_min, thrust_max, low, high):
+                        self.thrust_bucket_masks[index] |= bit
+
+        for product_id, industry_id in product_industries:
+            position = self.positions.get(product_id)
+            slug = industry_slugs.get(industry_id)
+            if position is not None and slug in self.industry_masks:
+                self.industry_masks[slug] |= 1 << position
+
+    @classmethod
+    def build(cls):
+        products = list(
+            Product.objects.filter(is_visible=True)
+            .order_by("id")
+            .values("id", "power_source_id", "torque_min_nm", "torque_max_nm", "thrust_min_n", "thrust_max_n")
+        )
+        power_sources = list(PowerSource.objects.order_by("sort_order", "name"))
+        industries = list(Industry.objects.order_by("sort_order", "name"))
+        product_industries = list(ProductIndustry.objects.values_list("product_id", "industry_id"))
+        return cls(products, power_sources, industries, product_industries)
+
+    def mask_for_ids(self, product_ids):
+        mask = 0
+        for product_id in product_ids:
+            position = self.positions.get(product_id)
+            if position is not None:
+                mask |= 1 << position
+        return mask
+
+    def power_source_mask(self, slug):
+        if not slug:
+            return self.all_mask
+        return self.power_source_masks.get(slug, 0)
+
+    def industry_mask(self, slugs, match_all=False):
+        if not slugs:
+            return self.all_mask
+        if match_all:
+            mask = self.all_mask
+            for slug in slugs:
+                mask &= self.industry_masks.get(slug, 0)
+            return mask
+        mask = 0
+        for slug in slugs:
+            mask |= self.industry_masks.get(slug, 0)
+        return mask
+
+    def range_mask(self, torque_min=None, torque_max=None, thrust_min=None, thrust_max=None):
+        has_torque_filter = torque_min is not None or torque_max is not None
+        has_thrust_filter = thrust_min is not None or thrust_max is not None
+        if not has_torque_filter and not has_thrust_filter:
+            return self.all_mask
+
+        # Torque and thrust filters are OR-ed together, as in get_products.
+        mask = 0
+        if has_torque_filter:
+            for bit, range_min, range_max in self.torque_ranges:
+                if _range_covers(range_min, range_max, torque_min, torque_max):
+                    mask |= bit
+        if has_thrust_filter:
+            for bit, range_min, range_max in self.thrust_ranges:
+                if _range_covers(range_min, range_max, thrust_min, thrust_max):
+                    mask |= bit
+        return mask
+
+    def counts(
+        self,
+        *,
+        base_mask=None,
+        power_source_slug="",
+        industry_slugs=None,
+        industry_match_all=False,
+        torque_min=None,
+        torque_max=None,
+        thrust_min=None,
+        thrust_max=None,
+    ):
+        power_source_mask = self.power_source_mask(power_source_slug)
+        industry_mask = self.industry_mask(industry_slugs, match_all=industry_match_all)
+        range_mask = self.range_mask(torque_min, torque_max, thrust_min, thrust_max)
+        if base_mask is None:
+            base_mask = self.all_mask
+
+        # Every facet is counted under the other active filters, never its own.
+        without_power_source = base_mask & industry_mask & range_mask
+        without_industries = base_mask & power_source_mask & range_mask
+        without_range = base_mask & power_source_mask & industry_mask
+
+        return {
+            "total": (without_power_source & power_source_mask).bit_count(),
+            "power_sources": [
+                {**item, "count": (self.power_source_masks[item["slug"]] & without_power_source).bit_count()}
+                for item in self.power_sources
+            ],
+            "industries": [
+                {**item, "count": (self.industry_masks[item["slug"]] & without_industries).bit_count()}
+                for item in self.industries
+            ],
+            "torque_buckets": [
+                {
+                    "key": _bucket_key(low, high),
+                    "min": low,
+                    "max": high,
+                    "count": (self.torque_bucket_masks[index] & without_range).bit_count(),
+                }
+                for index, (low, high) in enumerate(TORQUE_BUCKETS_NM)
+            ],
+            "thrust_buckets": [
+                {
+                    "key": _bucket_key(low, high),
+                    "min": low,
+                    "max": high,
+                    "count": (self.thrust_bucket_masks[index] & without_range).bit_count(),
+                }
+                for index, (low, high) in enumerate(THRUST_BUCKETS_N)
+            ],
+        }
+
+
+def get_facet_index():
+    global _facet_index, _facet_index_version
+
+    version = get_cache_version(FACET_INDEX_VERSION_KEY)
+    if _facet_index is not None and _facet_index_version == version:
+        return _facet_index
+
+    with _facet_index_lock:
+        if _facet_index is None or _facet_index_version != version:
+            _facet_index = FacetIndex.build()
+            _facet_index_version = version
+        return _facet_index
+
+
+def invalidate_facet_index():
+    bump_cache_version(FACET_INDEX_VERSION_KEY)
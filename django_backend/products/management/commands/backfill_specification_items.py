@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from products.cache import invalidate_product_details
+from products.facets import invalidate_facet_index
+from products.models import SPECIFICATION_DERIVED_FIELDS, Product
+
+
+class Command(BaseCommand):
+    help = "Recompute the normalized specification items and filter maps from the raw specification JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--dry-run", action="store_true", help="Report stale rows without writing them.")
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        dry_run = options["dry_run"]
+
+        scanned = 0
+        stale = []
+        updated = 0
+        qs = Product.objects.order_by("id").only("id", "specification", *SPECIFICATION_DERIVED_FIELDS)
+        for product in qs.iterator(chunk_size=batch_size):
+            scanned += 1
+            current = [getattr(product, field) for field in SPECIFICATION_DERIVED_FIELDS]
+            product.refresh_specification_fields()
+            if current == [getattr(product, field) for field in SPECIFICATION_DERIVED_FIELDS]:
+                continue
+            stale.append(product)
+            if len(stale) >= batch_size:
+                updated += self._flush(stale, dry_run)
+                stale = []
+        updated += self._flush(stale, dry_run)
+        if updated and not dry_run:
+            invalidate_facet_index()
+
+        verb = "Would update" if dry_run else "Updated"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {updated} of {scanned} products."))
+
+    def _flush(self, products, dry_run):
+        if not products or dry_run:
+            return len(products)
+        with transaction.atomic():
+            Product.objects.bulk_update(products, list(SPECIFICATION_DERIVED_FIELDS))
+        # bulk_update skips model signals, so the cached detail payloads are refreshed here.
+        invalidate_product_details([product.id for product in products])
+        return len(products)
@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+
+from products.catalogue_bundle import (
+    BUNDLE_FORMAT_VERSION,
+    BUNDLE_MANIFEST,
+    BUNDLE_MEDIA_DIR,
+    export_bundle_file,
+    industry_row,
+    power_source_row,
+    product_row,
+)
+from products.models import Industry, PowerSource, Product
+
+
+class Command(BaseCommand):
+    help = "Write power sources, industries and products (with images and documents) to a bundle directory."
+
+    def add_arguments(self, parser):
+        parser.add_argument("bundle", help="Directory to write catalogue.json and media/ into.")
+        parser.add_argument("--skip-media", action="store_true", help="Only write catalogue.json.")
+
+    def handle(self, *args, **options):
+        bundle = Path(options["bundle"])
+        bundle.mkdir(parents=True, exist_ok=True)
+
+        products_qs = (
+            Product.objects.order_by("id")
+            .select_related("power_source")
+            .prefetch_related("industries", "images", "catalogues")
+        )
+        manifest = {
+            "version": BUNDLE_FORMAT_VERSION,
+            "power_sources": [power_source_row(item) for item in PowerSource.objects.order_by("sort_order", "name")],
+            "industries": [industry_row(item) for item in Industry.objects.order_by("sort_order", "name")],
+            "products": [product_row(item) for item in products_qs.iterator(chunk_size=500)],
+        }
+        (bundle / BUNDLE_MANIFEST).write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+
+        copied = 0
+        if not options["skip_media"]:
+            copied = self._export_media(manifest, bundle / BUNDLE_MEDIA_DIR)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {len(manifest['power_sources'])} power sources, {len(manifest['industries'])} industries "
+                f"and {len(manifest['products'])} products; copied {copied} media files."
+            )
+        )
+
+    def _export_media(self, manifest, media_dir):
+        names = {row["image"] for row in manifest["power_sources"] + manifest["industries"]}
+        for product in manifest["products"]:
+            names.update(image["file"] for image in product["images"])
+            names.update(document["file"] for document in product["documents"])
+        names.discard("")
+
+        copied = 0
+        for name in sorted(names):
+            if not default_storage.exists(name):
+                self.stderr.write(self.style.WARNING(f"Skipping missing media file {name}."))
+                continue
+            copied += export_bundle_file(default_storage, media_dir, name)
+        return copied
@@ -0,0 +1,27 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from products.document_text import refresh_document_text
+from products.models import ProductCatalogue
+
+
+class Command(BaseCommand):
+    help = "Extract searchable text from document PDFs whose file changed since the last extraction."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Re-extract every document, even unchanged files.")
+
+    def handle(self, *args, **options):
+        statuses = Counter()
+        qs = ProductCatalogue.objects.order_by("id").defer("content_text")
+        for document in qs.iterator(chunk_size=100):
+            if options["force"]:
+                document.content_sha256 = ""
+            try:
+                statuses[refresh_document_text(document)] += 1
+            except ImportError as exc:
+                raise CommandError("pypdf is required for text extraction: pip install pypdf") from exc
+
+        summary = ", ".join(f"{count} {status}" for status, count in sorted(statuses.items())) or "no documents"
+        self.stdout.write(self.style.SUCCESS(f"Processed documents: {summary}."))
@@ -0,0 +1,308 @@
+import json
+from decimal import Decimal
+from pathlib import Path
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from common.images import schedule_image_processing
+from common.revalidation import queue_revalidation
+from common.search import update_search_vectors
+from common.search_cache import invalidate_search_results
+from common.search_index import invalidate_search_index
+from products.cache import invalidate_industry_list, invalidate_power_source_list, invalidate_product_details
+from products.catalogue_bundle import (
+    BUNDLE_MANIFEST,
+    BUNDLE_MEDIA_DIR,
+    DECIMAL_FIELDS,
+    canonical_industry,
+    canonical_power_source,
+    canonical_product,
+    document_row,
+    import_bundle_file,
+    industry_row,
+    power_source_row,
+    product_row,
+    row_hash,
+)
+from products.document_text import schedule_text_extraction
+from products.facets import invalidate_facet_index
+from products.models import (
+    SPECIFICATION_DERIVED_FIELDS,
+    Industry,
+    PowerSource,
+    Product,
+    ProductCatalogue,
+    ProductImage,
+    ProductIndustry,
+)
+
+POWER_SOURCE_UPDATE_FIELDS = ("slug", "short_description", "image_url", "sort_order", "is_visible", "updated_at")
+INDUSTRY_UPDATE_FIELDS = ("name", "image_url", "accent_color", "sort_order", "is_visible", "updated_at")
+PRODUCT_UPDATE_FIELDS = (
+    "power_source",
+    "name",
+    "short_summary",
+    "description",
+    "is_visible",
+    *DECIMAL_FIELDS,
+    "specification",
+    *SPECIFICATION_DERIVED_FIELDS,
+    "features",
+    "updated_at",
+)
+DOCUMENT_UPDATE_FIELDS = ("doc_type", "description", "access_type", "is_visible", "sort_order", "file", "updated_at")
+
+
+class Command(BaseCommand):
+    help = "Create or update power sources, industries and products from an export_catalogue bundle."
+
+    def add_arguments(self, parser):
+        parser.add_argument("bundle", help="Directory containing catalogue.json and media/.")
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument("--dry-run", action="store_true", help="Report changes without writing rows or files.")
+
+    def handle(self, *args, **options):
+        bundle = Path(options["bundle"])
+        try:
+            manifest = json.loads((bundle / BUNDLE_MANIFEST).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Could not read {bundle / BUNDLE_MANIFEST}: {exc}")
+
+        self.media_dir = bundle / BUNDLE_MEDIA_DIR
+        self.batch_size = max(1, options["batch_size"])
+        self.dry_run = options["dry_run"]
+        self.stats = {"created": 0, "updated": 0, "unchanged": 0}
+        self.touched_product_ids = set()
+
+        try:
+            power_source_ids = self._sync_power_sources(manifest.get("power_sources", []))
+            industry_ids = self._sync_industries(manifest.get("industries", []))
+            rows = manifest.get("products", [])
+            for start in range(0, len(rows), self.batch_size):
+                self._sync_product_batch(rows[start : start + self.batch_size], power_source_ids, industry_ids)
+        except (KeyError, ValueError, FileNotFoundError) as exc:
+            raise CommandError(f"Invalid bundle: {exc}")
+
+        if self.stats["created"] or self.stats["updated"]:
+            # bulk_create/bulk_update skip model signals, so caches (and search vectors, above) are refreshed here.
+            invalidate_facet_index()
+            invalidate_search_index()
+            invalidate_search_results()
+            invalidate_product_details(self.touched_product_ids)
+            invalidate_power_source_list()
+            invalidate_industry_list()
+            queue_revalidation("catalogue", "home", *(f"product:{product_id}" for product_id in self.touched_product_ids))
+
+        verb = "Would write" if self.dry_run else "Wrote"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {self.stats['created']} new and {self.stats['updated']} changed rows; "
+                f"{self.stats['unchanged']} unchanged."
+            )
+        )
+
+    def _file(self, name):
+        return import_bundle_file(default_storage, self.media_dir, name, dry_run=self.dry_run)
+
+    def _write(self, model, to_create, to_update, update_fields):
+        self.stats["created"] += len(to_create)
+        self.stats["updated"] += len(to_update)
+        if self.dry_run:
+            return
+        now = timezone.now()
+        for instance in to_update:
+            instance.updated_at = now
+        model.objects.bulk_create(to_create, batch_size=self.batch_size)
+        model.objects.bulk_update(to_update, update_fields, batch_size=self.batch_size)
+
+    def _sync_power_sources(self, rows):
+        existing = {item.name: item for item in PowerSource.objects.all()}
+        to_create, to_update = [], []
+        for raw in rows:
+            row = canonical_power_source(raw)
+            row["image"] = self._file(row["image"])
+            instance = existing.get(row["name"])
+            if instance and row_hash(power_source_row(instance)) == row_hash(row):
+                self.stats["unchanged"] += 1
+                continue
+            instance = instance or PowerSource(name=row["name"])
+            instance.slug = row["slug"]
+            instance.short_description = row["short_description"]
+            instance.image_url = row["image"]
+            instance.sort_order = row["sort_order"]
+            instance.is_visible = row["is_visible"]
+            (to_update if instance.pk else to_create).append(instance)
+
+        with transaction.atomic():
+            self._write(PowerSource, to_create, to_update, POWER_SOURCE_UPDATE_FIELDS)
+            if not self.dry_run:
+                for instance in to_create + to_update:
+                    schedule_image_processing(instance, "image_url", "image_derivatives")
+        self.touched_product_ids.update(
+            Product.objects.filter(power_source__in=[item.pk for item in to_update]).values_list("id", flat=True)
+        )
+        # Dry runs leave new rows unsaved; their keys still resolve so products can be checked.
+        return {**{item.name: None for item in to_create}, **dict(PowerSource.objects.values_list("name", "id"))}
+
+    def _sync_industries(self, rows):
+        existing = {item.slug: item for item in Industry.objects.all()}
+        to_create, to_update = [], []
+        for raw in rows:
+            row = canonical_industry(raw)
+            row["image"] = self._file(row["image"])
+            instance = existing.get(row["slug"])
+            if instance and row_hash(industry_row(instance)) == row_hash(row):
+                self.stats["unchanged"] += 1
+                continue
+            instance = instance or Industry(slug=row["slug"])
+            instance.name = row["name"]
+            instance.image_url = row["image"]
+            instance.accent_color = row["accent_color"]
+            instance.sort_order = row["sort_order"]
+            instance.is_visible = row["is_visible"]
+            (to_update if instance.pk else to_create).append(instance)
+
+        with transaction.atomic():
+            self._write(Industry, to_create, to_update, INDUSTRY_UPDATE_FIELDS)
+            if not self.dry_run:
+                for instance in to_create + to_update:
+                    schedule_image_processing(instance, "image_url", "image_derivatives")
+        self.touched_product_ids.update(
+            ProductIndustry.objects.filter(industry__in=[item.pk for item in to_update]).values_list("product_id", flat=True)
+        )
+        return {**{item.slug: None for item in to_create}, **dict(Industry.objects.values_list("slug", "id"))}
+
+    def _canonical_product(self, raw, power_source_ids, industry_ids):
+        row = canonical_product(raw)
+        if row["power_source"] is not None and row["power_source"] not in power_source_ids:
+            raise ValueError(f"product {row['slug']!r} references unknown power source {row['power_source']!r}")
+        unknown = [slug for slug in row["industries"] if slug not in industry_ids]
+        if unknown:
+            raise ValueError(f"product {row['slug']!r} references unknown industries {unknown}")
+        for image in row["images"]:
+            image["file"] = self._file(image["file"])
+        for document in row["documents"]:
+            document["file"] = self._file(document["file"])
+        return row
+
+    def _sync_product_batch(self, raw_rows, power_source_ids, industry_ids):
+        rows = [self._canonical_product(raw, power_source_ids, industry_ids) for raw in raw_rows]
+        existing = {
+            product.slug: product
+            for product in Product.objects.filter(slug__in=[row["slug"] for row in rows])
+            .select_related("power_source")
+            .prefetch_related("industries", "images", "catalogues")
+        }
+        changed = []
+        for row in rows:
+            product = existing.get(row["slug"])
+            if product and row_hash(product_row(product)) == row_hash(row):
+                self.stats["unchanged"] += 1
+                continue
+            changed.append((row, product))
+        if not changed:
+            return
+
+        to_create, to_update = [], []
+        for row, product in changed:
+            product = product or Product(slug=row["slug"])
+            product.power_source_id = power_source_ids.get(row["power_source"])
+            product.name = row["name"]
+            product.short_summary = row["short_summary"]
+            product.description = row["description"]
+            product.is_visible = row["is_visible"]
+            for field in DECIMAL_FIELDS:
+                setattr(product, field, Decimal(row[field]) if row[field] is not None else None)
+            product.specification = row["specification"]
+            product.features = row["features"]
+            product.refresh_specification_fields()
+            (to_update if product.pk else to_create).append(product)
+
+        with transaction.atomic():
+            self._write(Product, to_create, to_update, PRODUCT_UPDATE_FIELDS)
+            if self.dry_run:
+                return
+            created_slugs = {product.slug for product in to_create}
+            products = {product.slug: product for product in to_create + to_update}
+            current_links = {}
+            for link_id, product_id, industry_id in ProductIndustry.objects.filter(
+                product_id__in=[product.pk for product in to_update]
+            ).values_list("id", "product_id", "industry_id"):
+                current_links.setdefault(product_id, {})[industry_id] = link_id
+            industry_links, new_links, images, documents = [], [], [], []
+            for row, _ in changed:
+                product = products[row["slug"]]
+                is_new = product.slug in created_slugs
+                industry_links.append(self._industry_link_changes(product, row, industry_ids, current_links.get(product.pk, {})))
+                images.append(self._image_changes(product, row, is_new))
+                documents.append(self._document_changes(product, row, is_new))
+                self.touched_product_ids.add(product.pk)
+
+            stale_links = [link_id for stale, _ in industry_links for link_id in stale]
+            ProductIndustry.objects.filter(id__in=stale_links).delete()
+            ProductIndustry.objects.bulk_create([link for _, fresh in industry_links for link in fresh], batch_size=self.batch_size)
+
+            ProductImage.objects.filter(id__in=[image_id for stale, _, _ in images for image_id in stale]).delete()
+            new_images = [image for _, fresh, _ in images for image in fresh]
+            ProductImage.objects.bulk_create(new_images, batch_size=self.batch_size)
+            ProductImage.objects.bulk_update(
+                [image for _, _, reordered in images for image in reordered], ["display_order"], batch_size=self.batch_size
+            )
+            for image in new_images:
+                schedule_image_processing(image, "image", "derivatives")
+
+            ProductCatalogue.objects.filter(id__in=[document_id for stale, _, _ in documents for document_id in stale]).delete()
+            new_documents = [document for _, fresh, _ in documents for document in fresh]
+            ProductCatalogue.objects.bulk_create(new_documents, batch_size=self.batch_size)
+            now = timezone.now()
+            edited_documents = [document for _, _, edited in documents for document in edited]
+            for document in edited_documents:
+                document.updated_at = now
+            ProductCatalogue.objects.bulk_update(edited_documents, DOCUMENT_UPDATE_FIELDS, batch_size=self.batch_size)
+            for document in new_documents + edited_documents:
+                schedule_text_extraction(document)
+
+            changed_ids = [product.pk for product in products.values()]
+            update_search_vectors(Product.objects.filter(pk__in=changed_ids))
+            update_search_vectors(ProductCatalogue.objects.filter(product_id__in=changed_ids))
+
+    def _industry_link_changes(self, product, row, industry_ids, current):
+        """current: {industry_id: link_id} of the product's existing links, loaded once per batch."""
+        wanted = {industry_ids[slug] for slug in row["industries"]}
+        stale = [link_id for industry_id, link_id in current.items() if industry_id not in wanted]
+        fresh = [ProductIndustry(product=product, industry_id=industry_id) for industry_id in sorted(wanted - current.keys())]
+        return stale, fresh
+
+    def _image_changes(self, product, row, is_new):
+        # Images are matched by file name; a replaced file is a new image row.
+        current = {} if is_new else {image.image.name: image for image in product.images.all()}
+        wanted = {image["file"]: image for image in row["images"]}
+        stale = [image.id for name, image in current.items() if name not in wanted]
+        fresh, reordered = [], []
+        for name, image_row in wanted.items():
+            image = current.get(name)
+            if image is None:
+                fresh.append(ProductImage(product=product, image=name, display_order=image_row["display_order"]))
+            elif image.display_order != image_row["display_order"]:
+                image.display_order = image_row["display_order"]
+                reordered.append(image)
+        return stale, fresh, reordered
+
+    def _document_changes(self, product, row, is_new):
+        # Documents are matched by title so ids (and download counts) survive edits.
+        current = {} if is_new else {document.title: document for document in product.catalogues.all()}
+        wanted = {document["title"]: document for document in row["documents"]}
+        stale = [document.id for title, document in current.items() if title not in wanted]
+        fresh, edited = [], []
+        for title, document_row_data in wanted.items():
+            document = current.get(title)
+            if document is not None and document_row(document) == document_row_data:
+                continue
+            document = document or ProductCatalogue(product=product, title=title)
+            for field in ("doc_type", "description", "access_type", "is_visible", "sort_order", "file"):
+                setattr(document, field, document_row_data[field])
+            (edited if document.pk else fresh).append(document)
+        return stale, fresh, edited
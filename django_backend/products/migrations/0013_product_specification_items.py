@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 05:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0012_industry_accent_color_industry_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="specification_items",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
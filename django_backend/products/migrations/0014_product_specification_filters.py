@@ -0,0 +1,32 @@
+# Generated by Django 6.0.2 on 2026-10-19 05:51
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0013_product_specification_items"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="specification_numeric",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="specification_text",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["specification_text"], name="prod_spec_text_gin"),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["specification_numeric"], name="prod_spec_numeric_gin"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 05:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0016_image_dimensions_placeholder"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productcatalogue",
+            name="download_count",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
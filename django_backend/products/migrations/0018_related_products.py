@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-19 06:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0017_productcatalogue_download_count"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RelatedProduct",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("score", models.FloatField()),
+                ("rank", models.PositiveSmallIntegerField()),
+                ("product", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="related_links", to="products.product")),
+                ("related", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="+", to="products.product")),
+            ],
+            options={
+                "db_table": "product_related",
+                "ordering": ("product", "rank"),
+                "constraints": [models.UniqueConstraint(fields=("product", "related"), name="uniq_product_related")],
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 6.0.2 on 2026-10-19 06:04
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import F, OuterRef, Subquery
+
+
+# A frozen copy of the weights in common.search at the time of this migration.
+def backfill_search_vectors(apps, schema_editor):
+    Product = apps.get_model("products", "Product")
+    ProductCatalogue = apps.get_model("products", "ProductCatalogue")
+    config = settings.SEARCH_CONFIG
+
+    Product.objects.update(
+        search_vector=SearchVector(F("name"), weight="A", config=config)
+        + SearchVector(F("short_summary"), weight="B", config=config)
+        + SearchVector(F("description"), weight="C", config=config)
+    )
+    product_name = Subquery(Product.objects.filter(pk=OuterRef("product_id")).values("name")[:1])
+    ProductCatalogue.objects.update(
+        search_vector=SearchVector(F("title"), weight="A", config=config)
+        + SearchVector(product_name, weight="B", config=config)
+        + SearchVector(F("description"), weight="C", config=config)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0018_related_products"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="productcatalogue",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="prod_search_gin"),
+        ),
+        migrations.AddIndex(
+            model_name="productcatalogue",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="doc_search_gin"),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
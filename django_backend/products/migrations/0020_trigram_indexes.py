@@ -0,0 +1,24 @@
+# Generated by Django 6.0.2 on 2026-10-19 06:04
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0019_search_vectors"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["name"], name="prod_name_trgm", opclasses=["gin_trgm_ops"]),
+        ),
+        migrations.AddIndex(
+            model_name="productcatalogue",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["title"], name="doc_title_trgm", opclasses=["gin_trgm_ops"]),
+        ),
+    ]
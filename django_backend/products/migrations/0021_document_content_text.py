@@ -0,0 +1,34 @@
+# Generated by Django 6.0.2 on 2026-10-19 06:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0020_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productcatalogue",
+            name="content_search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="productcatalogue",
+            name="content_sha256",
+            field=models.CharField(blank=True, default="", editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="productcatalogue",
+            name="content_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="productcatalogue",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["content_search_vector"], name="doc_content_gin"),
+        ),
+    ]
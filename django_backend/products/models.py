@@ -1,9 +1,15 @@
+import re
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator, MinLengthValidator, RegexValidator
 from django.db import models
+from django.utils.text import slugify
 
 MAX_PRODUCT_IMAGE_FILE_SIZE_BYTES = 6 * 1024 * 1024  # 6 MB
 MAX_PRODUCT_DOCUMENT_FILE_SIZE_BYTES = 20 * 1024 * 1024  # 20 MB
+SPECIFICATION_NUMBER_RE = re.compile(r"^\s*([-+]?\d+(?:\.\d+)?)")
 
 
 def validate_product_image_file_size(value):
@@ -20,6 +26,80 @@ def validate_product_document_file_size(value):
         raise ValidationError("Product document file size must be 20 MB or less.")
 
 
+def normalize_specification_items(specification_value):
+    items = []
+
+    if isinstance(specification_value, dict):
+        for key, value in specification_value.items():
+            key_text = str(key).strip()
+            if not key_text:
+                continue
+            items.append({"key": key_text, "value": value})
+        return items
+
+    if not isinstance(specification_value, list):
+        return items
+
+    for entry in specification_value:
+        if isinstance(entry, dict):
+            if "key" in entry and "value" in entry:
+                key_text = str(entry.get("key", "")).strip()
+                if key_text:
+                    items.append({"key": key_text, "value": entry.get("value")})
+                continue
+
+            for key, value in entry.items():
+                key_text = str(key).strip()
+                if not key_text:
+                    continue
+                items.append({"key": key_text, "value": value})
+            continue
+
+        if isinstance(entry, (list, tuple)) and len(entry) >= 2:
+            key_text = str(entry[0]).strip()
+            if key_text:
+                items.append({"key": key_text, "value": entry[1]})
+
+    return items
+
+
+def specification_filter_key(key):
+    return slugify(str(key or "")).replace("-", "_")
+
+
+def specification_filter_text(value):
+    return " ".join(str(value).split()).casefold()
+
+
+def specification_filter_number(value):
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        number = value
+    else:
+        match = SPECIFICATION_NUMBER_RE.match(str(value))
+        if not match:
+            return None
+        number = float(match.group(1))
+    return int(number) if float(number).is_integer() else float(number)
+
+
+def build_specification_filters(specification_items):
+    """Flatten specification items into the key/text and key/number maps used for filtering."""
+    text_values = {}
+    numeric_values = {}
+    for item in specification_items:
+        key = specification_filter_key(item.get("key"))
+        value = item.get("value")
+        if not key or value is None or key in text_values:
+            continue
+        text_values[key] = specification_filter_text(value)
+        number = specification_filter_number(value)
+        if number is not None:
+            numeric_values[key] = number
+    return text_values, numeric_values
+
+
 class PowerSource(models.Model):
     name = models.CharField(
         max_length=150,
@@ -40,6 +120,8 @@ class PowerSource(models.Model):
             validate_product_image_file_size,
         ],
     )
+    # Resized WebP/AVIF copies written by common.tasks.process_uploaded_image.
+    image_derivatives = models.JSONField(default=dict, blank=True, editable=False)
     sort_order = models.IntegerField(default=0)
     is_visible = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -79,6 +161,8 @@ class Industry(models.Model):
             )
         ],
     )
+    # Resized WebP/AVIF copies written by common.tasks.process_uploaded_image.
+    image_derivatives = models.JSONField(default=dict, blank=True, editable=False)
     sort_order = models.IntegerField(default=0)
     is_visible = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -92,6 +176,9 @@ class Industry(models.Model):
         return self.name
 
 
+SPECIFICATION_DERIVED_FIELDS = ("specification_items", "specification_text", "specification_numeric")
+
+
 class Product(models.Model):
     power_source = models.ForeignKey(
         PowerSource,
@@ -121,7 +208,14 @@ class Product(models.Model):
     thrust_min_n = models.DecimalField(max_digits=12, decimal_places=3, null=True, blank=True)
     thrust_max_n = models.DecimalField(max_digits=12, decimal_places=3, null=True, blank=True)
     specification = models.JSONField(null=True, blank=True)
+    # Canonical [{"key", "value"}] list derived from `specification` on save.
+    specification_items = models.JSONField(default=list, blank=True, editable=False)
+    # Filter maps keyed by slugified spec key, GIN-indexed for `spec[<key>]` lookups.
+    specification_text = models.JSONField(default=dict, blank=True, editable=False)
+    specification_numeric = models.JSONField(default=dict, blank=True, editable=False)
     features = models.JSONField(null=True, blank=True)
+    # Weighted name/summary/description tsvector, maintained by common.signals.
+    search_vector = SearchVectorField(null=True, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -136,11 +230,26 @@ class Product(models.Model):
             models.Index(fields=["torque_max_nm"], name="prod_torque_max_idx"),
             models.Index(fields=["thrust_min_n"], name="prod_thrust_min_idx"),
             models.Index(fields=["thrust_max_n"], name="prod_thrust_max_idx"),
+            GinIndex(fields=["specification_text"], name="prod_spec_text_gin"),
+            GinIndex(fields=["specification_numeric"], name="prod_spec_numeric_gin"),
+            GinIndex(fields=["search_vector"], name="prod_search_gin"),
+            GinIndex(fields=["name"], name="prod_name_trgm", opclasses=["gin_trgm_ops"]),
         ]
 
     def __str__(self):
         return self.name
 
+    def refresh_specification_fields(self):
+        self.specification_items = normalize_specification_items(self.specification)
+        self.specification_text, self.specification_numeric = build_specification_filters(self.specification_items)
+
+    def save(self, *args, **kwargs):
+        self.refresh_specification_fields()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "specification" in update_fields:
+            kwargs["update_fields"] = {*update_fields, *SPECIFICATION_DERIVED_FIELDS}
+        super().save(*args, **kwargs)
+
 
 class ProductCatalogue(models.Model):
     DOC_CATALOGUE = "CATALOGUE"
@@ -192,12 +301,25 @@ class ProductCatalogue(models.Model):
     access_type = models.CharField(max_length=32, choices=ACCESS_TYPE_CHOICES, default=ACCESS_DIRECT)
     is_visible = models.BooleanField(default=True)
     sort_order = models.IntegerField(default=0)
+    # Server-side count of download-view hits, flushed from the cache by `flush_document_downloads`.
+    download_count = models.PositiveBigIntegerField(default=0, editable=False)
+    # Weighted title/product name/description tsvector, maintained by common.signals.
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Text extracted from the PDF by `extract_document_text`, keyed by the hash of the bytes it came from.
+    content_text = models.TextField(blank=True, default="", editable=False)
+    content_sha256 = models.CharField(max_length=64, blank=True, default="", editable=False)
+    content_search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "product_documents"
         ordering = ["sort_order", "title"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="doc_search_gin"),
+            GinIndex(fields=["content_search_vector"], name="doc_content_gin"),
+            GinIndex(fields=["title"], name="doc_title_trgm", opclasses=["gin_trgm_ops"]),
+        ]
 
     def __str__(self):
         return self.title
@@ -213,6 +335,11 @@ class ProductImage(models.Model):
             validate_product_image_file_size,
         ],
     )
+    # Resized WebP/AVIF copies written by common.tasks.process_uploaded_image.
+    derivatives = models.JSONField(default=dict, blank=True, editable=False)
+    width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    placeholder = models.TextField(blank=True, default="", editable=False)
     display_order = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -230,3 +357,19 @@ class ProductIndustry(models.Model):
         constraints = [
             models.UniqueConstraint(fields=["product", "industry"], name="uniq_product_industry"),
         ]
+
+
+class RelatedProduct(models.Model):
+    """Top co-viewed neighbours of a product, rebuilt periodically by analytics.tasks.rebuild_related_products."""
+
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="related_links")
+    related = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="+")
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+
+    class Meta:
+        db_table = "product_related"
+        ordering = ("product", "rank")
+        constraints = [
+            models.UniqueConstraint(fields=["product", "related"], name="uniq_product_related"),
+        ]
@@ -0,0 +1,116 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+from common.images import schedule_image_processing
+
+from .cache import invalidate_industry_list, invalidate_power_source_list, invalidate_product_details
+from .document_text import schedule_text_extraction
+from .facets import invalidate_facet_index
+from .models import Industry, PowerSource, Product, ProductCatalogue, ProductImage, ProductIndustry, RelatedProduct
+
+FACET_SOURCE_MODELS = (PowerSource, Industry, Product, ProductIndustry)
+PRODUCT_CHILD_MODELS = (ProductImage, ProductCatalogue, ProductIndustry)
+
+
+def _is_post_m2m_action(action):
+    return action is None or action.startswith("post_")
+
+
+def _invalidate_details_on_commit(product_ids):
+    product_ids = [product_id for product_id in product_ids if product_id]
+    if product_ids:
+        transaction.on_commit(lambda: invalidate_product_details(product_ids))
+
+
+def _invalidate_facets(sender, action=None, **kwargs):
+    if not _is_post_m2m_action(action):
+        return
+    # Bump only after commit so no worker rebuilds from pre-commit rows under the new version.
+    transaction.on_commit(invalidate_facet_index)
+
+
+def _product_changed(sender, instance, **kwargs):
+    _invalidate_details_on_commit([instance.pk])
+
+
+def _product_child_changed(sender, instance, **kwargs):
+    _invalidate_details_on_commit([instance.product_id])
+
+
+def _related_product_changed(sender, instance, **kwargs):
+    # Detail payloads embed a summary of each related product, so its referrers go stale too.
+    product_id = instance.pk if sender is Product else instance.product_id
+    _invalidate_details_on_commit(RelatedProduct.objects.filter(related_id=product_id).values_list("product_id", flat=True))
+
+
+def _power_source_changed(sender, instance, **kwargs):
+    _invalidate_details_on_commit(Product.objects.filter(power_source_id=instance.pk).values_list("id", flat=True))
+
+
+def _power_source_list_changed(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_power_source_list)
+
+
+def _industry_list_changed(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_industry_list)
+
+
+def _industry_changed(sender, instance, **kwargs):
+    _invalidate_details_on_commit(ProductIndustry.objects.filter(industry_id=instance.pk).values_list("product_id", flat=True))
+
+
+def _product_industries_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not _is_post_m2m_action(action):
+        return
+    if reverse:
+        _invalidate_details_on_commit(pk_set or [])
+    else:
+        _invalidate_details_on_commit([instance.pk])
+
+
+def _product_image_saved(sender, instance, **kwargs):
+    schedule_image_processing(instance, "image", "derivatives")
+
+
+def _catalogue_image_saved(sender, instance, **kwargs):
+    schedule_image_processing(instance, "image_url", "image_derivatives")
+
+
+def _document_saved(sender, instance, update_fields=None, **kwargs):
+    # The task hashes the file and skips extraction when the bytes are unchanged.
+    if update_fields is None or "file" in update_fields:
+        schedule_text_extraction(instance)
+
+
+for _model in FACET_SOURCE_MODELS:
+    post_save.connect(_invalidate_facets, sender=_model, dispatch_uid=f"products.facets.save.{_model.__name__}")
+    post_delete.connect(_invalidate_facets, sender=_model, dispatch_uid=f"products.facets.delete.{_model.__name__}")
+
+m2m_changed.connect(_invalidate_facets, sender=Product.industries.through, dispatch_uid="products.facets.m2m.industries")
+
+post_save.connect(_product_changed, sender=Product, dispatch_uid="products.detail.save.Product")
+post_delete.connect(_product_changed, sender=Product, dispatch_uid="products.detail.delete.Product")
+for _model in PRODUCT_CHILD_MODELS:
+    post_save.connect(_product_child_changed, sender=_model, dispatch_uid=f"products.detail.save.{_model.__name__}")
+    post_delete.connect(_product_child_changed, sender=_model, dispatch_uid=f"products.detail.delete.{_model.__name__}")
+post_save.connect(_related_product_changed, sender=Product, dispatch_uid="products.related.save.Product")
+# pre_delete: the related rows are cascaded away before post_delete runs.
+pre_delete.connect(_related_product_changed, sender=Product, dispatch_uid="products.related.delete.Product")
+post_save.connect(_related_product_changed, sender=ProductImage, dispatch_uid="products.related.save.ProductImage")
+post_delete.connect(_related_product_changed, sender=ProductImage, dispatch_uid="products.related.delete.ProductImage")
+post_save.connect(_power_source_changed, sender=PowerSource, dispatch_uid="products.detail.save.PowerSource")
+post_save.connect(_industry_changed, sender=Industry, dispatch_uid="products.detail.save.Industry")
+m2m_changed.connect(
+    _product_industries_changed,
+    sender=Product.industries.through,
+    dispatch_uid="products.detail.m2m.industries",
+)
+
+post_save.connect(_product_image_saved, sender=ProductImage, dispatch_uid="products.images.save.ProductImage")
+for _model in (PowerSource, Industry):
+    post_save.connect(_catalogue_image_saved, sender=_model, dispatch_uid=f"products.images.save.{_model.__name__}")
+post_save.connect(_document_saved, sender=ProductCatalogue, dispatch_uid="products.documents.save.ProductCatalogue")
+post_save.connect(_power_source_list_changed, sender=PowerSource, dispatch_uid="products.list.save.PowerSource")
+post_delete.connect(_power_source_list_changed, sender=PowerSource, dispatch_uid="products.list.delete.PowerSource")
+post_save.connect(_industry_list_changed, sender=Industry, dispatch_uid="products.list.save.Industry")
+post_delete.connect(_industry_list_changed, sender=Industry, dispatch_uid="products.list.delete.Industry")
@@ -0,0 +1,40 @@
+from analytics.trending import record_document_downloads
+
+from .cache import flush_document_download_counts
+from .document_text import refresh_document_text
+from .models import ProductCatalogue
+
+MAX_TEXT_EXTRACTION_RETRIES = 2
+
+
+try:
+    from celery import shared_task
+
+    @shared_task
+    def flush_document_downloads():
+        flushed = flush_document_download_counts()
+        record_document_downloads(flushed)
+        return {"status": "flushed", "downloads": sum(flushed.values())}
+
+    @shared_task(bind=True, max_retries=MAX_TEXT_EXTRACTION_RETRIES, default_retry_delay=30)
+    def extract_document_text(self, document_id: int):
+        document = ProductCatalogue.objects.filter(pk=document_id).first()
+        if not document:
+            return {"status": "missing", "id": document_id}
+        try:
+            status = refresh_document_text(document)
+        except ImportError:
+            return {"status": "pypdf_missing", "id": document_id}
+        except Exception as exc:
+            if self.request.retries < MAX_TEXT_EXTRACTION_RETRIES:
+                raise self.retry(exc=exc)
+            raise
+        return {"status": status, "id": document_id}
+
+except Exception:
+    # Celery may not be installed in local setup yet. Keep module importable.
+    def flush_document_downloads(*args, **kwargs):  # type: ignore[no-redef]
+        raise RuntimeError("Celery is not installed/configured. Install celery and run a worker.")
+
+    def extract_document_text(*args, **kwargs):  # type: ignore[no-redef]
+        raise RuntimeError("Celery is not installed/configured. Install celery and run a worker.")
@@ -1,3 +1,174 @@
-from django.test import TestCase
+from decimal import Decimal
+from types import SimpleNamespace
 
-# Create your tests here.
+from django.db.models import Q
+from django.http import QueryDict
+from django.test import SimpleTestCase
+
+from .facets import FacetIndex
+from .views import MAX_SPEC_FILTERS, _build_spec_filter_q
+
+
+def _spec_filter_q(query_string):
+    return _build_spec_filter_q(QueryDict(query_string))
+
+
+def _lookups(q):
+    """Flatten a Q tree into its (lookup, value) leaves."""
+    leaves = []
+    for child in q.children:
+        if isinstance(child, Q):
+            leaves.extend(_lookups(child))
+        else:
+            leaves.append(child)
+    return leaves
+
+
+class BuildSpecFilterQTests(SimpleTestCase):
+    def test_ignores_params_that_are_not_spec_filters(self):
+        self.assertEqual(_spec_filter_q("q=motor&power_source=electric"), Q())
+
+    def test_ignores_blank_keys_and_values(self):
+        self.assertEqual(_spec_filter_q("spec[]=1&spec[voltage]=&spec[---]=x"), Q())
+
+    def test_text_value_is_normalized(self):
+        q = _spec_filter_q("spec[Housing Material]=%20Stainless%20%20Steel")
+        self.assertEqual(_lookups(q), [("specification_text__contains", {"housing_material": "stainless steel"})])
+
+    def test_numeric_value_also_matches_numbers(self):
+        q = _spec_filter_q("spec[voltage]=24")
+        self.assertEqual(
+            _lookups(q),
+            [
+                ("specification_text__contains", {"voltage": "24"}),
+                ("specification_numeric__contains", {"voltage": 24}),
+            ],
+        )
+        self.assertEqual(q.connector, Q.OR)
+
+    def test_repeated_values_are_ored_and_keys_are_anded(self):
+        q = _spec_filter_q("spec[material]=steel&spec[material]=brass&spec[finish]=matte")
+        self.assertEqual(q.connector, Q.AND)
+        self.assertEqual(len(q.children), 2)
+        material_q, finish_q = q.children
+        self.assertEqual(material_q.connector, Q.OR)
+        self.assertEqual(
+            _lookups(material_q),
+            [
+                ("specification_text__contains", {"material": "steel"}),
+                ("specification_text__contains", {"material": "brass"}),
+            ],
+        )
+        self.assertEqual(finish_q, ("specification_text__contains", {"finish": "matte"}))
+
+    def test_range_requires_the_key_and_bounds_the_number(self):
+        q = _spec_filter_q("spec[voltage]=12..48")
+        leaves = _lookups(q)
+        self.assertEqual(leaves[0], ("specification_numeric__has_key", "voltage"))
+        bounds = leaves[1:]
+        self.assertEqual([type(bound).__name__ for bound in bounds], ["GreaterThanOrEqual", "LessThanOrEqual"])
+        self.assertEqual([bound.rhs for bound in bounds], [12, 48])
+
+    def test_reversed_range_is_swapped(self):
+        bounds = _lookups(_spec_filter_q("spec[voltage]=48..12"))[1:]
+        self.assertEqual([bound.rhs for bound in bounds], [12, 48])
+
+    def test_open_ended_ranges(self):
+        lower = _lookups(_spec_filter_q("spec[voltage]=12.."))[1:]
+        upper = _lookups(_spec_filter_q("spec[voltage]=..48"))[1:]
+        self.assertEqual([(type(bound).__name__, bound.rhs) for bound in lower], [("GreaterThanOrEqual", 12)])
+        self.assertEqual([(type(bound).__name__, bound.rhs) for bound in upper], [("LessThanOrEqual", 48)])
+
+    def test_range_without_numeric_bounds_is_ignored(self):
+        self.assertEqual(_spec_filter_q("spec[voltage]=low..high"), Q())
+
+    def test_number_with_trailing_text_only_matches_as_text(self):
+        q = _spec_filter_q("spec[voltage]=24V")
+        self.assertEqual(_lookups(q), [("specification_text__contains", {"voltage": "24v"})])
+
+    def test_number_of_keys_is_capped(self):
+        query_string = "&".join(f"spec[key{index}]=value" for index in range(MAX_SPEC_FILTERS + 5))
+        self.assertEqual(len(_spec_filter_q(query_string).children), MAX_SPEC_FILTERS)
+
+
+def _product(product_id, power_source_id, torque=(None, None), thrust=(None, None)):
+    return {
+        "id": product_id,
+        "power_source_id": power_source_id,
+        "torque_min_nm": torque[0],
+        "torque_max_nm": torque[1],
+        "thrust_min_n": thrust[0],
+        "thrust_max_n": thrust[1],
+    }
+
+
+def _facet_index():
+    power_sources = [
+        SimpleNamespace(id=1, name="Electric", slug="electric", is_visible=True),
+        SimpleNamespace(id=2, name="Pneumatic", slug="pneumatic", is_visible=True),
+        SimpleNamespace(id=3, name="Hydraulic", slug="hydraulic", is_visible=False),
+    ]
+    industries = [
+        SimpleNamespace(id=10, name="Oil & Gas", slug="oil-gas", is_visible=True),
+        SimpleNamespace(id=11, name="Water", slug="water", is_visible=True),
+        SimpleNamespace(id=12, name="Legacy", slug="legacy", is_visible=False),
+    ]
+    products = [
+        _product(100, 1, torque=(Decimal("10"), Decimal("40"))),
+        _product(101, 1, torque=(Decimal("100"), Decimal("600"))),
+        _product(102, 2, thrust=(Decimal("2000"), Decimal("3000"))),
+        _product(103, 3),
+    ]
+    product_industries = [(100, 10), (100, 11), (101, 10), (102, 11), (103, 12), (999, 10)]
+    return FacetIndex(products, power_sources, industries, product_industries)
+
+
+def _facet_counts(items):
+    return {item["slug"]: item["count"] for item in items}
+
+
+class FacetIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = _facet_index()
+
+    def test_mask_for_ids_ignores_unknown_ids(self):
+        mask = self.index.mask_for_ids([101, 103, 555])
+        self.assertEqual(mask, (1 << 1) | (1 << 3))
+        self.assertEqual(self.index.mask_for_ids([]), 0)
+
+    def test_industry_mask_matches_any(self):
+        self.assertEqual(self.index.industry_mask(["oil-gas", "water"]), 0b0111)
+        self.assertEqual(self.index.industry_mask(["unknown"]), 0)
+        self.assertEqual(self.index.industry_mask([]), self.index.all_mask)
+
+    def test_industry_mask_matches_all(self):
+        self.assertEqual(self.index.industry_mask(["oil-gas", "water"], match_all=True), 0b0001)
+        self.assertEqual(self.index.industry_mask(["oil-gas", "unknown"], match_all=True), 0)
+
+    def test_hidden_relations_are_filterable_but_not_listed(self):
+        self.assertEqual(self.index.power_source_mask("hydraulic"), 0b1000)
+        self.assertEqual(self.index.industry_mask(["legacy"]), 0b1000)
+        self.assertNotIn("hydraulic", [item["slug"] for item in self.index.power_sources])
+        self.assertNotIn("legacy", [item["slug"] for item in self.index.industries])
+
+    def test_counts_without_filters(self):
+        counts = self.index.counts()
+        self.assertEqual(counts["total"], 4)
+        self.assertEqual(_facet_counts(counts["power_sources"]), {"electric": 2, "pneumatic": 1})
+        self.assertEqual(_facet_counts(counts["industries"]), {"oil-gas": 2, "water": 2})
+        self.assertEqual([bucket["count"] for bucket in counts["torque_buckets"]], [1, 1, 1, 0, 0])
+        self.assertEqual([bucket["count"] for bucket in counts["thrust_buckets"]], [0, 1, 0, 0, 0])
+
+    def test_each_facet_ignores_its_own_filter(self):
+        counts = self.index.counts(power_source_slug="electric", industry_slugs=["water"])
+        self.assertEqual(counts["total"], 1)
+        # Power sources are counted under the industry filter only, and vice versa.
+        self.assertEqual(_facet_counts(counts["power_sources"]), {"electric": 1, "pneumatic": 1})
+        self.assertEqual(_facet_counts(counts["industries"]), {"oil-gas": 2, "water": 1})
+
+    def test_counts_respect_base_mask_and_ranges(self):
+        counts = self.index.counts(base_mask=self.index.mask_for_ids([100, 101, 102]), torque_min=Decimal("20"))
+        self.assertEqual(counts["total"], 1)
+        self.assertEqual(_facet_counts(counts["power_sources"]), {"electric": 1, "pneumatic": 0})
+        # Range buckets are counted without the range filter itself.
+        self.assertEqual([bucket["count"] for bucket in counts["torque_buckets"]], [1, 1, 1, 0, 0])
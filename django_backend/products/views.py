@@ -1,63 +1,152 @@
+import re
+
 from rest_framework.decorators import api_view
+from rest_framework import status
 from rest_framework.response import Response
-from django.db.models import Q
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Exists, FloatField, OuterRef, Prefetch, Q
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast
+from django.db.models.lookups import GreaterThanOrEqual, LessThanOrEqual
 from decimal import Decimal, InvalidOperation
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.views.decorators.http import require_safe
 
-from .models import Industry, PowerSource, Product, ProductCatalogue
+from common.cache import object_cache_keys
+from common.files import serve_file
+from common.images import build_image_metadata, build_image_sources
 
+from .cache import (
+    PRODUCT_DETAIL_CACHE_NAMESPACE,
+    build_file_url,
+    get_industries_fragment,
+    get_power_sources_fragment,
+    record_document_download,
+)
+from .facets import get_facet_index
+from .models import (
+    Product,
+    ProductCatalogue,
+    ProductIndustry,
+    RelatedProduct,
+    specification_filter_key,
+    specification_filter_number,
+    specification_filter_text,
+)
 
-def _build_file_url(request, file_field):
-    if not file_field:
-        return ""
-    return request.build_absolute_uri(file_field.url)
+SPEC_FILTER_PARAM_RE = re.compile(r"^spec\[(.+)\]$")
+SPEC_NUMBER_FULL_RE = re.compile(r"^[-+]?\d+(?:\.\d+)?$")
+MAX_SPEC_FILTERS = 10
+MAX_BATCH_PRODUCTS = 24
+# ASCII digits only, and short enough to stay inside a bigint primary key.
+BATCH_PRODUCT_ID_RE = re.compile(r"[0-9]{1,18}")
+INDUSTRY_MATCH_ANY = "any"
+INDUSTRY_MATCH_ALL = "all"
 
 
-def _normalize_specification_items(specification_value):
-    items = []
+def _build_image_payloads(request, images):
+    return [
+        {
+            "url": build_file_url(request, image.image),
+            **build_image_metadata(image),
+            "srcset": build_image_sources(request, image.image, image.derivatives),
+        }
+        for image in images
+        if image.image
+    ]
+
+
+def _to_bool(value):
+    return str(value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _industry_exists(industry_slugs):
+    return Exists(ProductIndustry.objects.filter(product_id=OuterRef("pk"), industry__slug__in=industry_slugs))
+
+
+def _parse_spec_number(raw_value):
+    raw_value = raw_value.strip()
+    if not SPEC_NUMBER_FULL_RE.match(raw_value):
+        return None
+    return specification_filter_number(raw_value)
+
+
+def _spec_value_q(key, raw_value):
+    if ".." in raw_value:
+        raw_min, raw_max = raw_value.split("..", 1)
+        range_min = _parse_spec_number(raw_min) if raw_min.strip() else None
+        range_max = _parse_spec_number(raw_max) if raw_max.strip() else None
+        if range_min is None and range_max is None:
+            return None
+        if range_min is not None and range_max is not None and range_min > range_max:
+            range_min, range_max = range_max, range_min
+
+        # `?` narrows candidates through the GIN index; the comparisons recheck the value.
+        value_q = Q(specification_numeric__has_key=key)
+        number_value = Cast(KeyTextTransform(key, "specification_numeric"), FloatField())
+        if range_min is not None:
+            value_q &= Q(GreaterThanOrEqual(number_value, range_min))
+        if range_max is not None:
+            value_q &= Q(LessThanOrEqual(number_value, range_max))
+        return value_q
+
+    value_q = Q(specification_text__contains={key: specification_filter_text(raw_value)})
+    number = _parse_spec_number(raw_value)
+    if number is not None:
+        value_q |= Q(specification_numeric__contains={key: number})
+    return value_q
 
-    if isinstance(specification_value, dict):
-        for key, value in specification_value.items():
-            key_text = str(key).strip()
-            if not key_text:
-                continue
-            items.append({"key": key_text, "value": value})
-        return items
-
-    if not isinstance(specification_value, list):
-        return items
-
-    for entry in specification_value:
-        if isinstance(entry, dict):
-            if "key" in entry and "value" in entry:
-                key_text = str(entry.get("key", "")).strip()
-                if key_text:
-                    items.append({"key": key_text, "value": entry.get("value")})
-                continue
 
-            for key, value in entry.items():
-                key_text = str(key).strip()
-                if not key_text:
-                    continue
-                items.append({"key": key_text, "value": value})
+def _build_spec_filter_q(query_params):
+    """Translate `spec[<key>]=<value>` params into GIN-backed containment lookups.
+
+    Values match exactly (case-insensitive) or as numbers; `min..max`, `min..` and
+    `..max` select numeric ranges. Repeated params for one key are OR-ed, keys are AND-ed.
+    """
+    spec_q = Q()
+    applied = 0
+    for param, raw_values in query_params.lists():
+        match = SPEC_FILTER_PARAM_RE.match(param)
+        if not match:
+            continue
+        key = specification_filter_key(match.group(1))
+        if not key:
             continue
 
-        if isinstance(entry, (list, tuple)) and len(entry) >= 2:
-            key_text = str(entry[0]).strip()
-            if key_text:
-                items.append({"key": key_text, "value": entry[1]})
+        key_q = Q()
+        for raw_value in raw_values:
+            raw_value = raw_value.strip()
+            if not raw_value:
+                continue
+            value_q = _spec_value_q(key, raw_value)
+            if value_q is not None:
+                key_q |= value_q
+        if not key_q:
+            continue
 
-    return items
+        spec_q &= key_q
+        applied += 1
+        if applied >= MAX_SPEC_FILTERS:
+            break
+    return spec_q
 
 
 @api_view(["GET"])
 def get_products(request):
     power_source_slug = request.GET.get("power_source", "").strip()
     industry_slugs = [slug.strip() for slug in request.GET.get("industries", "").split(",") if slug.strip()]
+    industry_match = request.GET.get("industries_match", "").strip().lower()
+    if industry_match != INDUSTRY_MATCH_ALL:
+        industry_match = INDUSTRY_MATCH_ANY
     torque_min_raw = request.GET.get("torque_min", "").strip()
     torque_max_raw = request.GET.get("torque_max", "").strip()
     thrust_min_raw = request.GET.get("thrust_min", "").strip()
     thrust_max_raw = request.GET.get("thrust_max", "").strip()
+    include_facets = _to_bool(request.GET.get("facets"))
+    spec_q = _build_spec_filter_q(request.GET)
 
     torque_min = None
     torque_max = None
@@ -99,8 +188,15 @@ def get_products(request):
     if power_source_slug:
         products_qs = products_qs.filter(power_source__slug=power_source_slug)
 
-    if industry_slugs:
-        products_qs = products_qs.filter(industries__slug__in=industry_slugs)
+    # Correlated EXISTS instead of joining product_industries, so no DISTINCT is needed.
+    if industry_slugs and industry_match == INDUSTRY_MATCH_ALL:
+        for industry_slug in dict.fromkeys(industry_slugs):
+            products_qs = products_qs.filter(_industry_exists([industry_slug]))
+    elif industry_slugs:
+        products_qs = products_qs.filter(_industry_exists(industry_slugs))
+
+    if spec_q:
+        products_qs = products_qs.filter(spec_q)
 
     torque_q = Q()
     thrust_q = Q()
@@ -158,10 +254,10 @@ def get_products(request):
     elif has_thrust_filter:
         products_qs = products_qs.filter(thrust_q)
 
-    products_qs = products_qs.distinct()
     data = []
     for item in products_qs:
-        image_urls = [_build_file_url(request, image.image) for image in item.images.all() if image.image]
+        images = _build_image_payloads(request, item.images.all())
+        image_urls = [image["url"] for image in images]
         data.append(
             {
                 "id": item.id,
@@ -177,69 +273,98 @@ def get_products(request):
                 "description": item.description,
                 "image_url": image_urls[0] if image_urls else "",
                 "image_urls": image_urls,
+                "images": images,
                 "is_visible": item.is_visible,
                 "torque_min_nm": item.torque_min_nm,
                 "torque_max_nm": item.torque_max_nm,
                 "thrust_min_n": item.thrust_min_n,
                 "thrust_max_n": item.thrust_max_n,
                 "specification": item.specification,
-                "specification_items": _normalize_specification_items(item.specification),
+                "specification_items": item.specification_items,
                 "features": item.features,
                 "created_at": item.created_at,
                 "updated_at": item.updated_at,
             }
         )
-    return Response({"count": len(data), "results": data})
+
+    payload = {"count": len(data), "results": data}
+    if include_facets:
+        facet_index = get_facet_index()
+        base_mask = facet_index.all_mask
+        if spec_q:
+            base_mask = facet_index.mask_for_ids(
+                Product.objects.filter(is_visible=True).filter(spec_q).values_list("id", flat=True)
+            )
+        payload["facets"] = facet_index.counts(
+            base_mask=base_mask,
+            power_source_slug=power_source_slug,
+            industry_slugs=industry_slugs,
+            industry_match_all=industry_match == INDUSTRY_MATCH_ALL,
+            torque_min=torque_min,
+            torque_max=torque_max,
+            thrust_min=thrust_min,
+            thrust_max=thrust_max,
+        )
+    return Response(payload)
 
 
 @api_view(["GET"])
 def get_power_sources(request):
-    power_sources_qs = PowerSource.objects.filter(is_visible=True).order_by("sort_order", "name")
-    data = [
-        {
-            "id": item.id,
-            "name": item.name,
-            "slug": item.slug,
-            "summary": item.short_description,
-            "image_url": _build_file_url(request, item.image_url),
-            "sort_order": item.sort_order,
-            "is_visible": item.is_visible,
-            "created_at": item.created_at,
-            "updated_at": item.updated_at,
-        }
-        for item in power_sources_qs
-    ]
-    return Response({"count": len(data), "results": data})
+    return Response(get_power_sources_fragment(request)[1])
 
 
 @api_view(["GET"])
 def get_industries(request):
-    industries_qs = Industry.objects.filter(is_visible=True).order_by("sort_order", "name")
-    data = [
-        {
-            "id": item.id,
-            "name": item.name,
-            "slug": item.slug,
-            "image_url": _build_file_url(request, item.image_url),
-            "accent_color": item.accent_color,
-            "sort_order": item.sort_order,
-            "is_visible": item.is_visible,
-        }
-        for item in industries_qs
-    ]
-    return Response({"count": len(data), "results": data})
+    return Response(get_industries_fragment(request)[1])
 
 
-@api_view(["GET"])
-def get_product_detail(request, slug, product_id):
-    product = get_object_or_404(
-        Product.objects.filter(is_visible=True).select_related("power_source").prefetch_related("industries", "images"),
-        id=product_id,
-        slug=slug,
+def _product_detail_queryset():
+    documents_qs = ProductCatalogue.objects.filter(is_visible=True).defer("content_text").order_by("sort_order", "title")
+    related_qs = (
+        RelatedProduct.objects.filter(related__is_visible=True)
+        .select_related("related")
+        .prefetch_related("related__images")
+        .order_by("rank")
+    )
+    return (
+        Product.objects.filter(is_visible=True)
+        .select_related("power_source")
+        .prefetch_related(
+            "industries",
+            "images",
+            Prefetch("catalogues", queryset=documents_qs, to_attr="visible_documents"),
+            Prefetch("related_links", queryset=related_qs, to_attr="visible_related_links"),
+        )
     )
 
-    image_urls = [_build_file_url(request, image.image) for image in product.images.all() if image.image]
-    documents = ProductCatalogue.objects.filter(product_id=product.id, is_visible=True).order_by("sort_order", "title")
+
+def _build_related_products(request, product):
+    related_data = []
+    for link in product.visible_related_links:
+        related = link.related
+        images = list(related.images.all())
+        related_data.append(
+            {
+                "id": related.id,
+                "name": related.name,
+                "slug": related.slug,
+                "short_summary": related.short_summary,
+                "image_url": build_file_url(request, images[0].image) if images else "",
+            }
+        )
+    return related_data
+
+
+def _build_document_url(request, document):
+    # Email-validated documents are only ever sent as attachments, never linked.
+    if not document.file or document.access_type != ProductCatalogue.ACCESS_DIRECT:
+        return ""
+    return request.build_absolute_uri(reverse("download_document", args=[document.id]))
+
+
+def _build_product_detail_payload(request, product):
+    images = _build_image_payloads(request, product.images.all())
+    image_urls = [image["url"] for image in images]
     documents_data = [
         {
             "id": document.id,
@@ -247,38 +372,107 @@ def get_product_detail(request, slug, product_id):
             "title": document.title,
             "description": document.description,
             "access_type": document.access_type,
-            "file_url": _build_file_url(request, document.file),
+            "file_url": _build_document_url(request, document),
             "sort_order": document.sort_order,
             "created_at": document.created_at,
             "updated_at": document.updated_at,
         }
-        for document in documents
+        for document in product.visible_documents
     ]
 
-    return Response(
-        {
-            "id": product.id,
-            "power_source": {
-                "id": product.power_source_id,
-                "name": product.power_source.name if product.power_source else "",
-                "slug": product.power_source.slug if product.power_source else "",
-            },
-            "industries": [{"id": ind.id, "name": ind.name, "slug": ind.slug} for ind in product.industries.all()],
-            "name": product.name,
-            "slug": product.slug,
-            "short_summary": product.short_summary,
-            "description": product.description,
-            "image_url": image_urls[0] if image_urls else "",
-            "image_urls": image_urls,
-            "torque_min_nm": product.torque_min_nm,
-            "torque_max_nm": product.torque_max_nm,
-            "thrust_min_n": product.thrust_min_n,
-            "thrust_max_n": product.thrust_max_n,
-            "specification": product.specification,
-            "specification_items": _normalize_specification_items(product.specification),
-            "features": product.features,
-            "documents": documents_data,
-            "created_at": product.created_at,
-            "updated_at": product.updated_at,
-        }
+    return {
+        "id": product.id,
+        "power_source": {
+            "id": product.power_source_id,
+            "name": product.power_source.name if product.power_source else "",
+            "slug": product.power_source.slug if product.power_source else "",
+        },
+        "industries": [{"id": ind.id, "name": ind.name, "slug": ind.slug} for ind in product.industries.all()],
+        "name": product.name,
+        "slug": product.slug,
+        "short_summary": product.short_summary,
+        "description": product.description,
+        "image_url": image_urls[0] if image_urls else "",
+        "image_urls": image_urls,
+        "images": images,
+        "torque_min_nm": product.torque_min_nm,
+        "torque_max_nm": product.torque_max_nm,
+        "thrust_min_n": product.thrust_min_n,
+        "thrust_max_n": product.thrust_max_n,
+        "specification": product.specification,
+        "specification_items": product.specification_items,
+        "features": product.features,
+        "documents": documents_data,
+        "related_products": _build_related_products(request, product),
+        "created_at": product.created_at,
+        "updated_at": product.updated_at,
+    }
+
+
+def _get_product_detail_payloads(request, product_ids):
+    """Return {id: detail payload} for visible products, serving per-product cache entries first."""
+    # Absolute file URLs depend on the requesting origin, so it is part of the key.
+    cache_keys = object_cache_keys(PRODUCT_DETAIL_CACHE_NAMESPACE, product_ids, request.build_absolute_uri("/"))
+    cached = cache.get_many(cache_keys.values())
+    payloads = {product_id: cached[key] for product_id, key in cache_keys.items() if key in cached}
+
+    missing_ids = [product_id for product_id in product_ids if product_id not in payloads]
+    if missing_ids:
+        fresh = {}
+        for product in _product_detail_queryset().filter(id__in=missing_ids):
+            payloads[product.id] = _build_product_detail_payload(request, product)
+            fresh[cache_keys[product.id]] = payloads[product.id]
+        if fresh:
+            cache.set_many(fresh, timeout=settings.PRODUCT_DETAIL_CACHE_TIMEOUT)
+    return payloads
+
+
+@api_view(["GET"])
+def get_product_detail(request, slug, product_id):
+    product_id = int(product_id)
+    payload = _get_product_detail_payloads(request, [product_id]).get(product_id)
+    if payload is None or payload["slug"] != slug:
+        raise Http404("No Product matches the given query.")
+    return Response(payload)
+
+
+@api_view(["GET"])
+def get_products_batch(request):
+    product_ids = {}
+    for raw_id in request.query_params.get("ids", "").split(","):
+        raw_id = raw_id.strip()
+        if not raw_id:
+            continue
+        if not BATCH_PRODUCT_ID_RE.fullmatch(raw_id):
+            return Response({"detail": "ids must be a comma-separated list of product ids."}, status=status.HTTP_400_BAD_REQUEST)
+        # dict keeps the caller's order while de-duplicating.
+        product_ids[int(raw_id)] = None
+        if len(product_ids) > MAX_BATCH_PRODUCTS:
+            return Response(
+                {"detail": f"At most {MAX_BATCH_PRODUCTS} ids can be requested at once."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+    product_ids = list(product_ids)
+
+    payloads = _get_product_detail_payloads(request, product_ids) if product_ids else {}
+    # Keep the caller's order; hidden or unknown ids are simply left out.
+    data = [payloads[product_id] for product_id in product_ids if product_id in payloads]
+    return Response({"count": len(data), "results": data})
+
+
+@require_safe
+def download_document(request, document_id):
+    document = get_object_or_404(
+        ProductCatalogue.objects.select_related("product").defer("content_text"),
+        id=document_id,
+        is_visible=True,
+        product__is_visible=True,
+        access_type=ProductCatalogue.ACCESS_DIRECT,
     )
+    if not document.file or not document.file.storage.exists(document.file.name):
+        raise Http404("No Document matches the given query.")
+    # Resumed ranges and HEAD probes belong to a download that was already counted.
+    range_header = request.META.get("HTTP_RANGE", "")
+    if request.method == "GET" and (not range_header or range_header.replace(" ", "").startswith("bytes=0-")):
+        record_document_download(document.id)
+    return serve_file(request, document.file.storage, document.file.name)
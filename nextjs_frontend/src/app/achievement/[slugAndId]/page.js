@@ -1,14 +1,27 @@
 import ContentTemplate from "@/components/content";
+import { achievementDetailPath, fetchTaggedJson } from "@/lib/api";
 
-function extractId(slugAndId) {
-  if (!slugAndId) return "";
+function parseSlugAndId(slugAndId) {
   const value = Array.isArray(slugAndId) ? slugAndId[0] : slugAndId;
-  const parts = String(value).split("-");
-  return parts[parts.length - 1] || "";
+  const parts = String(value || "").split("-");
+  const id = parts.pop() || "";
+  return { slug: parts.join("-"), id };
+}
+
+export async function generateMetadata({ params }) {
+  const routeParams = await params;
+  const { slug, id } = parseSlugAndId(routeParams?.slugAndId);
+  if (!/^\d+$/.test(id)) return {};
+  const item = await fetchTaggedJson(achievementDetailPath(slug, id), [`achievement:${id}`]);
+  if (!item) return {};
+  return {
+    title: `${item.title} | Credence Automation`,
+    description: item.summary || undefined,
+  };
 }
 
 export default async function AchievementDetailPage({ params }) {
   const routeParams = await params;
-  const id = extractId(routeParams?.slugAndId);
-  return <ContentTemplate type="achievement" id={id} />;
+  const { slug, id } = parseSlugAndId(routeParams?.slugAndId);
+  return <ContentTemplate type="achievement" slug={slug} id={id} />;
 }
@@ -0,0 +1,35 @@
+import { revalidateTag } from "next/cache";
+import { NextResponse } from "next/server";
+
+const MAX_TAGS = 256;
+
+// Called by the Django backend after content commits (NEXTJS_REVALIDATE_URL / NEXTJS_REVALIDATE_SECRET).
+// Expires server fetches made through fetchTaggedJson (page metadata for products, power sources, news, achievements).
+export async function POST(request) {
+  const secret = process.env.REVALIDATE_SECRET;
+  const authorization = request.headers.get("authorization") || "";
+  if (!secret || authorization !== `Bearer ${secret}`) {
+    return NextResponse.json({ detail: "Invalid revalidation secret." }, { status: 401 });
+  }
+
+  let body;
+  try {
+    body = await request.json();
+  } catch {
+    return NextResponse.json({ detail: "Body must be JSON." }, { status: 400 });
+  }
+
+  const tags = Array.isArray(body?.tags)
+    ? [...new Set(body.tags.filter((tag) => typeof tag === "string" && tag))].slice(0, MAX_TAGS)
+    : [];
+  if (!tags.length) {
+    return NextResponse.json({ detail: "tags must be a non-empty list." }, { status: 400 });
+  }
+
+  // Webhooks expire the data immediately instead of serving it stale while revalidating.
+  for (const tag of tags) {
+    revalidateTag(tag, { expire: 0 });
+  }
+
+  return NextResponse.json({ revalidated: tags });
+}
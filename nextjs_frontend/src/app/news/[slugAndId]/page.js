@@ -1,14 +1,27 @@
 import ContentTemplate from "@/components/content";
+import { fetchTaggedJson, newsDetailPath } from "@/lib/api";
 
-function extractId(slugAndId) {
-  if (!slugAndId) return "";
+function parseSlugAndId(slugAndId) {
   const value = Array.isArray(slugAndId) ? slugAndId[0] : slugAndId;
-  const parts = String(value).split("-");
-  return parts[parts.length - 1] || "";
+  const parts = String(value || "").split("-");
+  const id = parts.pop() || "";
+  return { slug: parts.join("-"), id };
+}
+
+export async function generateMetadata({ params }) {
+  const routeParams = await params;
+  const { slug, id } = parseSlugAndId(routeParams?.slugAndId);
+  if (!/^\d+$/.test(id)) return {};
+  const item = await fetchTaggedJson(newsDetailPath(slug, id), [`news:${id}`]);
+  if (!item) return {};
+  return {
+    title: `${item.title} | Credence Automation`,
+    description: item.summary || undefined,
+  };
 }
 
 export default async function NewsDetailPage({ params }) {
   const routeParams = await params;
-  const id = extractId(routeParams?.slugAndId);
-  return <ContentTemplate type="news" id={id} />;
+  const { slug, id } = parseSlugAndId(routeParams?.slugAndId);
+  return <ContentTemplate type="news" slug={slug} id={id} />;
 }
@@ -1,4 +1,25 @@
 import ProductDetails from "@/components/ProductDetails";
+import { fetchTaggedJson, productDetailPath } from "@/lib/api";
+
+function parseSlugAndId(slugAndId) {
+  const value = Array.isArray(slugAndId) ? slugAndId[0] : slugAndId;
+  const parts = String(value || "").split("-");
+  const id = parts.pop() || "";
+  return { slug: parts.join("-"), id };
+}
+
+export async function generateMetadata({ params }) {
+  const routeParams = await params;
+  const { slug, id } = parseSlugAndId(routeParams?.slugAndId);
+  if (!/^\d+$/.test(id)) return {};
+  // Power source names are part of the payload, so catalogue changes expire it too.
+  const product = await fetchTaggedJson(productDetailPath(slug, id), ["catalogue", `product:${id}`]);
+  if (!product) return {};
+  return {
+    title: `${product.name} | Credence Automation`,
+    description: product.short_summary || undefined,
+  };
+}
 
 export default async function ProductDetailPage({ params }) {
   const routeParams = await params;
@@ -1,4 +1,18 @@
 import ProductsPage from "@/components/Products";
+import { API_ENDPOINTS, fetchTaggedJson } from "@/lib/api";
+
+export async function generateMetadata({ params }) {
+  const routeParams = await params;
+  const data = await fetchTaggedJson(API_ENDPOINTS.powerSources, ["catalogue"]);
+  const powerSource = (Array.isArray(data?.results) ? data.results : []).find(
+    (item) => item.slug === routeParams?.powerSourceSlug,
+  );
+  if (!powerSource) return {};
+  return {
+    title: `${powerSource.name} Products | Credence Automation`,
+    description: powerSource.summary || undefined,
+  };
+}
 
 export default async function ProductsByPowerSourcePage({ params }) {
   const routeParams = await params;
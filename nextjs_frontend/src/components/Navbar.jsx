@@ -5,7 +5,7 @@ import Image from "next/image";
 import Link from "next/link";
 import { usePathname } from "next/navigation";
 import { trackEvent } from "@/lib/analytics";
-import { API_ENDPOINTS, apiUrl } from "@/lib/api";
+import { API_ENDPOINTS, apiUrl, fetchHomeBootstrap } from "@/lib/api";
 
 const navItems = [
   { label: "Products", href: "/products" },
@@ -77,10 +77,8 @@ function Navbar() {
 
     const loadAnnouncement = async () => {
       try {
-        const response = await fetch(apiUrl(API_ENDPOINTS.contentAnnouncementRibbon), {
-          method: "GET",
-        });
-        const payload = await response.json();
+        // The ribbon ships in the homepage bootstrap payload; on the homepage this shares its request.
+        const payload = (await fetchHomeBootstrap())?.announcement;
         if (!isMounted) return;
         const rows = Array.isArray(payload?.results)
           ? payload.results
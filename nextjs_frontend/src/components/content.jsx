@@ -1,7 +1,7 @@
 "use client";
 
 import { useEffect, useMemo, useState } from "react";
-import { API_ENDPOINTS, apiUrl } from "@/lib/api";
+import { API_ENDPOINTS, achievementDetailPath, apiUrl, newsDetailPath } from "@/lib/api";
 import Link from "next/link";
 import Image from "next/image";
 
@@ -28,6 +28,7 @@ function normalizeImageList(raw, selectedType) {
   return fallbackSingle ? [fallbackSingle] : [];
 }
 
+// Legacy /content?type=&id= links carry no slug, so the item is looked up in the full list.
 async function fetchItemById(endpointPath, targetId, signal) {
   const expectedId = String(targetId);
   let nextUrl = apiUrl(endpointPath);
@@ -51,28 +52,25 @@ async function fetchItemById(endpointPath, targetId, signal) {
   return null;
 }
 
-async function fetchAllItems(endpointPath, signal) {
-  let nextUrl = apiUrl(endpointPath);
-  let pageGuard = 0;
-  const all = [];
-
-  while (nextUrl && pageGuard < 30) {
-    const res = await fetch(nextUrl, { signal });
-    if (!res.ok) {
-      throw new Error("Failed to fetch related content.");
-    }
-
-    const data = await res.json();
-    const records = Array.isArray(data?.results) ? data.results : Array.isArray(data) ? data : [];
-    all.push(...records);
-    nextUrl = data?.next || null;
-    pageGuard += 1;
+async function fetchItem(detailPath, signal) {
+  const res = await fetch(apiUrl(detailPath), { signal });
+  if (res.status === 404) return null;
+  if (!res.ok) {
+    throw new Error("Failed to fetch content.");
   }
+  return res.json();
+}
 
-  return all;
+async function fetchRecentItems(endpointPath, count, signal) {
+  const res = await fetch(apiUrl(`${endpointPath}?page_size=${count}`), { signal });
+  if (!res.ok) {
+    throw new Error("Failed to fetch related content.");
+  }
+  const data = await res.json();
+  return Array.isArray(data?.results) ? data.results : [];
 }
 
-export default function ContentTemplate({ type = "news", id = "1" }) {
+export default function ContentTemplate({ type = "news", slug = "", id = "1" }) {
   const selectedType = useMemo(() => normalizeType(type), [type]);
 
   const [item, setItem] = useState(null);
@@ -93,14 +91,19 @@ export default function ContentTemplate({ type = "news", id = "1" }) {
       setMoreItems([]);
 
       try {
-        const endpoint =
+        const listEndpoint =
+          selectedType === "achievement" ? API_ENDPOINTS.contentAchievements : API_ENDPOINTS.contentNews;
+        const detailPath =
+          selectedType === "achievement" ? achievementDetailPath(slug, id) : newsDetailPath(slug, id);
+        const summariesEndpoint =
           selectedType === "achievement"
-            ? API_ENDPOINTS.contentAchievements
-            : API_ENDPOINTS.contentNews;
+            ? API_ENDPOINTS.contentAchievementSummaries
+            : API_ENDPOINTS.contentNewsSummaries;
 
-        const [raw, allItems] = await Promise.all([
-          fetchItemById(endpoint, id, controller.signal),
-          fetchAllItems(endpoint, controller.signal),
+        // One extra so the list still has six entries after dropping the current item.
+        const [raw, recentItems] = await Promise.all([
+          slug ? fetchItem(detailPath, controller.signal) : fetchItemById(listEndpoint, id, controller.signal),
+          fetchRecentItems(summariesEndpoint, 7, controller.signal),
         ]);
         if (!mounted) return;
 
@@ -122,10 +125,11 @@ export default function ContentTemplate({ type = "news", id = "1" }) {
         setItem(mapped);
         setCurrentImageIndex(0);
 
-        const mappedMore = allItems
-          .filter((record) => Boolean(record.is_visible) && String(record.id) !== String(id))
+        const mappedMore = recentItems
+          .filter((record) => String(record.id) !== String(id))
           .map((record) => ({
             id: record.id,
+            slug: record.slug || "",
             model: selectedType,
             category: selectedType === "achievement" ? "Achievement" : "News",
             title: record.title || "",
@@ -149,7 +153,7 @@ export default function ContentTemplate({ type = "news", id = "1" }) {
       mounted = false;
       controller.abort();
     };
-  }, [id, selectedType]);
+  }, [id, slug, selectedType]);
 
   useEffect(() => {
     const imagesCount = item?.image_urls?.length || 0;
@@ -321,7 +325,11 @@ export default function ContentTemplate({ type = "news", id = "1" }) {
                           {entry.summary}
                         </p>
                         <Link
-                          href={`/content?type=${encodeURIComponent(entry.model)}&id=${encodeURIComponent(entry.id)}`}
+                          href={
+                            entry.slug
+                              ? `/${entry.model}/${encodeURIComponent(entry.slug)}-${encodeURIComponent(entry.id)}`
+                              : `/content?type=${encodeURIComponent(entry.model)}&id=${encodeURIComponent(entry.id)}`
+                          }
                           className="mt-3 inline-block text-sm font-medium text-brand-700 transition hover:text-brand-900"
                         >
                           Read More -{">"}
@@ -1,7 +1,7 @@
 "use client";
 
 import { useEffect, useMemo, useState } from "react";
-import { API_ENDPOINTS, apiUrl } from "@/lib/api";
+import { fetchHomeBootstrap } from "@/lib/api";
 import { trackEvent } from "@/lib/analytics";
 import Link from "next/link";
 import Image from "next/image";
@@ -50,44 +50,30 @@ export default function LandingPage() {
 
   useEffect(() => {
     let isMounted = true;
-    const controller = new AbortController();
 
-    async function fetchContentUpdates() {
+    // One request for every homepage section, shared with the navbar's announcement ribbon.
+    async function loadHomeBootstrap() {
       setUpdatesLoading(true);
       setUpdatesError("");
+      setPowerSourcesError("");
+      setIndustriesError("");
 
       try {
-        const [newsRes, achievementsRes] = await Promise.all([
-          fetch(apiUrl(API_ENDPOINTS.contentNews), {
-            signal: controller.signal,
-          }),
-          fetch(apiUrl(API_ENDPOINTS.contentAchievements), {
-            signal: controller.signal,
-          }),
-        ]);
+        const json = await fetchHomeBootstrap();
 
-        if (!newsRes.ok || !achievementsRes.ok) {
-          throw new Error("Failed to fetch content updates.");
-        }
-
-        const [newsJson, achievementsJson] = await Promise.all([
-          newsRes.json(),
-          achievementsRes.json(),
-        ]);
-
-        const mappedNews = (newsJson.results || []).map((item) => ({
+        const mappedNews = (json.news?.results || []).map((item) => ({
           id: item.id,
           model: "news",
           category: "News",
           title: item.title || "",
           slug: item.slug,
           summary: item.summary || "",
-          is_visible: Boolean(item.is_visible),
+          is_visible: true,
           created_at: item.created_at,
           link_url: "#",
         }));
 
-        const mappedAchievements = (achievementsJson.results || []).map(
+        const mappedAchievements = (json.achievements?.results || []).map(
           (item) => ({
             id: item.id,
             model: "achievement",
@@ -95,7 +81,7 @@ export default function LandingPage() {
             title: item.title || "",
             slug: item.slug,
             summary: item.summary || "",
-            is_visible: Boolean(item.is_visible),
+            is_visible: true,
             created_at: item.created_at,
             link_url: "#",
           }),
@@ -108,11 +94,21 @@ export default function LandingPage() {
 
         if (isMounted) {
           setUpdates(merged);
+          setPowerSources(json.power_sources?.results || []);
+          setIndustries(
+            (json.industries?.results || []).filter(
+              (item) => item.is_visible !== false,
+            ),
+          );
         }
       } catch (error) {
-        if (error.name !== "AbortError" && isMounted) {
+        if (isMounted) {
           setUpdatesError("Unable to load news and achievements right now.");
+          setPowerSourcesError("Unable to load product portfolio right now.");
+          setIndustriesError("Unable to load industries right now.");
           setUpdates([]);
+          setPowerSources([]);
+          setIndustries([]);
         }
       } finally {
         if (isMounted) {
@@ -121,79 +117,10 @@ export default function LandingPage() {
       }
     }
 
-    fetchContentUpdates();
-
-    return () => {
-      isMounted = false;
-      controller.abort();
-    };
-  }, []);
-
-  useEffect(() => {
-    let isMounted = true;
-    const controller = new AbortController();
-
-    async function fetchPowerSources() {
-      setPowerSourcesError("");
-      try {
-        const response = await fetch(apiUrl(API_ENDPOINTS.powerSources), {
-          signal: controller.signal,
-        });
-        if (!response.ok) {
-          throw new Error("Failed to fetch power sources.");
-        }
-        const json = await response.json();
-        if (isMounted) {
-          setPowerSources(json.results || []);
-        }
-      } catch (error) {
-        if (error.name !== "AbortError" && isMounted) {
-          setPowerSourcesError("Unable to load product portfolio right now.");
-          setPowerSources([]);
-        }
-      }
-    }
-
-    fetchPowerSources();
-
-    return () => {
-      isMounted = false;
-      controller.abort();
-    };
-  }, []);
-
-  useEffect(() => {
-    let isMounted = true;
-    const controller = new AbortController();
-
-    async function fetchIndustries() {
-      setIndustriesError("");
-      try {
-        const response = await fetch(apiUrl(API_ENDPOINTS.industries), {
-          signal: controller.signal,
-        });
-        if (!response.ok) {
-          throw new Error("Failed to fetch industries.");
-        }
-        const json = await response.json();
-        if (isMounted) {
-          setIndustries(
-            (json.results || []).filter((item) => item.is_visible !== false),
-          );
-        }
-      } catch (error) {
-        if (error.name !== "AbortError" && isMounted) {
-          setIndustriesError("Unable to load industries right now.");
-          setIndustries([]);
-        }
-      }
-    }
-
-    fetchIndustries();
+    loadHomeBootstrap();
 
     return () => {
       isMounted = false;
-      controller.abort();
     };
   }, []);
 
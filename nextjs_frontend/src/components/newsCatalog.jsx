@@ -1,6 +1,6 @@
 "use client";
 
-import { useEffect, useMemo, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 import Link from "next/link";
 import Image from "next/image";
 import { API_ENDPOINTS, apiUrl } from "@/lib/api";
@@ -11,92 +11,97 @@ function withMediaBase(url) {
   return url.startsWith("/") ? apiUrl(url) : apiUrl(`/${url}`);
 }
 
-function normalizeImageList(raw) {
-  const imageUrls = Array.isArray(raw?.image_urls)
-    ? raw.image_urls.map(withMediaBase).filter(Boolean)
-    : [];
+const PAGE_SIZE = 12;
 
-  if (imageUrls.length > 0) return imageUrls;
+const STREAMS = {
+  news: { category: "News", endpoint: API_ENDPOINTS.contentNewsSummaries },
+  achievement: { category: "Achievement", endpoint: API_ENDPOINTS.contentAchievementSummaries },
+};
 
-  const cover = withMediaBase(raw?.cover_image_url);
-  return cover ? [cover] : [];
+function emptyStreams() {
+  return {
+    news: { items: [], page: 0, hasMore: false, count: 0 },
+    achievement: { items: [], page: 0, hasMore: false, count: 0 },
+  };
+}
+
+function itemTime(item) {
+  return new Date(item.createdAt).getTime();
+}
+
+async function fetchSummaryPage(model, page, sortBy, signal) {
+  const params = new URLSearchParams({ page: String(page), page_size: String(PAGE_SIZE) });
+  if (sortBy === "oldest") params.set("order", "oldest");
+  const response = await fetch(apiUrl(`${STREAMS[model].endpoint}?${params}`), { signal });
+  if (!response.ok) {
+    throw new Error("Failed to fetch catalogue.");
+  }
+  const data = await response.json();
+  const rows = Array.isArray(data?.results) ? data.results : [];
+  return {
+    items: rows.map((item) => ({
+      id: item.id,
+      slug: item.slug || "",
+      model,
+      category: STREAMS[model].category,
+      title: item.title || "",
+      summary: item.summary || "",
+      createdAt: item.created_at,
+      imageUrls: item?.image?.url ? [withMediaBase(item.image.url)] : [],
+    })),
+    hasMore: Boolean(data?.next),
+    count: Number(data?.count) || 0,
+  };
+}
+
+// Each stream is paged in date order, so merged items are only final up to the
+// least advanced stream that still has pages; anything past it could still be
+// preceded by an unloaded item from the other stream.
+function mergeFrontier(streams, models, sortBy) {
+  const frontiers = models
+    .filter((model) => streams[model].hasMore && streams[model].items.length > 0)
+    .map((model) => itemTime(streams[model].items[streams[model].items.length - 1]));
+  if (!frontiers.length) return null;
+  return sortBy === "oldest" ? Math.min(...frontiers) : Math.max(...frontiers);
 }
 
 export default function NewsCatalog() {
-  const [catalogItems, setCatalogItems] = useState([]);
+  const [streams, setStreams] = useState(emptyStreams);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState("");
+  const [loadMoreError, setLoadMoreError] = useState("");
   const [activeType, setActiveType] = useState("all");
   const [searchQuery, setSearchQuery] = useState("");
   const [sortBy, setSortBy] = useState("latest");
+  const controllerRef = useRef(null);
 
   useEffect(() => {
     let mounted = true;
     const controller = new AbortController();
+    controllerRef.current = controller;
 
     async function loadCatalogue() {
       setLoading(true);
       setError("");
+      setLoadMoreError("");
+      setLoadingMore(false);
+      setStreams(emptyStreams());
 
       try {
-        const [newsResponse, achievementsResponse] = await Promise.all([
-          fetch(apiUrl(API_ENDPOINTS.contentNews), { signal: controller.signal }),
-          fetch(apiUrl(API_ENDPOINTS.contentAchievements), { signal: controller.signal }),
-        ]);
-
-        if (!newsResponse.ok || !achievementsResponse.ok) {
-          throw new Error("Failed to fetch catalogue.");
-        }
-
-        const [newsData, achievementsData] = await Promise.all([
-          newsResponse.json(),
-          achievementsResponse.json(),
+        const [newsPage, achievementPage] = await Promise.all([
+          fetchSummaryPage("news", 1, sortBy, controller.signal),
+          fetchSummaryPage("achievement", 1, sortBy, controller.signal),
         ]);
-
-        const newsRows = Array.isArray(newsData?.results) ? newsData.results : [];
-        const achievementRows = Array.isArray(achievementsData?.results)
-          ? achievementsData.results
-          : [];
-
         if (!mounted) return;
 
-        const mappedNews = newsRows
-          .filter((item) => Boolean(item.is_visible))
-          .map((item) => ({
-            id: item.id,
-            model: "news",
-            category: "News",
-            title: item.title || "",
-            summary: item.summary || "",
-            createdAt: item.created_at,
-            imageUrls: normalizeImageList(item),
-          }));
-
-        const mappedAchievements = achievementRows
-          .filter((item) => Boolean(item.is_visible))
-          .map((item) => ({
-            id: item.id,
-            model: "achievement",
-            category: "Achievement",
-            title: item.title || "",
-            summary: item.summary || "",
-            createdAt: item.created_at,
-            imageUrls: Array.isArray(item?.image_urls)
-              ? item.image_urls.map(withMediaBase).filter(Boolean)
-              : item?.image_url
-                ? [withMediaBase(item.image_url)]
-                : [],
-          }));
-
-        const merged = [...mappedNews, ...mappedAchievements].sort(
-          (a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime(),
-        );
-
-        setCatalogItems(merged);
+        setStreams({
+          news: { ...newsPage, page: 1 },
+          achievement: { ...achievementPage, page: 1 },
+        });
       } catch (err) {
         if (err.name !== "AbortError" && mounted) {
           setError("Unable to load catalogue right now.");
-          setCatalogItems([]);
         }
       } finally {
         if (mounted) setLoading(false);
@@ -109,43 +114,82 @@ export default function NewsCatalog() {
       mounted = false;
       controller.abort();
     };
-  }, []);
+  }, [sortBy]);
 
-  const hasItems = useMemo(() => catalogItems.length > 0, [catalogItems.length]);
-  const filteredItems = useMemo(() => {
-    const query = searchQuery.trim().toLowerCase();
-    let items = [...catalogItems];
-
-    if (activeType !== "all") {
-      items = items.filter((item) => item.model === activeType);
-    }
+  const activeModels = useMemo(
+    () => (activeType === "all" ? Object.keys(STREAMS) : [activeType]),
+    [activeType],
+  );
 
-    if (query) {
-      items = items.filter((item) => {
-        const title = (item.title || "").toLowerCase();
-        const summary = (item.summary || "").toLowerCase();
-        const category = (item.category || "").toLowerCase();
-        return title.includes(query) || summary.includes(query) || category.includes(query);
+  const displayItems = useMemo(() => {
+    const frontier = activeModels.length > 1 ? mergeFrontier(streams, activeModels, sortBy) : null;
+    const items = activeModels.flatMap((model) => streams[model].items);
+    const direction = sortBy === "oldest" ? 1 : -1;
+    items.sort((a, b) => direction * (itemTime(a) - itemTime(b)));
+    if (frontier === null) return items;
+    return items.filter((item) => direction * (itemTime(item) - frontier) <= 0);
+  }, [streams, activeModels, sortBy]);
+
+  const hasMore = activeModels.some((model) => streams[model].hasMore);
+
+  async function loadMore() {
+    const controller = controllerRef.current;
+    const frontier = activeModels.length > 1 ? mergeFrontier(streams, activeModels, sortBy) : null;
+    // Only the streams holding back the merged list need another page.
+    const models = activeModels.filter((model) => {
+      const stream = streams[model];
+      if (!stream.hasMore) return false;
+      if (frontier === null || !stream.items.length) return true;
+      return itemTime(stream.items[stream.items.length - 1]) === frontier;
+    });
+    if (!models.length || !controller) return;
+
+    setLoadingMore(true);
+    setLoadMoreError("");
+    try {
+      const pages = await Promise.all(
+        models.map((model) => fetchSummaryPage(model, streams[model].page + 1, sortBy, controller.signal)),
+      );
+      if (controller.signal.aborted) return;
+      setStreams((previous) => {
+        const next = { ...previous };
+        models.forEach((model, index) => {
+          const seen = new Set(previous[model].items.map((item) => item.id));
+          next[model] = {
+            items: [...previous[model].items, ...pages[index].items.filter((item) => !seen.has(item.id))],
+            page: previous[model].page + 1,
+            hasMore: pages[index].hasMore,
+            count: pages[index].count,
+          };
+        });
+        return next;
       });
+    } catch (err) {
+      if (err.name !== "AbortError" && !controller.signal.aborted) {
+        setLoadMoreError("Unable to load more updates right now.");
+      }
+    } finally {
+      if (!controller.signal.aborted) setLoadingMore(false);
     }
+  }
 
-    if (sortBy === "oldest") {
-      items.sort((a, b) => new Date(a.createdAt).getTime() - new Date(b.createdAt).getTime());
-    } else {
-      items.sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime());
-    }
-
-    return items;
-  }, [catalogItems, activeType, searchQuery, sortBy]);
-
-  const categoryCounts = useMemo(() => {
-    const counts = { all: catalogItems.length, news: 0, achievement: 0 };
-    catalogItems.forEach((item) => {
-      if (item.model === "news") counts.news += 1;
-      if (item.model === "achievement") counts.achievement += 1;
+  const hasItems = streams.news.count + streams.achievement.count > 0;
+  const filteredItems = useMemo(() => {
+    const query = searchQuery.trim().toLowerCase();
+    if (!query) return displayItems;
+    return displayItems.filter((item) => {
+      const title = (item.title || "").toLowerCase();
+      const summary = (item.summary || "").toLowerCase();
+      const category = (item.category || "").toLowerCase();
+      return title.includes(query) || summary.includes(query) || category.includes(query);
     });
-    return counts;
-  }, [catalogItems]);
+  }, [displayItems, searchQuery]);
+
+  const categoryCounts = {
+    all: streams.news.count + streams.achievement.count,
+    news: streams.news.count,
+    achievement: streams.achievement.count,
+  };
 
   return (
     <>
@@ -326,7 +370,11 @@ export default function NewsCatalog() {
 
                       <div className="mt-auto flex items-center justify-between gap-3 border-t border-steel-100 pt-4">
                         <Link
-                          href={`/content?type=${encodeURIComponent(item.model)}&id=${encodeURIComponent(item.id)}`}
+                          href={
+                            item.slug
+                              ? `/${item.model}/${encodeURIComponent(item.slug)}-${encodeURIComponent(item.id)}`
+                              : `/content?type=${encodeURIComponent(item.model)}&id=${encodeURIComponent(item.id)}`
+                          }
                           className="inline-flex items-center gap-1.5 text-sm font-semibold text-brand-700 transition hover:text-brand-900"
                         >
                           <span>Read More</span>
@@ -362,6 +410,20 @@ export default function NewsCatalog() {
               })}
             </div>
           ) : null}
+
+          {!loading && !error && hasMore ? (
+            <div className="mt-6 flex flex-col items-center gap-2">
+              <button
+                type="button"
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="inline-flex h-10 items-center rounded-md border border-steel-300 bg-white px-5 text-xs font-semibold uppercase tracking-[0.12em] text-steel-700 transition hover:border-steel-400 hover:bg-steel-50 disabled:cursor-wait disabled:opacity-60"
+              >
+                {loadingMore ? "Loading..." : "Load More"}
+              </button>
+              {loadMoreError ? <p className="text-xs font-medium text-red-700">{loadMoreError}</p> : null}
+            </div>
+          ) : null}
         </section>
       </main>
     </>
@@ -26,9 +26,12 @@ export const API_ENDPOINTS = {
   authPasswordForgot: "/api/auth/password/forgot",
   authPasswordReset: "/api/auth/password/reset",
   search: "/api/search",
-  contentAnnouncementRibbon: "/api/content/announcement-ribbon",
+  searchSuggest: "/api/search/suggest",
+  bootstrapHome: "/api/bootstrap/home",
   contentNews: "/api/content/news",
+  contentNewsSummaries: "/api/content/news/summaries",
   contentAchievements: "/api/content/achievements",
+  contentAchievementSummaries: "/api/content/achievements/summaries",
   powerSources: "/api/power-sources",
   industries: "/api/industries",
   products: "/api/products",
@@ -45,3 +48,45 @@ export function productDetailPath(slug, id) {
   const safeSlug = encodeURIComponent(slug || "product");
   return `/api/products/${safeSlug}-${encodeURIComponent(id)}`;
 }
+
+export function newsDetailPath(slug, id) {
+  const safeSlug = encodeURIComponent(slug || "news");
+  return `${API_ENDPOINTS.contentNews}/${safeSlug}-${encodeURIComponent(id)}`;
+}
+
+export function achievementDetailPath(slug, id) {
+  const safeSlug = encodeURIComponent(slug || "achievement");
+  return `${API_ENDPOINTS.contentAchievements}/${safeSlug}-${encodeURIComponent(id)}`;
+}
+
+// Server-side fetch kept in the Next.js data cache until the backend's revalidation webhook
+// (app/api/revalidate) expires one of its tags; see common/revalidation.py for the tag names.
+export async function fetchTaggedJson(path, tags) {
+  try {
+    const response = await fetch(apiUrl(path), { cache: "force-cache", next: { tags } });
+    if (!response.ok) return null;
+    return await response.json();
+  } catch {
+    return null;
+  }
+}
+
+let homeBootstrapRequest = null;
+
+// The homepage and the navbar's announcement ribbon both read /api/bootstrap/home; callers that mount
+// together share one in-flight request, and later mounts refetch (the browser revalidates by ETag).
+export function fetchHomeBootstrap() {
+  if (!homeBootstrapRequest) {
+    homeBootstrapRequest = fetch(apiUrl(API_ENDPOINTS.bootstrapHome))
+      .then((response) => {
+        if (!response.ok) {
+          throw new Error("Failed to fetch homepage content.");
+        }
+        return response.json();
+      })
+      .finally(() => {
+        homeBootstrapRequest = null;
+      });
+  }
+  return homeBootstrapRequest;
+}